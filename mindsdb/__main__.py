@@ -101,17 +101,12 @@ if __name__ == '__main__':
 
     # @TODO Backwards compatibility for tests, remove later
     model_controller = WithKWArgsWrapper(ModelController(), company_id=COMPANY_ID)
+    # handlers are imported on first use, not installed dependencies are reported at that moment
     integration_controller = WithKWArgsWrapper(IntegrationController(), company_id=COMPANY_ID)
-    for handler_name, handler_meta in integration_controller.get_handlers_import_status().items():
-        import_meta = handler_meta.get('import', {})
-        dependencies = import_meta.get('dependencies')
-        if import_meta.get('success', False) is not True:
-            print(f"Dependencies for the handler '{handler_name}' are not installed by default.\n",
-                  f'If you want to use "{handler_name}" please install "{dependencies}"')
 
     if not is_cloud:
         # region creating permanent integrations
-        for integration_name, handler in integration_controller.get_handlers_import_status().items():
+        for integration_name, handler in integration_controller.get_handlers_static_meta().items():
             if handler.get('permanent'):
                 integration_meta = integration_controller.get(name=integration_name)
                 if integration_meta is None:
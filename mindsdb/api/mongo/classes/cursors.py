@@ -0,0 +1,136 @@
+import time
+import random
+import threading
+from itertools import islice
+
+from bson.int64 import Int64
+
+
+# size of first batch if it is not defined in request. The same as in mongodb
+DEFAULT_FIRST_BATCH_SIZE = 101
+# size of next batches if it is not defined in request
+DEFAULT_BATCH_SIZE = 10000
+
+
+class Cursor:
+    """ Server-side cursor: keeps iterator over documents of the result between requests
+    """
+    def __init__(self, cursor_id, ns, documents, company_id=None):
+        self.id = cursor_id
+        self.ns = ns
+        self.company_id = company_id
+        self.last_used = time.time()
+        self._documents = iter(documents)
+        self._pending = []
+
+    def next_batch(self, batch_size):
+        self.last_used = time.time()
+        batch = self._pending + list(islice(self._documents, batch_size - len(self._pending)))
+        # read one document ahead to know if cursor is exhausted
+        self._pending = list(islice(self._documents, 1))
+        return batch
+
+    @property
+    def is_exhausted(self):
+        return len(self._pending) == 0
+
+
+class CursorsRegistry:
+    """ Cursors opened by 'find' and continued by 'getMore'.
+
+        Registry is shared between connections because drivers can send 'getMore' through
+        any connection from their pool. Cursors which are not used longer than 'timeout'
+        seconds are removed.
+    """
+    def __init__(self, timeout=600):
+        self.timeout = timeout
+        self._cursors = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._cursors)
+
+    def _cleanup(self):
+        now = time.time()
+        for cursor_id in list(self._cursors.keys()):
+            if now - self._cursors[cursor_id].last_used > self.timeout:
+                del self._cursors[cursor_id]
+
+    def open(self, ns, documents, company_id=None, batch_size=None, single_batch=False):
+        """ get first batch of documents and keep the rest in new cursor
+
+            Args:
+                ns (str): namespace of the cursor
+                documents (Iterable[dict]): result of the query
+                company_id (int)
+                batch_size (int): size of the first batch
+                single_batch (bool): close cursor after first batch
+            Returns:
+                dict: 'cursor' document of the response
+        """
+        if batch_size is None or batch_size <= 0:
+            batch_size = DEFAULT_FIRST_BATCH_SIZE
+        cursor = Cursor(0, ns, documents, company_id)
+        batch = cursor.next_batch(batch_size)
+
+        if not cursor.is_exhausted and not single_batch:
+            with self._lock:
+                self._cleanup()
+                cursor.id = random.randint(1, 2 ** 62)
+                while cursor.id in self._cursors:
+                    cursor.id = random.randint(1, 2 ** 62)
+                self._cursors[cursor.id] = cursor
+
+        return {
+            'id': Int64(cursor.id),
+            'ns': ns,
+            'firstBatch': batch
+        }
+
+    def get_more(self, cursor_id, company_id=None, batch_size=None):
+        """ get next batch of documents from cursor
+
+            Returns:
+                dict: 'cursor' document of the response, or None if cursor is not found
+        """
+        if batch_size is None or batch_size <= 0:
+            batch_size = DEFAULT_BATCH_SIZE
+        with self._lock:
+            self._cleanup()
+            cursor = self._cursors.get(cursor_id)
+            if cursor is None or cursor.company_id != company_id:
+                return None
+            # prevents use of the cursor by parallel getMore
+            del self._cursors[cursor_id]
+
+        batch = cursor.next_batch(batch_size)
+
+        if cursor.is_exhausted:
+            cursor.id = 0
+        else:
+            with self._lock:
+                self._cursors[cursor.id] = cursor
+
+        return {
+            'id': Int64(cursor.id),
+            'ns': cursor.ns,
+            'nextBatch': batch
+        }
+
+    def kill(self, cursor_ids, company_id=None):
+        """ close cursors
+
+            Returns:
+                tuple: list of closed cursors ids, list of not found cursors ids
+        """
+        killed = []
+        not_found = []
+        with self._lock:
+            for cursor_id in cursor_ids:
+                cursor = self._cursors.get(cursor_id)
+                if cursor is None or cursor.company_id != company_id:
+                    not_found.append(cursor_id)
+                else:
+                    del self._cursors[cursor_id]
+                    killed.append(cursor_id)
+        return killed, not_found
@@ -2,20 +2,34 @@ from mindsdb.api.mysql.mysql_proxy.controllers.session_controller import Session
 from mindsdb.api.mysql.mysql_proxy.executor.executor_commands import ExecuteCommands
 
 
-def run_sql_command(mindsdb_env, ast_query):
-    server_obj = type('', (), {})()
-
-    server_obj.original_integration_controller = mindsdb_env['original_integration_controller']
-    server_obj.original_model_controller = mindsdb_env['original_model_controller']
-    server_obj.original_view_controller = mindsdb_env['original_view_controller']
-    server_obj.original_project_controller = mindsdb_env['original_project_controller']
-    server_obj.original_database_controller = mindsdb_env['original_database_controller']
-
-    sql_session = SessionController(
-        server=server_obj,
-        company_id=mindsdb_env['company_id']
-    )
+def get_sql_session(mindsdb_env):
+    """ SessionController is created once per connection (and company) """
+    sql_session = mindsdb_env.get('sql_session')
+    if sql_session is None or sql_session.company_id != mindsdb_env['company_id']:
+        server_obj = type('', (), {})()
+
+        server_obj.original_integration_controller = mindsdb_env['original_integration_controller']
+        server_obj.original_model_controller = mindsdb_env['original_model_controller']
+        server_obj.original_view_controller = mindsdb_env['original_view_controller']
+        server_obj.original_project_controller = mindsdb_env['original_project_controller']
+        server_obj.original_database_controller = mindsdb_env['original_database_controller']
+
+        sql_session = SessionController(
+            server=server_obj,
+            company_id=mindsdb_env['company_id']
+        )
+        mindsdb_env['sql_session'] = sql_session
     sql_session.database = 'mindsdb'
+    return sql_session
+
+
+def run_sql_command(mindsdb_env, ast_query, as_iterator=False):
+    """ execute query and return result as list of documents
+
+        Args:
+            as_iterator (bool): return iterator, documents will be created on demand
+    """
+    sql_session = get_sql_session(mindsdb_env)
 
     command_executor = ExecuteCommands(sql_session, executor=None)
     ret = command_executor.execute_command(ast_query)
@@ -31,8 +45,7 @@ def run_sql_command(mindsdb_env, ast_query):
         for c in ret.columns
     ]
 
-    data = []
-    for row in ret.data:
-        data.append(dict(zip(column_names, row)))
-
-    return data
+    data = (dict(zip(column_names, row)) for row in ret.data)
+    if as_iterator:
+        return data
+    return list(data)
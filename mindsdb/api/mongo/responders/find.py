@@ -97,15 +97,17 @@ class Responce(Responder):
                 for modifier in modifiers:
                     ast_query.modifiers.append(modifier)
 
-        data = run_sql_command(mindsdb_env, ast_query)
+        data = run_sql_command(mindsdb_env, ast_query, as_iterator=True)
 
         db = mindsdb_env['config']['api']['mongodb']['database']
 
-        cursor = {
-            'id': Int64(0),
-            'ns': f"{db}.$cmd.{query['find']}",
-            'firstBatch': data
-        }
+        cursor = mindsdb_env['cursors'].open(
+            ns=f"{db}.$cmd.{query['find']}",
+            documents=data,
+            company_id=mindsdb_env['company_id'],
+            batch_size=query.get('batchSize'),
+            single_batch=query.get('singleBatch', False)
+        )
         return {
             'cursor': cursor,
             'ok': 1
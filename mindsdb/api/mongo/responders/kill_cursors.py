@@ -0,0 +1,23 @@
+from mindsdb.api.mongo.classes import Responder
+import mindsdb.api.mongo.functions as helpers
+
+
+class Responce(Responder):
+    when = {'killCursors': helpers.is_true}
+
+    def result(self, query, request_env, mindsdb_env, session):
+        killed, not_found = mindsdb_env['cursors'].kill(
+            query.get('cursors', []),
+            company_id=mindsdb_env['company_id']
+        )
+
+        return {
+            'cursorsKilled': killed,
+            'cursorsNotFound': not_found,
+            'cursorsAlive': [],
+            'cursorsUnknown': [],
+            'ok': 1
+        }
+
+
+responder = Responce()
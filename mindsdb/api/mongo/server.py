@@ -13,7 +13,7 @@ import numpy as np
 import datetime as dt
 
 import mindsdb.api.mongo.functions as helpers
-from mindsdb.api.mongo.classes import RespondersCollection, Session
+from mindsdb.api.mongo.classes import RespondersCollection, Session, CursorsRegistry
 from mindsdb.api.mongo.utilities import log
 from mindsdb.utilities.with_kwargs_wrapper import WithKWArgsWrapper
 from mindsdb.interfaces.storage.db import session as db_session
@@ -342,7 +342,8 @@ class MongoServer(SocketServer.ThreadingMixIn, SocketServer.TCPServer):
             'original_integration_controller': IntegrationController(),
             'original_view_controller': ViewController(),
             'original_project_controller': ProjectController(),
-            'original_database_controller': DatabaseController()
+            'original_database_controller': DatabaseController(),
+            'cursors': CursorsRegistry(timeout=mongodb_config.get('cursor_timeout', 600))
         }
         for name in [
             'model_controller',
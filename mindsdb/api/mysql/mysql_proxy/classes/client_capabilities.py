@@ -117,6 +117,10 @@ class ClentCapabilities():
     def DEPRECATE_EOF(self):
         return self.has(CAPABILITIES.CLIENT_DEPRECATE_EOF)
 
+    @property
+    def ZSTD_COMPRESSION_ALGORITHM(self):
+        return self.has(CAPABILITIES.CLIENT_ZSTD_COMPRESSION_ALGORITHM)
+
     @property
     def SSL_VERIFY_SERVER_CERT(self):
         return self.has(CAPABILITIES.CLIENT_SSL_VERIFY_SERVER_CERT)
@@ -1,3 +1,5 @@
+import pandas as pd
+
 from mindsdb.api.mysql.mysql_proxy.controllers.session_controller import SessionController
 from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import CHARSET_NUMBERS
 from mindsdb.interfaces.model.model_controller import ModelController
@@ -48,3 +50,10 @@ class FakeMysqlProxy(MysqlProxy):
         return {
             'is_cloud': False
         }
+
+    def process_query(self, sql):
+        answer = super().process_query(sql)
+        # consumers of http api expect list of rows
+        if isinstance(answer.data, pd.DataFrame):
+            answer.data = answer.data.to_numpy(dtype=object).tolist()
+        return answer
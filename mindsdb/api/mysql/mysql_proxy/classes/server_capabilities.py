@@ -1,4 +1,5 @@
-from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import DEFAULT_CAPABILITIES
+from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import DEFAULT_CAPABILITIES, CAPABILITIES
+from mindsdb.api.mysql.mysql_proxy.data_types.mysql_compressed_socket import is_zstd_available
 
 
 class ServerCapabilities():
@@ -20,3 +21,4 @@ class ServerCapabilities():
 
 
 server_capabilities = ServerCapabilities(DEFAULT_CAPABILITIES)
+server_capabilities.set(CAPABILITIES.CLIENT_ZSTD_COMPRESSION_ALGORITHM, is_zstd_available())
@@ -10,12 +10,14 @@
 """
 
 import re
-from collections import OrderedDict, defaultdict
-import hashlib
+import copy
+import threading
+import unicodedata
 import datetime as dt
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 import dateinfer
-import duckdb
 import pandas as pd
 import numpy as np
 
@@ -34,8 +36,11 @@ from mindsdb_sql.parser.ast import (
     Delete,
     Latest,
     BetweenOperation,
+    Parameter,
+    Tuple,
 )
 from mindsdb_sql.planner.steps import (
+    PlanStep,
     ApplyTimeseriesPredictorStep,
     ApplyPredictorRowStep,
     GetPredictorColumns,
@@ -60,9 +65,11 @@ from mindsdb_sql.exceptions import PlanningException
 from mindsdb_sql.render.sqlalchemy_render import SqlalchemyRender
 from mindsdb_sql.planner import query_planner
 from mindsdb_sql.planner.utils import query_traversal
+from mindsdb_sql.planner.step_result import Result
 from mindsdb_sql.parser.ast.base import ASTNode
 
-from mindsdb.api.mysql.mysql_proxy.utilities.sql import query_df
+from mindsdb.api.mysql.mysql_proxy.utilities.sql import query_df, DuckDBContext
+from mindsdb.api.mysql.mysql_proxy.utilities.set_operations import set_operation
 from mindsdb.api.mysql.mysql_proxy.utilities.functions import get_column_in_case
 from mindsdb.interfaces.model.functions import (
     get_model_records,
@@ -77,96 +84,15 @@ from mindsdb.api.mysql.mysql_proxy.utilities import (
     ErLogicError,
     ErSqlWrongArguments
 )
-from mindsdb.utilities.cache import get_cache, json_checksum
+from mindsdb.utilities.cache import get_cache, json_checksum, dataframe_rows_checksums, RowsCache
+from mindsdb.utilities.config import Config
+from mindsdb.interfaces.storage import db
 
 
 superset_subquery = re.compile(r'from[\s\n]*(\(.*\))[\s\n]*as[\s\n]*virtual_table', flags=re.IGNORECASE | re.MULTILINE | re.S)
 
 predictor_cache = get_cache('predict')
-
-
-class ColumnsCollection:
-    def __init__(self):
-        self.__columns = []
-
-    def add(self, table, column):
-        self.__columns.append(tuple(table) + tuple(column))
-
-    def __getitem__(self, key):
-        return self.__columns[key]
-
-    def __setitem__(self, key, value):
-        self.__columns[key] = value
-
-    def __iter__(self):
-        self.__n = 0
-        return self
-
-    def __next__(self):
-        n = self.__n
-        if n < len(self.__columns):
-            self.__n += 1
-            return self.__columns[n][:3], self.__columns[n][3:]
-        else:
-            raise StopIteration
-
-    def __len__(self):
-        return len(self.__columns)
-
-    def items(self):
-        collection = defaultdict(list)
-        for el in self.__columns:
-            collection[el[:3]].append(el[3:])
-        return collection.items()
-
-    def tables(self):
-        return set(
-            x[:3] for x in self.__columns
-        )
-
-    def table_columns(self, table_name):
-        return [x[3:] for x in self.__columns if x[:3] == table_name]
-
-    def extend(self, columns_collection):
-        for table_name, column_name in columns_collection:
-            self.add(table_name, column_name)
-
-    def group_by_table(self):
-        groups = defaultdict(list)
-        for x in self.__columns:
-            groups[x[:3]].append(x[3:])
-        return list(groups.items())
-
-    def del_duplicate_columns(self, table_name=None):
-        if table_name is None:
-            self.__columns = list(set(self.__columns))
-        else:
-            new_columns = []
-            for x in self.__columns:
-                if (
-                    x[:3] != table_name or (
-                        x not in new_columns
-                    )
-                ):
-                    new_columns.append(x)
-            self.__columns = new_columns
-
-    def del_table_columns(self, table_name):
-        self.__columns = [
-            x for x in self.__columns
-            if x[:3] != table_name
-        ]
-
-    def from_dict(self, columns_dict):
-        for table_name in columns_dict:
-            for columns_name in columns_dict[table_name]:
-                self.add(table_name, columns_name)
-
-    def copy(self):
-        new_obj = ColumnsCollection()
-        for x in self.__columns:
-            new_obj.add(x[:3], x[3:])
-        return new_obj
+predictor_rows_cache = RowsCache()
 
 
 def get_preditor_alias(step, mindsdb_database):
@@ -238,17 +164,6 @@ def markQueryVar(where):
             where.var_name = where.value
 
 
-def unmarkQueryVar(where):
-    if isinstance(where, BinaryOperation):
-        unmarkQueryVar(where.args[0])
-        unmarkQueryVar(where.args[1])
-    elif isinstance(where, UnaryOperation):
-        unmarkQueryVar(where.args[0])
-    elif isinstance(where, Constant):
-        if hasattr(where, 'is_var') and where.is_var is True:
-            where.value = where.var_name
-
-
 def replaceQueryVar(where, var_value, var_name):
     if isinstance(where, BinaryOperation):
         replaceQueryVar(where.args[0], var_value, var_name)
@@ -260,21 +175,272 @@ def replaceQueryVar(where, var_value, var_name):
             where.value = var_value
 
 
-def join_query_data(target, source):
-    target['values'].extend(source['values'])
-    target['tables'].extend(source['tables'])
-    target['tables'] = list(set(target['tables']))
+def split_and_conditions(where):
+    if isinstance(where, BinaryOperation) and where.op.lower() == 'and':
+        return split_and_conditions(where.args[0]) + split_and_conditions(where.args[1])
+    return [where]
+
+
+def join_and_conditions(conditions):
+    where = None
+    for condition in conditions:
+        if where is None:
+            where = condition
+        else:
+            where = BinaryOperation('and', args=[where, condition])
+    return where
+
+
+def get_query_vars_conditions(query, var_names):
+    """ Finds conditions '<column> = $var[<name>]' of the query which can be replaced by
+        condition for many groups of values at once. It is possible if they are joined
+        by 'and' at top level of where and if every group is not limited or aggregated.
+
+        Returns:
+            tuple: (dict: var name -> column identifier, list of other conditions) or None
+    """
+    if (
+        not isinstance(query, Select)
+        or query.where is None
+        or query.limit is not None
+        or query.offset is not None
+        or query.group_by is not None
+        or query.having is not None
+        or query.distinct
+    ):
+        return None
+
+    # functions in targets (aggregates) can mix rows of different groups
+    for target in query.targets:
+        if not isinstance(target, (Star, Identifier)):
+            return None
+
+    var_columns = {}
+    other_conditions = []
+    for condition in split_and_conditions(query.where):
+        if (
+            isinstance(condition, BinaryOperation)
+            and condition.op == '='
+            and isinstance(condition.args[0], Identifier)
+            and isinstance(condition.args[1], Constant)
+            and str(condition.args[1].value).startswith('$var[')
+        ):
+            var_name = condition.args[1].value[len('$var['):-1]
+            if var_name in var_columns:
+                return None
+            var_columns[var_name] = condition.args[0]
+        else:
+            other_conditions.append(condition)
+
+    if set(var_columns.keys()) != set(var_names):
+        return None
+
+    # vars must not be used somewhere else
+    found = []
+
+    def find_vars(node, **kwargs):
+        if isinstance(node, Constant) and str(node.value).startswith('$var['):
+            found.append(node)
+
+    for condition in other_conditions:
+        query_traversal(condition, find_vars)
+    if len(found) > 0:
+        return None
+
+    return var_columns, other_conditions
+
+
+def make_vars_groups_condition(var_columns, vars_groups):
+    """ condition for selection of all groups of values: 'in' for one variable, 'or' for many """
+    if len(var_columns) == 1:
+        name, column = list(var_columns.items())[0]
+        return BinaryOperation('in', args=[
+            copy.deepcopy(column),
+            Tuple([Constant(var_group[name]) for var_group in vars_groups])
+        ])
+
+    condition = None
+    for var_group in vars_groups:
+        group_condition = join_and_conditions([
+            BinaryOperation('=', args=[copy.deepcopy(column), Constant(var_group[name])])
+            for name, column in var_columns.items()
+        ])
+        if condition is None:
+            condition = group_condition
+        else:
+            condition = BinaryOperation('or', args=[condition, group_condition])
+    return condition
+
+
+def _loose_string(value):
+    # ignores case, accents and trailing spaces, as collations of databases can do
+    value = unicodedata.normalize('NFKD', value)
+    value = ''.join(char for char in value if not unicodedata.combining(char))
+    return value.casefold().rstrip(' ')
+
+
+def _normalize_var_values(values, group_values):
+    """ converts values of variables to type of the column returned by database
+
+        Returns:
+            tuple: (keys of rows, keys of groups) or None if value of some group can't be converted
+    """
+    if pd.api.types.is_bool_dtype(values) or pd.api.types.is_numeric_dtype(values):
+        def convert(series):
+            return pd.to_numeric(series, errors='coerce').astype(float)
+    elif pd.api.types.is_datetime64_any_dtype(values):
+        def convert(series):
+            return pd.to_datetime(series, errors='coerce')
+    else:
+        def convert(series):
+            return series.map(lambda value: None if value is None else _loose_string(str(value)))
+
+    groups_keys = convert(pd.Series(group_values, dtype=object))
+    if groups_keys.isna().any():
+        return None
+    return convert(values).tolist(), groups_keys.tolist()
+
+
+def split_vars_groups(columns_values, vars_groups):
+    """ Splits rows fetched for many groups of variables at once by groups.
+
+        Database compares values by its own rules (types conversion, collation), so values are
+        normalized to type of returned column. If it is not clear which group a row belongs to
+        the rows can't be split.
+
+        Args:
+            columns_values (dict): var name -> pandas.Series, values of var column returned by database
+            vars_groups (List[dict]): values of variables for every group
+        Returns:
+            list of lists of rows positions for every group or None
+    """
+    names = list(columns_values.keys())
+    rows_keys = []
+    groups_keys = []
+    for name in names:
+        keys = _normalize_var_values(columns_values[name], [var_group[name] for var_group in vars_groups])
+        if keys is None:
+            return None
+        rows_keys.append(keys[0])
+        groups_keys.append(keys[1])
+
+    key_groups = defaultdict(list)
+    for i, key in enumerate(zip(*groups_keys)):
+        if len(key_groups[key]) > 0:
+            first_group = vars_groups[key_groups[key][0]]
+            if any(first_group[name] != vars_groups[i][name] for name in names):
+                # different groups can be equal for database
+                return None
+        key_groups[key].append(i)
+
+    groups_rows = [[] for _ in vars_groups]
+    for row_i, key in enumerate(zip(*rows_keys)):
+        groups = key_groups.get(key)
+        if groups is None:
+            # row doesn't match any group: comparison of database is different
+            return None
+        for i in groups:
+            groups_rows[i].append(row_i)
+    return groups_rows
+
+
+def get_results_usage(steps):
+    """ count of usages of results of steps by other steps """
+    usage = defaultdict(int)
+
+    def find_results(obj):
+        if isinstance(obj, Result):
+            usage[obj.step_num] += 1
+        elif isinstance(obj, (list, tuple)):
+            for item in obj:
+                find_results(item)
+        elif isinstance(obj, dict):
+            for item in obj.values():
+                find_results(item)
+        elif isinstance(obj, (PlanStep, ASTNode)):
+            for key, value in vars(obj).items():
+                if key not in ('references', 'result_data'):
+                    find_results(value)
+
+    for step in steps:
+        find_results(step)
+    return usage
+
+
+def is_limit_query(query):
+    """ query only limits the table: 'select * ... limit <n>' """
+    return (
+        isinstance(query, Select)
+        and query.limit is not None
+        and all(isinstance(target, Star) for target in query.targets)
+        and query.where is None
+        and query.group_by is None
+        and query.having is None
+        and query.order_by is None
+        and not query.distinct
+    )
+
+
+def get_fetch_limits(steps):
+    """ Finds fetch steps which result is used only by limit (LimitOffsetStep or
+        'select * limit' in SubSelectStep). For them there is no need to read the whole
+        result from database
+
+        Returns:
+            dict: step num -> count of rows which is enough to read
+    """
+    usage = get_results_usage(steps)
+    fetch_steps = set(step.step_num for step in steps if type(step) == FetchDataframeStep)
+
+    limits = {}
+    for step in steps:
+        if type(step) == LimitOffsetStep:
+            limit, offset = step.limit, step.offset
+        elif type(step) == SubSelectStep and is_limit_query(step.query):
+            limit, offset = step.query.limit, step.query.offset
+        else:
+            continue
+
+        if not isinstance(step.dataframe, Result):
+            continue
+        step_num = step.dataframe.step_num
+        if step_num not in fetch_steps or usage[step_num] != 1:
+            continue
+
+        if not (isinstance(limit, Constant) and isinstance(limit.value, int)):
+            continue
+        rows_count = limit.value
+        if offset is not None:
+            if not (isinstance(offset, Constant) and isinstance(offset.value, int)):
+                continue
+            rows_count += offset.value
+        limits[step_num] = rows_count
+    return limits
 
-    target['columns'].extend(source['columns'])
-    target['columns'].del_duplicate_columns()
 
+_map_reduce_executor = None
+_map_reduce_lock = threading.Lock()
+_map_reduce_local = threading.local()
 
-def is_empty_prediction_row(predictor_value):
-    "Define empty rows in predictor after JOIN"
-    for key in predictor_value:
-        if predictor_value[key] is not None and pd.notna(predictor_value[key]):
-            return False
-    return True
+
+def get_map_reduce_executor():
+    """ Bounded pool for substeps of MapReduceStep. Threads are not recreated, so
+        handlers cached for them can be reused.
+
+        Configuration:
+            "map_reduce": {
+                "max_workers": 4,
+                "batch_size": 100
+            }
+    """
+    global _map_reduce_executor
+    with _map_reduce_lock:
+        if _map_reduce_executor is None:
+            _map_reduce_executor = ThreadPoolExecutor(
+                max_workers=Config().get('map_reduce', {}).get('max_workers', 4),
+                thread_name_prefix='map_reduce'
+            )
+        return _map_reduce_executor
 
 
 class Column:
@@ -295,110 +461,182 @@ class Column:
         self.flags = flags
         self.charset = charset
 
+    def get_table(self):
+        return (self.database, self.table_name, self.table_alias)
+
+    def get_key(self):
+        return self.get_table() + (self.name, self.alias)
+
+    def copy(self, **kwargs):
+        params = dict(
+            name=self.name,
+            alias=self.alias,
+            table_name=self.table_name,
+            table_alias=self.table_alias,
+            type=self.type,
+            database=self.database,
+            flags=self.flags,
+            charset=self.charset
+        )
+        params.update(kwargs)
+        return Column(**params)
+
     def __repr__(self):
         return f'{self.__class__.__name__}({self.__dict__})'
 
 
 class ResultSet:
-    def __init__(self):
-        self.columns = []
-        # records is list of lists with the same length as columns
-        self.records = []
-
-    def from_step_data(self, step_data):
-
-        for table, col_list in step_data['columns'].items():
-            for col in col_list:
-                type = None
-                if 'types' in step_data:
-                    type = step_data['types'].get(table, {}).get(col[0])
-                self.columns.append(Column(
-                    name=col[0],
-                    alias=col[1],
-                    type=type,
-                    table_name=table[1],
-                    table_alias=table[2],
-                    database=table[0]
-                ))
+    """ Columnar data of planner step
 
-        for row in step_data['values']:
-            data_row = []
-            for col in self.columns:
-                col_key = (col.name, col.alias)
-                table_key = (col.database, col.table_name, col.table_alias)
-                val = row[table_key][col_key]
+        Values are stored in DataFrame which columns are positions of self.columns.
+        In that way different tables can have columns with the same names
+    """
 
-                data_row.append(val)
+    def __init__(self, columns=None, df=None, is_prediction=False):
+        if columns is None:
+            columns = []
+        self.columns = columns
 
-            self.records.append(data_row)
+        if df is None:
+            df = pd.DataFrame([], columns=range(len(columns)))
+        self._df = df
 
-    def from_df(self, df, database, table_name):
+        # is used by join step
+        self.is_prediction = is_prediction
 
-        resp_dict = df.to_dict(orient='split')
+    def __len__(self):
+        return len(self._df)
 
-        self.records = resp_dict['data']
+    @staticmethod
+    def from_df(df, database=None, table_name=None, table_alias=None, types=None, is_prediction=False):
+        if types is None:
+            types = df.dtypes
 
-        for col in resp_dict['columns']:
-            self.columns.append(Column(
+        columns = [
+            Column(
                 name=col,
                 table_name=table_name,
+                table_alias=table_alias,
                 database=database,
-                type=df.dtypes[col]
-            ))
+                type=types.get(col)
+            )
+            for col in df.columns
+        ]
+
+        df = df.copy(deep=False)
+        df.columns = range(len(columns))
+        return ResultSet(columns=columns, df=df, is_prediction=is_prediction)
+
+    def get_raw_df(self):
+        # columns of dataframe are column positions
+        return self._df
 
     def to_df(self):
-        columns = [
+        df = self._df.copy(deep=False)
+        df.columns = [
             col.name if col.alias is None else col.alias
             for col in self.columns
         ]
+        return df
 
-        return pd.DataFrame(self.records, columns=columns)
-
-    def to_step_data(self):
-        step_data = {
-            'values': [],
-            'columns': ColumnsCollection(),
-            'types': {},
-            'tables': []
-        }
+    def get_records(self):
+        # list of lists with the same length as columns
+        return self._df.to_numpy(dtype=object).tolist()
 
+    def get_tables(self):
+        tables = []
         for col in self.columns:
-            col_key = (col.name, col.alias)
-            table_key = (col.database, col.table_name, col.table_alias)
-
-            if table_key not in step_data['tables']:
-                step_data['tables'].append(table_key)
-                step_data['types'][table_key] = {}
-
-            step_data['columns'].add(table_key, col_key)
-            if col.type is not None:
-                step_data['types'][table_key][col.name] = col.type
-
-        for rec in self.records:
-            row = {}
-            for table in step_data['tables']:
-                row[table] = {}
-            for i, col in enumerate(self.columns):
-                col_key = (col.name, col.alias)
-                table_key = (col.database, col.table_name, col.table_alias)
-
-                row[table_key][col_key] = rec[i]
-
-            step_data['values'].append(row)
-        return step_data
+            table = col.get_table()
+            if table not in tables:
+                tables.append(table)
+        return tables
+
+    def find_columns(self, table):
+        # list of pairs (position, column) of the table
+        return [
+            (i, col)
+            for i, col in enumerate(self.columns)
+            if col.get_table() == table
+        ]
 
-    def clear_records(self):
-        self.records = []
+    def get_column_index(self, column):
+        key = column.get_key()
+        for i, col in enumerate(self.columns):
+            if col.get_key() == key:
+                return i
+        raise ErKeyColumnDoesNotExist(f'Column is not found: {column.alias or column.name}')
 
-    def replace_records(self, records):
-        self.clear_records()
-        for rec in records:
-            self.add_record(rec)
+    def get_column_values(self, index):
+        return self._df[index]
 
-    def add_record(self, rec):
-        if len(rec) != len(self.columns):
-            raise ErSqlWrongArguments(f'Record length mismatch columns length: {len(rec)} != {len(self.columns)}')
-        self.records.append(rec)
+    def add_column(self, column, values=None):
+        # existing column with the same key is overwritten
+        try:
+            index = self.get_column_index(column)
+        except ErKeyColumnDoesNotExist:
+            index = len(self.columns)
+            self.columns.append(column)
+
+        self._df[index] = values
+        return index
+
+    def select(self, indexes, columns=None):
+        # new result set with subset of columns, in order of indexes
+        if columns is None:
+            columns = [self.columns[i] for i in indexes]
+        df = self._df.iloc[:, indexes]
+        df.columns = range(len(columns))
+        return ResultSet(columns=columns, df=df, is_prediction=self.is_prediction)
+
+    def slice(self, start=None, stop=None):
+        df = self._df.iloc[start:stop].reset_index(drop=True)
+        return ResultSet(columns=self.columns.copy(), df=df, is_prediction=self.is_prediction)
+
+    def take(self, positions):
+        df = self._df.take(positions).reset_index(drop=True)
+        return ResultSet(columns=self.columns.copy(), df=df, is_prediction=self.is_prediction)
+
+    def replace_df(self, df):
+        if len(df.columns) != len(self.columns):
+            raise ErSqlWrongArguments(f'Data length mismatch columns length: {len(df.columns)} != {len(self.columns)}')
+        df = df.copy(deep=False)
+        df.columns = range(len(self.columns))
+        self._df = df
+
+    @staticmethod
+    def concat(results):
+        """ Concatenates rows of results. Columns are matched by table and name,
+            absent values are filled with None
+        """
+        columns = []
+        keys = []
+        dfs = []
+        for result in results:
+            positions = []
+            for col in result.columns:
+                key = col.get_key()
+                if key not in keys:
+                    keys.append(key)
+                    columns.append(col)
+                positions.append(keys.index(key))
+
+            df = result.get_raw_df()
+            # drop doubled columns
+            _, first_positions = np.unique(positions, return_index=True)
+            first_positions.sort()
+            df = df.iloc[:, first_positions]
+            df.columns = [positions[i] for i in first_positions]
+            dfs.append(df)
+
+        if len(dfs) == 0:
+            return ResultSet()
+
+        df = pd.concat(dfs, ignore_index=True)
+        if len(df.columns) != len(columns) or any(len(x.columns) != len(columns) for x in dfs):
+            # not all results have all columns
+            df = df.reindex(columns=range(len(columns)))
+            df = df.replace({np.nan: None})
+        return ResultSet(columns=columns, df=df)
 
 
 class SQLQuery():
@@ -435,6 +673,10 @@ class SQLQuery():
         self.planner = None
         self.parameters = []
         self.fetched_data = None
+        # step num -> count of rows which is enough to read from database
+        self.fetch_limits = {}
+        # duckdb connection for all steps of the query
+        self.duck_context = DuckDBContext(config=session.config.get('duckdb'))
         # self._process_query(sql)
         self.create_planner()
         if execute:
@@ -474,7 +716,8 @@ class SQLQuery():
                     'name': model_name,
                     'integration_name': project_name,   # integration_name,
                     'timeseries': False,
-                    'id': predictor_record.id
+                    'id': predictor_record.id,
+                    'version': predictor_record.updated_at
                 }
                 if ts_settings.get('is_timeseries') is True:
                     window = ts_settings.get('window')
@@ -508,13 +751,10 @@ class SQLQuery():
     def fetch(self, view='list'):
         data = self.fetched_data
 
-        result = self._make_list_result_view(data)
         if view == 'dataframe':
-            col_names = [
-                col.alias if col.alias is not None else col.name
-                for col in self.columns_list
-            ]
-            result = pd.DataFrame(result, columns=col_names)
+            result = self._make_dataframe_result_view(data)
+        else:
+            result = self._make_list_result_view(data)
 
         # this is not used
         # elif view == 'dict':
@@ -527,17 +767,23 @@ class SQLQuery():
             'result': result
         }
 
-    def _fetch_dataframe_step(self, step):
+    def _fetch_dataframe_step(self, step, limit=None):
         dn = self.datahub.get(step.integration)
         query = step.query
 
+        kwargs = {}
+        if limit is not None and dn.get_type() == 'integration':
+            # the rest of result is not used
+            kwargs['limit'] = limit
+
         if query is None:
             table_alias = (self.database, 'result', 'result')
 
             # fetch raw_query
             data, columns_info = dn.query(
                 native_query=step.raw_query,
-                session=self.session
+                session=self.session,
+                **kwargs
             )
         else:
             table_alias = get_table_alias(step.query.from_table, self.database)
@@ -545,7 +791,8 @@ class SQLQuery():
 
             data, columns_info = dn.query(
                 query=query,
-                session=self.session
+                session=self.session,
+                **kwargs
             )
 
         # if this is query: execute it
@@ -553,69 +800,163 @@ class SQLQuery():
             subquery = SQLQuery(data, session=self.session)
             return subquery.fetched_data
 
-        columns = [(column['name'], column['name']) for column in columns_info]
-
-        data = [{(key, key): value for key, value in row.items()} for row in data]
-        data = [{table_alias: x} for x in data]
-
         col_types = {
             column['name']: column['type']
             for column in columns_info
         }
-        columns_collection = ColumnsCollection()
-        for column in columns:
-            columns_collection.add(table_alias, column)
-        data = {
-            'values': data,
-            'columns': columns_collection,
-            'tables': [table_alias],
-            'types': {table_alias: col_types}
-        }
-        return data
+        return ResultSet.from_df(
+            data,
+            database=table_alias[0],
+            table_name=table_alias[1],
+            table_alias=table_alias[2],
+            types=col_types
+        )
 
     def _multiple_steps(self, step):
-        data = {
-            'values': [],
-            'columns': ColumnsCollection(),
-            'tables': []
-        }
+        results = []
         for substep in step.steps:
-            sub_data = self._fetch_dataframe_step(substep)
-            join_query_data(data, sub_data)
-        return data
-
-    def _multiple_steps_reduce(self, step, vars):
-        if step.reduce != 'union':
-            raise ErLogicError(f'Unknown MultipleSteps type: {step.reduce}')
-
-        data = {
-            'values': [],
-            'columns': ColumnsCollection(),
-            'tables': []
+            results.append(self._fetch_dataframe_step(substep))
+        return ResultSet.concat(results)
+
+    def _map_reduce_fetch(self, substeps, vars):
+        """ Executes fetch steps for every group of variables and joins results in the same order
+            as sequential execution: by groups, by steps inside of group.
+
+            Groups are fetched by batches in one query if the query allows it. Other queries
+            are executed concurrently, every one with own copy of the query.
+        """
+        for substep in substeps:
+            if isinstance(substep, FetchDataframeStep) is False:
+                raise ErLogicError(f'Wrong step type for MultipleSteps: {substep}')
+
+        if len(vars) == 0:
+            return ResultSet()
+
+        var_names = list(vars[0].keys())
+        batch_size = Config().get('map_reduce', {}).get('batch_size', 100)
+
+        # (substep index, indexes of groups, conditions for batch or None)
+        tasks = []
+        for step_index, substep in enumerate(substeps):
+            vars_conditions = get_query_vars_conditions(substep.query, var_names)
+            if vars_conditions is not None and len(vars) > 1:
+                for start in range(0, len(vars), batch_size):
+                    indexes = list(range(start, min(start + batch_size, len(vars))))
+                    tasks.append((step_index, indexes, vars_conditions))
+            else:
+                for i in range(len(vars)):
+                    tasks.append((step_index, [i], None))
+
+        def run_task(task):
+            step_index, indexes, vars_conditions = task
+            substep = substeps[step_index]
+            if vars_conditions is not None:
+                results = self._fetch_vars_batch(substep, [vars[i] for i in indexes], *vars_conditions)
+                if results is not None:
+                    return results
+            return [self._fetch_vars_group(substep, vars[i]) for i in indexes]
+
+        if len(tasks) == 1 or getattr(_map_reduce_local, 'is_worker', False):
+            # nested map reduce is executed in the same thread to not wait for itself
+            tasks_results = [run_task(task) for task in tasks]
+        else:
+            def run_task_in_pool(task):
+                _map_reduce_local.is_worker = True
+                try:
+                    return run_task(task)
+                finally:
+                    _map_reduce_local.is_worker = False
+                    # don't keep transaction open in the pool thread
+                    db.session.remove()
+
+            tasks_results = list(get_map_reduce_executor().map(run_task_in_pool, tasks))
+
+        # results[group index][substep index]
+        results = [[None] * len(substeps) for _ in vars]
+        for (step_index, indexes, _), task_results in zip(tasks, tasks_results):
+            for i, result in zip(indexes, task_results):
+                results[i][step_index] = result
+
+        return ResultSet.concat([
+            result
+            for group_results in results
+            for result in group_results
+        ])
+
+    def _fetch_vars_group(self, substep, var_group):
+        substep = copy.copy(substep)
+        substep.query = copy.deepcopy(substep.query)
+        markQueryVar(substep.query.where)
+        for name, value in var_group.items():
+            replaceQueryVar(substep.query.where, value, name)
+        return self._fetch_dataframe_step(substep)
+
+    def _fetch_vars_batch(self, substep, vars_groups, var_columns, other_conditions):
+        """ fetch many groups of variables by one query and split result by groups.
+            Var columns are added to result under internal aliases to split it.
+            Returns None if result can't be split
+        """
+        aliases = {
+            name: f'__mindsdb_var_{i}'
+            for i, name in enumerate(var_columns.keys())
         }
 
-        for var_group in vars:
-            for substep in step.steps:
-                if isinstance(substep, FetchDataframeStep) is False:
-                    raise ErLogicError(f'Wrong step type for MultipleSteps: {step}')
-                markQueryVar(substep.query.where)
-            for name, value in var_group.items():
-                for substep in step.steps:
-                    replaceQueryVar(substep.query.where, value, name)
-            sub_data = self._multiple_steps(step)
-            join_query_data(data, sub_data)
+        substep = copy.copy(substep)
+        substep.query = copy.deepcopy(substep.query)
+        substep.query.where = join_and_conditions(
+            copy.deepcopy(other_conditions)
+            + [make_vars_groups_condition(var_columns, vars_groups)]
+        )
+        substep.query.targets = substep.query.targets + [
+            Identifier(parts=list(column.parts), alias=Identifier(aliases[name]))
+            for name, column in var_columns.items()
+        ]
+        result = self._fetch_dataframe_step(substep)
+
+        df = result.get_raw_df()
+        columns_values = {}
+        for name, alias in aliases.items():
+            for i, col in enumerate(result.columns):
+                if col.name.lower() == alias:
+                    columns_values[name] = df[i]
+                    break
+            else:
+                return None
 
-        return data
+        groups_rows = split_vars_groups(columns_values, vars_groups)
+        if groups_rows is None:
+            return None
+
+        # without var columns
+        indexes = [
+            i
+            for i, col in enumerate(result.columns)
+            if col.name.lower() not in aliases.values()
+        ]
+        result = result.select(indexes)
+        return [result.take(rows) for rows in groups_rows]
 
     def prepare_query(self, prepare=True):
         if prepare:
             # it is prepared statement call
             steps_data = []
             try:
-                for step in self.planner.prepare_steps(self.query):
-                    data = self.execute_step(step, steps_data)
-                    step.set_result(data)
-                    steps_data.append(data)
+                # duckdb connection is closed after the steps
+                with self.duck_context:
+                    for step in self.planner.prepare_steps(self.query):
+                        data = self.execute_step(step, steps_data)
+                        # planner reads tables and its columns from result of the step
+                        step.set_result({
+                            'tables': data.get_tables(),
+                            'columns': {
+                                table: [
+                                    {'name': col.name, 'type': col.type}
+                                    for _, col in data.find_columns(table)
+                                ]
+                                for table in data.get_tables()
+                            }
+                        })
+                        steps_data.append(data)
             except PlanningException as e:
                 raise ErLogicError(e)
 
@@ -650,10 +991,14 @@ class SQLQuery():
 
         steps_data = []
         try:
-            for step in self.planner.execute_steps(params):
-                data = self.execute_step(step, steps_data)
-                step.set_result(data)
-                steps_data.append(data)
+            # duckdb connection is closed after the steps
+            with self.duck_context:
+                steps = list(self.planner.execute_steps(params))
+                self.fetch_limits = get_fetch_limits(steps)
+                for step in steps:
+                    data = self.execute_step(step, steps_data)
+                    step.set_result(data)
+                    steps_data.append(data)
         except PlanningException as e:
             raise ErLogicError(e)
 
@@ -666,88 +1011,22 @@ class SQLQuery():
 
         try:
             if self.outer_query is not None:
-                data = []
-                # +++
-                # ???
-                result = []
-                for row in steps_data[-1]:
-                    data_row = {}
-                    for column_record in self.columns_list:
-                        table_name = (column_record.database, column_record.table_name, column_record.table_alias)
-                        column_name = column_record.name
-                        data_row[column_record.alias or column_record.name] = row[table_name][column_name]
-                    result.append(data_row)
-                # ---
-                data = self._make_list_result_view(result)
-                df = pd.DataFrame(data)
-                result = query_df(df, self.outer_query)
+                df = steps_data[-1].to_df()
+                with self.duck_context:
+                    result = query_df(df, self.outer_query, duck_context=self.duck_context)
 
-                try:
-                    self.columns_list = [
-                        Column(database='',
-                               table_name='',
-                               name=x)
-                        for x in result.columns
-                    ]
-                except Exception:
-                    self.columns_list = [
-                        Column(database='',
-                               table_name='',
-                               name=result.name)
-                    ]
-
-                # +++ make list result view
-                new_result = []
-                for row in result.to_dict(orient='records'):
-                    data_row = []
-                    for column_record in self.columns_list:
-                        column_name = column_record.alias or column_record.name
-                        data_row.append(row.get(column_name))
-                    new_result.append(data_row)
-                result = new_result
-                # ---
-
-                self.fetched_data = result
+                self.fetched_data = ResultSet.from_df(result, database='', table_name='')
+                self.columns_list = self.fetched_data.columns.copy()
             else:
                 self.fetched_data = steps_data[-1]
         except Exception as e:
             raise SqlApiUnknownError("error in preparing result quiery step") from e
 
         try:
-            if hasattr(self, 'columns_list') is False:
-                self.columns_list = []
-                keys = []
-                for row in self.fetched_data:
-                    for table_key in row:
-                        for column_name in row[table_key]:
-                            key = (table_key + (column_name, column_name))
-                            if key not in keys:
-                                keys.append(key)
-                                self.columns_list.append(
-                                    Column(database=table_key[0],
-                                           table_name=table_key[1],
-                                           table_alias=table_key[2],
-                                           name=column_name)
-                                )
             if self.columns_list is None:
                 self.columns_list = []
                 if self.fetched_data is not None:
-                    if isinstance(self.fetched_data['columns'], ColumnsCollection) is False:  # <<< del???
-                        columns_collection = ColumnsCollection()
-                        columns_collection.from_dict(self.fetched_data['columns'])
-                        self.fetched_data['columns'] = columns_collection
-                    for table_name, column in self.fetched_data['columns']:
-                        col_types = self.fetched_data.get('types', {}).get(table_name, {})
-                        self.columns_list.append(
-                            Column(
-                                database=table_name[0],
-                                table_name=table_name[1],
-                                table_alias=table_name[2],
-                                name=column[0],
-                                alias=column[1],
-                                type=col_types.get(column[0])
-                            )
-                        )
+                    self.columns_list = self.fetched_data.columns.copy()
 
             self.columns_list = [x for x in self.columns_list if x.name != '__mindsdb_row_id']
         except Exception as e:
@@ -758,41 +1037,37 @@ class SQLQuery():
             predictor_name = step.predictor.parts[-1]
             dn = self.datahub.get(self.mindsdb_database_name)
             columns = dn.get_table_columns(predictor_name)
-            table_name = (self.mindsdb_database_name, predictor_name, predictor_name)
-            columns_collection = ColumnsCollection()
-            for column_name in columns:
-                columns_collection.add(table_name, (column_name, column_name))
-            data = {
-                'values': [],
-                'columns': columns_collection,
-                'tables': [table_name]
-            }
+            data = ResultSet(columns=[
+                Column(
+                    name=column_name,
+                    database=self.mindsdb_database_name,
+                    table_name=predictor_name,
+                    table_alias=predictor_name
+                )
+                for column_name in columns
+            ])
         elif type(step) == GetTableColumns:
             table = step.table
             dn = self.datahub.get(step.namespace)
             ds_query = Select(from_table=Identifier(table), targets=[Star()])
 
-            data, columns_info = dn.query(ds_query, session=self.session)
-
-            table_alias = (self.database, table, table)
+            _, columns_info = dn.query(ds_query, session=self.session)
 
-            columns_collection = ColumnsCollection()
-            for column in columns_info:
-                columns_collection.add(table_name, column)
-
-            data = {
-                'values': [],
-                'columns': columns_collection,
-                'tables': [table_alias]
-            }
+            data = ResultSet(columns=[
+                Column(
+                    name=column['name'],
+                    type=column['type'],
+                    database=self.database,
+                    table_name=table,
+                    table_alias=table
+                )
+                for column in columns_info
+            ])
         elif type(step) == FetchDataframeStep:
-            data = self._fetch_dataframe_step(step)
+            data = self._fetch_dataframe_step(step, limit=self.fetch_limits.get(step.step_num))
         elif type(step) == UnionStep:
-            left_result = ResultSet()
-            right_result = ResultSet()
-
-            left_result.from_step_data(steps_data[step.left.step_num])
-            right_result.from_step_data(steps_data[step.right.step_num])
+            left_result = steps_data[step.left.step_num]
+            right_result = steps_data[step.right.step_num]
 
             # count of columns have to match
             if len(left_result.columns) != len(right_result.columns):
@@ -808,19 +1083,16 @@ class SQLQuery():
             #         if type1 != type2:
             #             raise ErSqlWrongArguments(f'UNION types mismatch: {type1} != {type2}')
 
-            records = []
-            records_hashes = []
-            for rec in left_result.records + right_result.records:
-                if step.unique:
-                    checksum = hashlib.sha256(str(rec).encode()).hexdigest()
-                    if checksum in records_hashes:
-                        continue
-                    records_hashes.append(checksum)
-                records.append(rec)
-
-            left_result.replace_records(records)
+            df = set_operation(
+                left_result.get_raw_df(),
+                right_result.get_raw_df(),
+                operation='union',
+                distinct=step.unique,
+                duck_context=self.duck_context,
+                duckdb_min_rows=self.session.config.get('set_operations', {}).get('duckdb_min_rows')
+            )
 
-            data = left_result.to_step_data()
+            data = ResultSet(columns=left_result.columns.copy(), df=df)
 
         elif type(step) == MapReduceStep:
             try:
@@ -829,36 +1101,25 @@ class SQLQuery():
 
                 step_data = steps_data[step.values.step_num]
                 vars = []
-                step_data_values = step_data['values']
-                for row in step_data_values:
-                    var_group = {}
-                    vars.append(var_group)
-                    for row_data in row.values():
-                        for name, value in row_data.items():
-                            if name[0] != '__mindsdb_row_id':
-                                var_group[name[1] or name[0]] = value
-
-                data = {
-                    'values': [],
-                    'columns': ColumnsCollection(),
-                    'tables': []
-                }
+                df = step_data.get_raw_df()
+                var_columns = [
+                    (i, col.alias or col.name)
+                    for i, col in enumerate(step_data.columns)
+                    if col.name != '__mindsdb_row_id'
+                ]
+                for row in df.itertuples(index=False):
+                    vars.append({
+                        name: row[i]
+                        for i, name in var_columns
+                    })
+
                 substep = step.step
                 if type(substep) == FetchDataframeStep:
-                    query = substep.query
-                    for var_group in vars:
-                        markQueryVar(query.where)
-                        for name, value in var_group.items():
-                            replaceQueryVar(query.where, value, name)
-                        sub_data = self._fetch_dataframe_step(substep)
-                        if len(data['columns']) == 0:
-                            data['columns'] = sub_data['columns']
-                        if len(data['tables']) == 0:
-                            data['tables'] = sub_data['tables']
-                        data['values'].extend(sub_data['values'])
-                        unmarkQueryVar(query.where)
+                    data = self._map_reduce_fetch([substep], vars)
                 elif type(substep) == MultipleSteps:
-                    data = self._multiple_steps_reduce(substep, vars)
+                    if substep.reduce != 'union':
+                        raise ErLogicError(f'Unknown MultipleSteps type: {substep.reduce}')
+                    data = self._map_reduce_fetch(substep.steps, vars)
                 else:
                     raise ErLogicError(f'Unknown step type: {step.step}')
             except Exception as e:
@@ -866,13 +1127,10 @@ class SQLQuery():
         elif type(step) == MultipleSteps:
             if step.reduce != 'union':
                 raise ErNotSupportedYet(f"Only MultipleSteps with type = 'union' is supported. Got '{step.type}'")
-            data = None
+            results = []
             for substep in step.steps:
-                subdata = self.execute_step(substep, steps_data)
-                if data is None:
-                    data = subdata
-                else:
-                    data['values'].extend(subdata['values'])
+                results.append(self.execute_step(substep, steps_data))
+            data = ResultSet.concat(results)
         elif type(step) == ApplyPredictorRowStep:
             try:
                 project_name = step.namespace
@@ -885,63 +1143,65 @@ class SQLQuery():
                     data=where_data
                 )
 
-                data = [{(key, key): value for key, value in row.items()} for row in predictions]
-
                 table_name = get_preditor_alias(step, self.database)
-                values = [{table_name: x} for x in data]
 
-                columns_collection = ColumnsCollection()
-                if len(data) > 0:
-                    row = data[0]
-                    for key in row.keys():
-                        columns_collection.add(table_name, key)
+                if len(predictions) > 0:
+                    columns = list(predictions[0].keys())
                 else:
-                    cols = project_datanode.get_table_columns(predictor_name)
-                    for col in cols:
-                        columns_collection.add(table_name, (col, col))
-
-                data = {
-                    'values': values,
-                    'columns': columns_collection,
-                    'tables': [table_name]
-                }
+                    columns = project_datanode.get_table_columns(predictor_name)
+
+                data = ResultSet.from_df(
+                    pd.DataFrame(predictions, columns=columns),
+                    database=table_name[0],
+                    table_name=table_name[1],
+                    table_alias=table_name[2],
+                    types={}
+                )
             except Exception as e:
                 if isinstance(e, SqlApiException):
                     raise e
                 else:
                     raise SqlApiUnknownError(f'error in apply predictor row step: {e}') from e
-        elif type(step) in (ApplyPredictorStep, ApplyTimeseriesPredictorStep):
+        elif type(step) in (ApplyTimeseriesPredictorStep, ApplyPredictorStep):
             try:
                 # set row_id
                 data = steps_data[step.dataframe.step_num]
-                row_id_col = ('__mindsdb_row_id', '__mindsdb_row_id')
-                for table in data['columns'].tables():
-                    data['columns'].add(table, row_id_col)
-
-                row_count = len(data['values'])
 
-                for i, row in enumerate(data['values']):
-                    for n, table_name in enumerate(row):
-                        row[table_name][row_id_col] = self.row_id + i + n * row_count
+                tables = data.get_tables()
+                row_count = len(data)
+
+                for n, table in enumerate(tables):
+                    row_id_start = self.row_id + n * row_count
+                    data.add_column(
+                        Column(
+                            name='__mindsdb_row_id',
+                            database=table[0],
+                            table_name=table[1],
+                            table_alias=table[2]
+                        ),
+                        values=np.arange(row_id_start, row_id_start + row_count)
+                    )
                 # shift counter
-                self.row_id += self.row_id + row_count * len(data['tables'])
+                self.row_id += self.row_id + row_count * len(tables)
 
                 project_name = step.namespace
                 predictor_name = step.predictor.parts[0]
 
-                where_data = []
-                for row in steps_data[step.dataframe.step_num]['values']:
-                    new_row = {}
-                    for table_name in row:
-                        keys_intersection = set(new_row) & set(row[table_name])
-                        if len(keys_intersection) > 0:
-                            raise ErLogicError(
-                                f'The predictor got two identical keys from different datasources: {keys_intersection}'
-                            )
-                        new_row.update(row[table_name])
-                    where_data.append(new_row)
+                columns_keys = set()
+                for table in tables:
+                    table_keys = set(
+                        (col.name, col.alias)
+                        for _, col in data.find_columns(table)
+                    )
+                    keys_intersection = columns_keys & table_keys
+                    if len(keys_intersection) > 0:
+                        raise ErLogicError(
+                            f'The predictor got two identical keys from different datasources: {keys_intersection}'
+                        )
+                    columns_keys.update(table_keys)
 
-                where_data = [{key[1]: value for key, value in row.items()} for row in where_data]
+                where_df = data.get_raw_df().copy(deep=False)
+                where_df.columns = [col.alias for col in data.columns]
 
                 predictor_metadata = {}
                 for pm in self.predictor_metadata:
@@ -960,57 +1220,51 @@ class SQLQuery():
                     else:
                         # normal mode -- emit a forecast ($HORIZON data points on each) for each provided timestamp
                         _mdb_forecast_offset = None
-                    for row in where_data:
-                        if '__mdb_forecast_offset' not in row:
-                            row['__mdb_forecast_offset'] = _mdb_forecast_offset
+                    if '__mdb_forecast_offset' not in where_df.columns:
+                        where_df['__mdb_forecast_offset'] = _mdb_forecast_offset
 
-                # for row in where_data:
-                #     for key in row:
-                #         if isinstance(row[key], datetime.date):
-                #             row[key] = str(row[key])
+                where_data = where_df.to_dict(orient='records')
 
                 table_name = get_preditor_alias(step, self.database)
-                columns_collection = ColumnsCollection()
-                dn = self.datahub.get(self.mindsdb_database_name)
                 project_datanode = self.datahub.get(project_name)
                 if len(where_data) == 0:
-                    cols = project_datanode.get_table_columns(predictor_name) + ['__mindsdb_row_id']
-                    for col in cols:
-                        columns_collection.add(table_name, (col, col))
-                    values = []
-                else:
+                    columns = project_datanode.get_table_columns(predictor_name) + ['__mindsdb_row_id']
+                    predictions = []
+                elif is_timeseries:
+                    # rows of timeseries are predicted together, cache whole input
                     predictor_id = predictor_metadata['id']
                     key = f'{predictor_name}_{predictor_id}_{json_checksum(where_data)}'
-                    data = predictor_cache.get(key)
+                    predictions = predictor_cache.get(key)
 
-                    if data is None:
-                        data = project_datanode.predict(
+                    if predictions is None:
+                        predictions = project_datanode.predict(
                             model_name=predictor_name,
                             data=where_data
                         )
-                        if data is not None and isinstance(data, list):
-                            predictor_cache.set(key, data)
+                        if predictions is not None and isinstance(predictions, list):
+                            predictor_cache.set(key, predictions)
+                else:
+                    predictions = self._predict_rows_cached(
+                        project_datanode, predictor_name, predictor_metadata, where_df, where_data
+                    )
 
-                    if len(data) > 0:
-                        row = data[0]
-                        for key in row.keys():
-                            columns_collection.add(table_name, (key, key))
+                if len(where_data) > 0:
+                    columns = []
+                    if len(predictions) > 0:
+                        columns = list(predictions[0].keys())
 
                     # apply filter
                     if is_timeseries:
-                        data = self.apply_ts_filter(data, where_data, step, predictor_metadata)
-
-                    data = [{(key, key): value for key, value in row.items()} for row in data]
-
-                    values = [{table_name: x} for x in data]
-
-                data = {
-                    'values': values,
-                    'columns': columns_collection,
-                    'tables': [table_name],
-                    'types': {table_name: self.model_types},
-                    'is_prediction': True  # for join step
-                }
+                        predictions = self.apply_ts_filter(predictions, where_data, step, predictor_metadata)
+
+                data = ResultSet.from_df(
+                    pd.DataFrame(predictions, columns=columns),
+                    database=table_name[0],
+                    table_name=table_name[1],
+                    table_alias=table_name[2],
+                    types=self.model_types,
+                    is_prediction=True  # for join step
+                )
             except Exception as e:
                 raise SqlApiUnknownError(f'error in apply predictor step: {e}') from e
         elif type(step) == JoinStep:
@@ -1026,98 +1280,66 @@ class SQLQuery():
                 #     is_timeseries = True
 
                 if step.query.condition is not None:
-                    raise ErNotSupportedYet('At this moment supported only JOIN without condition')
+                    return self._join_by_condition(left_data, right_data, step.query)
 
-                if len(left_data['tables']) == 0 or len(right_data['tables']) == 0:
+                left_tables = left_data.get_tables()
+                right_tables = right_data.get_tables()
+
+                if len(left_tables) == 0 or len(right_tables) == 0:
                     raise ErLogicError('Table for join is not found')
 
                 if (
-                        len(left_data['tables']) != 1 or len(right_data['tables']) != 1
-                        or left_data['tables'][0] == right_data['tables'][0]
+                        len(left_tables) != 1 or len(right_tables) != 1
+                        or left_tables[0] == right_tables[0]
                 ):
                     raise ErNotSupportedYet('At this moment supported only JOIN of two different tables')
 
-                data = {
-                    'values': [],
-                    'columns': ColumnsCollection(),
-                    'tables': list(set(left_data['tables'] + right_data['tables'])),
-                    'types': {}
-                }
-
-                for data_part in [left_data, right_data]:
-                    data['columns'].extend(data_part['columns'])
-                    for table_name in data_part['columns'].tables():
-                        if table_name not in data['types']:
-                            data['types'][table_name] = {}
-                        if table_name not in data['columns'].tables():
-                            data['types'][table_name] = data_part.get('types', {}).get(table_name, {}).copy()
-                        else:
-                            data['types'][table_name].update(data_part.get('types', {}).get(table_name, {}))
-                data['columns'].del_duplicate_columns()
-
-                left_key = left_data['tables'][0]
-                right_key = right_data['tables'][0]
+                left_key = left_tables[0]
+                right_key = right_tables[0]
 
-                left_columns_map = OrderedDict()
-                left_columns_map_reverse = OrderedDict()
-                for i, column_name in enumerate(left_data['columns'].table_columns(left_key)):
-                    left_columns_map[f'a{i}'] = column_name
-                    left_columns_map_reverse[column_name] = f'a{i}'
-
-                right_columns_map = {}
-                right_columns_map_reverse = {}
-                for i, column_name in enumerate(right_data['columns'].table_columns(right_key)):
-                    right_columns_map[f'b{i}'] = column_name
-                    right_columns_map_reverse[column_name] = f'b{i}'
-
-                left_df_data = []
-                for row in left_data['values']:
-                    row = row[left_key]
-                    left_df_data.append({left_columns_map_reverse[key]: value for key, value in row.items()})
-
-                right_df_data = []
-                for row in right_data['values']:
-                    row = row[right_key]
-                    right_df_data.append({right_columns_map_reverse[key]: value for key, value in row.items()})
+                left_row_id = left_data.get_column_index(Column(
+                    name='__mindsdb_row_id',
+                    database=left_key[0],
+                    table_name=left_key[1],
+                    table_alias=left_key[2]
+                ))
+                right_row_id = right_data.get_column_index(Column(
+                    name='__mindsdb_row_id',
+                    database=right_key[0],
+                    table_name=right_key[1],
+                    table_alias=right_key[2]
+                ))
 
-                df_a = pd.DataFrame(left_df_data, columns=left_columns_map.keys())
-                df_b = pd.DataFrame(right_df_data, columns=right_columns_map.keys())
+                df_a = left_data.get_raw_df().copy(deep=False)
+                df_a.columns = [f'a{i}' for i in range(len(left_data.columns))]
+                df_b = right_data.get_raw_df().copy(deep=False)
+                df_b.columns = [f'b{i}' for i in range(len(right_data.columns))]
 
                 a_name = 'table_a'
                 b_name = 'table_b'
-                con = duckdb.connect(database=':memory:')
-                con.register(a_name, df_a)
-                con.register(b_name, df_b)
 
                 join_type = step.query.join_type.lower()
                 if join_type == 'join':
                     # join type is not specified. using join to prediction data
-                    if left_data.get('is_prediction'):
+                    if left_data.is_prediction:
                         join_type = 'left join'
-                    elif right_data.get('is_prediction'):
+                    elif right_data.is_prediction:
                         join_type = 'right join'
 
-                resp_df = con.execute(f"""
+                resp_df, _ = self.duck_context.execute(f"""
                     SELECT * FROM {a_name} as ta {join_type} {b_name} as tb
-                    ON ta.{left_columns_map_reverse[('__mindsdb_row_id', '__mindsdb_row_id')]}
-                     = tb.{right_columns_map_reverse[('__mindsdb_row_id', '__mindsdb_row_id')]}
-                """).fetchdf()
-                con.unregister(a_name)
-                con.unregister(b_name)
-                con.close()
+                    ON ta.a{left_row_id} = tb.b{right_row_id}
+                """, {a_name: df_a, b_name: df_b})
 
                 resp_df = resp_df.replace({np.nan: None})
-                resp_dict = resp_df.to_dict(orient='records')
 
-                for row in resp_dict:
-                    new_row = {left_key: {}, right_key: {}}
-                    for key, value in row.items():
-                        if key.startswith('a'):
-                            new_row[left_key][left_columns_map[key]] = value
-                        else:
-                            new_row[right_key][right_columns_map[key]] = value
-                    data['values'].append(new_row)
+                data = ResultSet(
+                    columns=left_data.columns + right_data.columns,
+                    df=resp_df.set_axis(range(len(resp_df.columns)), axis=1)
+                )
 
+            except SqlApiException as e:
+                raise e
             except Exception as e:
                 raise SqlApiUnknownError(f'error in join step: {e}') from e
 
@@ -1127,36 +1349,21 @@ class SQLQuery():
             # dicts to look up column and table
             column_idx = {}
             tables_idx = {}
-            col_table_idx = {}
 
             # prepare columns for dataframe. column name contains table name
-            cols = set()
-            for table, col_list in step_data['columns'].group_by_table():
-                _, t_name, t_alias = table
-
-                tables_idx[t_name] = t_name
-                tables_idx[t_alias] = t_name
-                for column in col_list:
-                    # table_column
-                    c_name, c_alias = column
-
-                    col_name = f'{t_name}^{c_name}'
-                    cols.add(col_name)
-
-                    col_table_idx[col_name] = (table, column)
-                    column_idx[c_name] = t_name
-
-            # prepare dict for dataframe
-            result = []
-            for row in step_data['values']:
-                data_row = {}
-                for table, col_list in step_data['columns'].group_by_table():
-                    for col in col_list:
-                        col_name = f'{table[1]}^{col[0]}'
-                        data_row[col_name] = row[table][col]
-                result.append(data_row)
-
-            df = pd.DataFrame(result, columns=list(cols))
+            df = pd.DataFrame(index=step_data.get_raw_df().index)
+            for i, column in enumerate(step_data.columns):
+                tables_idx[column.table_name] = column.table_name
+                tables_idx[column.table_alias] = column.table_name
+                column_idx[column.name] = column.table_name
+
+                col_name = f'{column.table_name}^{column.name}'
+                if col_name not in df.columns:
+                    df[col_name] = step_data.get_column_values(i)
+
+            # position of row is used to take filtered rows from original data
+            row_index_col = '__mindsdb_row_index'
+            df[row_index_col] = np.arange(len(df))
 
             # analyze condition and change name of columns
             def check_fields(node, is_table=None, **kwargs):
@@ -1182,61 +1389,43 @@ class SQLQuery():
             where_query = step.query
             query_traversal(where_query, check_fields)
 
-            query = Select(targets=[Star()], from_table=Identifier('df'), where=where_query)
-
-            res = query_df(df, query)
-
-            resp_dict = res.to_dict(orient='records')
+            query = Select(
+                targets=[Identifier(row_index_col)],
+                from_table=Identifier('df'),
+                where=where_query
+            )
 
-            # convert result to dict-dict structure
-            values = []
-            for row in resp_dict:
-                value = {}
-                for key, v in row.items():
-                    # find original table and col
-                    table, column = col_table_idx[key]
-                    if table not in value:
-                        value[table] = {}
-                    value[table][column] = v
+            res = query_df(df, query, duck_context=self.duck_context)
 
-                values.append(value)
-
-            data = {
-                'tables': step_data['tables'],
-                'columns': step_data['columns'],
-                'values': values,
-                'types': step_data.get('types', {})
-            }
+            data = step_data.take(res[row_index_col].to_numpy(dtype=int))
 
         elif type(step) == LimitOffsetStep:
             try:
                 step_data = steps_data[step.dataframe.step_num]
-                data = {
-                    'values': step_data['values'].copy(),
-                    'columns': step_data['columns'].copy(),
-                    'tables': step_data['tables'].copy(),
-                    'types': step_data.get('types', {}).copy(),
-                }
+
+                start, stop = None, None
                 if isinstance(step.offset, Constant) and isinstance(step.offset.value, int):
-                    data['values'] = data['values'][step.offset.value:]
+                    start = step.offset.value
                 if isinstance(step.limit, Constant) and isinstance(step.limit.value, int):
-                    data['values'] = data['values'][:step.limit.value]
+                    stop = step.limit.value if start is None else start + step.limit.value
+
+                data = step_data.slice(start, stop)
             except Exception as e:
                 raise SqlApiUnknownError(f'error in limit offset step: {e}') from e
         elif type(step) == ProjectStep:
             try:
                 step_data = steps_data[step.dataframe.step_num]
 
-                columns = ColumnsCollection()
+                indexes = []
+                columns = []
                 for column_identifier in step.columns:
                     if type(column_identifier) == Star:
-                        for table_name, table_columns_list in step_data['columns'].group_by_table():
-                            for column in table_columns_list:
-                                columns.add(table_name, column)
+                        for i, column in enumerate(step_data.columns):
+                            indexes.append(i)
+                            columns.append(column)
 
                     elif type(column_identifier) == Identifier:
                         appropriate_table = None
-                        columns_to_copy = None
 
                         column_name_parts = column_identifier.parts
                         column_alias = column_identifier.parts[-1] if column_identifier.alias is None else '.'.join(
@@ -1247,11 +1436,11 @@ class SQLQuery():
                         elif len(column_name_parts) == 1:
                             column_name = column_name_parts[0]
 
-                            for table_name, table_columns in step_data['columns'].group_by_table():
+                            for table_name in step_data.get_tables():
                                 table_col_idx = {}
-                                for x in table_columns:
-                                    name = x[1] or x[0]
-                                    table_col_idx[name] = x
+                                for i, x in step_data.find_columns(table_name):
+                                    name = x.alias or x.name
+                                    table_col_idx[name] = (i, x)
 
                                 column_exists = get_column_in_case(list(table_col_idx.keys()), column_name)
                                 if column_exists:
@@ -1260,12 +1449,10 @@ class SQLQuery():
                                             f'Found multiple appropriate tables for column {column_name}')
                                     else:
                                         appropriate_table = table_name
-                                        new_col = (column_name, column_alias)
-                                        cur_col = table_col_idx[column_exists]
+                                        i, cur_col = table_col_idx[column_exists]
 
-                                        columns.add(appropriate_table, new_col)
-                                        if cur_col != new_col:
-                                            columns_to_copy = cur_col, new_col
+                                        indexes.append(i)
+                                        columns.append(cur_col.copy(name=column_name, alias=column_alias))
                                         break
 
                             if appropriate_table is None:
@@ -1275,32 +1462,30 @@ class SQLQuery():
                             table_name_or_alias = column_name_parts[0]
                             column_name = column_name_parts[1]
 
-                            for table_name, table_columns in step_data['columns'].group_by_table():
+                            for table_name in step_data.get_tables():
                                 checking_table_name_or_alias = table_name[2] or table_name[1]
                                 if table_name_or_alias.lower() == checking_table_name_or_alias.lower():
                                     # support select table.*
                                     if isinstance(column_name, Star):
                                         # add all by table
                                         appropriate_table = table_name
-                                        for column in step_data['columns'].table_columns(appropriate_table):
-                                            columns.add(appropriate_table, column)
+                                        for i, column in step_data.find_columns(appropriate_table):
+                                            indexes.append(i)
+                                            columns.append(column)
                                         break
 
                                     table_col_idx = {}
-                                    for x in table_columns:
-                                        name = x[1] or x[0]
-                                        table_col_idx[name] = x
+                                    for i, x in step_data.find_columns(table_name):
+                                        name = x.alias or x.name
+                                        table_col_idx[name] = (i, x)
 
                                     column_exists = get_column_in_case(list(table_col_idx.keys()), column_name)
                                     if column_exists:
                                         appropriate_table = table_name
-                                        new_col = (column_name, column_alias)
-                                        cur_col = table_col_idx[column_exists]
-
-                                        columns.add(appropriate_table, new_col)
-                                        if cur_col != new_col:
-                                            columns_to_copy = cur_col, new_col
+                                        i, cur_col = table_col_idx[column_exists]
 
+                                        indexes.append(i)
+                                        columns.append(cur_col.copy(name=column_name, alias=column_alias))
                                         break
                                     else:
                                         raise ErLogicError(f'Can not find column "{column_name}" in table "{table_name}"')
@@ -1309,21 +1494,10 @@ class SQLQuery():
                         else:
                             raise ErSqlWrongArguments('Undefined column name')
 
-                        if columns_to_copy is not None:
-                            col_from, col_to = columns_to_copy
-                            for row in step_data['values']:
-                                row[appropriate_table][col_to] = row[appropriate_table][col_from]
-                            # TODO copy types?
-
                     else:
                         raise ErKeyColumnDoesNotExist(f'Unknown column type: {column_identifier}')
 
-                data = {
-                    'tables': step_data['tables'],
-                    'columns': columns,
-                    'values': step_data['values'],  # TODO keep values only for columns
-                    'types': step_data.get('types', {})
-                }
+                data = step_data.select(indexes, columns=columns)
             except Exception as e:
                 if isinstance(e, SqlApiException):
                     raise e
@@ -1331,67 +1505,27 @@ class SQLQuery():
         elif type(step) == GroupByStep:
             step_data = steps_data[step.dataframe.step_num]
 
-            result = []
-            cols = set()
-            for _, col_list in step_data['columns'].group_by_table():
-                for col in col_list:
-                    cols.add(col[1])
-
-            for row in step_data['values']:
-                data_row = {}
-                for table, col_list in step_data['columns'].group_by_table():
-                    for col in col_list:
-                        data_row[col[1]] = row[table][col]
-                result.append(data_row)
-
-            df = pd.DataFrame(result, columns=list(cols))
+            # columns are accessed by alias
+            df = pd.DataFrame(index=step_data.get_raw_df().index)
+            for i, column in enumerate(step_data.columns):
+                if column.alias not in df.columns:
+                    df[column.alias] = step_data.get_column_values(i)
 
             query = Select(targets=step.targets, from_table='df', group_by=step.columns).to_string()
-            res = query_df(df, query)
-
-            resp_dict = res.to_dict(orient='records')
+            res = query_df(df, query, duck_context=self.duck_context)
 
             # stick all columns to first table
-            appropriate_table = step_data['tables'][0]
-
-            columns_list = []
-            columns = []
-            for key, dtyp in res.dtypes.items():
-                columns_list.append(
-                    Column(database=appropriate_table[0],
-                           table_name=appropriate_table[1],
-                           table_alias=appropriate_table[2],
-                           name=key,
-                           type=dtyp,
-                           alias=key)
-                )
-                columns.append((key, key))
+            appropriate_table = step_data.get_tables()[0]
 
-            values = []
-            for row in resp_dict:
-                row2 = {
-                    (key, key): value
-                    for key, value in row.items()
-                }
-
-                values.append(
-                    {
-                        appropriate_table: row2
-                    }
-                )
+            data = ResultSet.from_df(
+                res,
+                database=appropriate_table[0],
+                table_name=appropriate_table[1],
+                table_alias=appropriate_table[2]
+            )
 
             # columns are changed
-            self.columns_list = columns_list
-            types = step_data.get('types', {})
-            columns_collection = ColumnsCollection()
-            for column in columns:
-                columns_collection.add(appropriate_table, column)
-            data = {
-                'tables': [appropriate_table],
-                'columns': columns_collection,
-                'values': values,
-                'types': types  # copy
-            }
+            self.columns_list = data.columns.copy()
 
         elif type(step) == SubSelectStep:
             step_data = steps_data[step.dataframe.step_num]
@@ -1402,21 +1536,15 @@ class SQLQuery():
             else:
                 table_name = table_name
 
-            result = ResultSet()
-            result.from_step_data(step_data)
-
             query = step.query
             query.from_table = Identifier('df_table')
 
-            df = result.to_df()
-            res = query_df(df, query)
+            df = step_data.to_df()
+            res = query_df(df, query, duck_context=self.duck_context)
 
-            result2 = ResultSet()
             # get database from first column
-            database = result.columns[0].database
-            result2.from_df(res, database, table_name)
-
-            data = result2.to_step_data()
+            database = step_data.columns[0].database
+            data = ResultSet.from_df(res, database, table_name)
 
         elif type(step) == SaveToTable or type(step) == InsertToTable:
             is_replace = False
@@ -1438,89 +1566,65 @@ class SQLQuery():
                 raise ErNotSupportedYet(f"Creating table in '{integration_name}' is not supporting")
 
             # region del 'service' columns
-            new_columns = ColumnsCollection()
-            for table, column in step_data['columns']:
-                if column[-1] not in ('__mindsdb_row_id', '__mdb_forecast_offset'):
-                    new_columns.add(table, column)
-            step_data['columns'] = new_columns
+            indexes = [
+                i for i, column in enumerate(step_data.columns)
+                if column.alias not in ('__mindsdb_row_id', '__mdb_forecast_offset')
+            ]
             # endregion
 
             # region del columns filtered at projection step
             if self.columns_list is not None:
                 filtered_column_names = [x.name for x in self.columns_list]
-                new_table_columns = ColumnsCollection()
-                for table, column in step_data['columns']:
-                    if column[0].startswith('predictor.'):
-                        new_table_columns.append(column)
-                    elif column[0] in filtered_column_names:
-                        new_table_columns.append(column)
-                    step_data['columns'] = new_table_columns
+                indexes = [
+                    i for i in indexes
+                    if step_data.columns[i].name.startswith('predictor.')
+                    or step_data.columns[i].name in filtered_column_names
+                ]
             # endregion
 
+            columns = [step_data.columns[i] for i in indexes]
+
             # drop double names
-            col_names = set()
-            if len(step_data['tables']) > 1:
+            if len(step_data.get_tables()) > 1:
                 # set prefixes for column if it doubled
-
-                for table in step_data['tables']:
-                    table_name = table[1]
-                    col_map = []
-                    col_list = []
-                    for column in step_data['columns'].table_columns(table):
-                        alias = column[1]
-                        if alias not in col_names:
-                            col_names.add(alias)
-                            col_list.append(column)
-                        else:
-                            column_new = (f'{table_name}.{column[0]}', f'{table_name}.{column[1]}')
-                            col_list.append(column_new)
-                            col_map.append([column, column_new])
-
-                    # replace columns
-                    step_data['columns'].del_table_columns(table)
-                    for column in col_list:
-                        step_data['columns'].add(table, column)
-
-                    # replace in values
-                    for row in step_data['values']:
-                        table_row = row[table]
-
-                        for column, column_new in col_map:
-                            table_row[column_new] = table_row.pop(column)
+                col_names = set()
+                for i, column in enumerate(columns):
+                    if column.alias not in col_names:
+                        col_names.add(column.alias)
+                    else:
+                        columns[i] = column.copy(
+                            name=f'{column.table_name}.{column.name}',
+                            alias=f'{column.table_name}.{column.alias}'
+                        )
 
             dn.create_table(
                 table_name_parts=table_name_parts,
-                columns=step_data['columns'],
-                data=step_data['values'],
+                result_set=step_data.select(indexes, columns=columns),
                 is_replace=is_replace,
                 is_create=is_create
             )
             data = None
         elif type(step) == UpdateToTable:
 
-            step_data = step.dataframe.result_data
+            result = step.dataframe.result_data
             integration_name = step.table.parts[0]
             table_name_parts = step.table.parts[1:]
 
             dn = self.datahub.get(integration_name)
 
-            result = ResultSet()
-            result.from_step_data(step_data)
-
-            # link nodes with parameters for fast replacing with values
+            # replace fields of input table with parameters
             input_table_alias = step.update_command.from_select_alias.parts[0]
 
-            params_map_index = []
+            params_names = []
 
-            def prepare_map_index(node, is_table, **kwargs):
+            def prepare_params(node, is_table, **kwargs):
                 if isinstance(node, Identifier) and not is_table:
                     # is input table field
                     if node.parts[0] == input_table_alias:
-                        node2 = Constant(None)
                         param_name = node.parts[-1]
-                        params_map_index.append([param_name, node2])
-                        # replace node with constant
-                        return node2
+                        if param_name not in params_names:
+                            params_names.append(param_name)
+                        return Parameter(param_name)
                     elif node.parts[0] == table_name_parts[0]:
                         # remove updated table alias
                         node.parts = node.parts[1:]
@@ -1528,35 +1632,154 @@ class SQLQuery():
             # make command
             update_query = Update(
                 table=Identifier(parts=table_name_parts),
-                update_columns=step.update_command.update_columns,
-                where=step.update_command.where
+                update_columns=copy.deepcopy(step.update_command.update_columns),
+                where=copy.deepcopy(step.update_command.where)
             )
             # do mapping
-            query_traversal(update_query, prepare_map_index)
+            query_traversal(update_query, prepare_params)
 
             # check all params is input data:
             data_header = [col.alias for col in result.columns]
 
-            for param_name, _ in params_map_index:
+            for param_name in params_names:
                 if param_name not in data_header:
                     raise ErSqlWrongArguments(f'Field {param_name} not found in input data. Input fields: {data_header}')
 
-            # perform update
-            for values in result.records:
-                # run update from every row from input data
+            # perform update for every row from input data
+            params = []
+            for values in result.get_records():
                 row = dict(zip(data_header, values))
+                params.append({name: row[name] for name in params_names})
 
-                # fill params:
-                for param_name, param in params_map_index:
-                    param.value = row[param_name]
-
-                dn.query(query=update_query, session=self.session)
+            dn.query_many(update_query, params)
 
             data = None
         else:
             raise ErLogicError(F'Unknown planner step: {step}')
         return data
 
+    def _predict_rows_cached(self, project_datanode, predictor_name, predictor_metadata, where_df, where_data):
+        """ Predict with cache of separate rows: only not cached rows are sent to predictor.
+            Rows are identified by hash of their values (without __mindsdb_row_id).
+        """
+        row_id_col = '__mindsdb_row_id'
+        hash_df = where_df.drop(columns=[row_id_col], errors='ignore')
+        rows_hashes = dataframe_rows_checksums(hash_df)
+        namespace = (
+            predictor_metadata['id'],
+            predictor_metadata.get('version'),
+            json_checksum(list(hash_df.columns))
+        )
+
+        predictions = predictor_rows_cache.get_many(namespace, rows_hashes)
+        missed = [i for i, row in enumerate(predictions) if row is None]
+
+        if len(missed) > 0:
+            missed_data = where_data
+            if len(missed) < len(where_data):
+                missed_data = [where_data[i] for i in missed]
+            new_predictions = project_datanode.predict(
+                model_name=predictor_name,
+                data=missed_data
+            )
+            if not isinstance(new_predictions, list) or len(new_predictions) != len(missed):
+                # predictions can't be matched with input rows
+                if len(missed) == len(where_data):
+                    return new_predictions
+                return project_datanode.predict(model_name=predictor_name, data=where_data)
+
+            predictor_rows_cache.set_many(namespace, rows_hashes[missed], new_predictions)
+            for i, row in zip(missed, new_predictions):
+                predictions[i] = row
+
+        # cached rows can be from another query: use current row ids
+        result = []
+        for row, input_row in zip(predictions, where_data):
+            row = dict(row)
+            if row_id_col in row:
+                row[row_id_col] = input_row.get(row_id_col)
+            result.append(row)
+        return result
+
+    def _join_by_condition(self, left_data, right_data, join):
+        """ Join two results by condition of join query.
+
+            Identifiers in condition are resolved to columns of left or right result.
+            Join is executed in duckdb: equality conditions are executed as hash join,
+            other predicates are supported as well. Any side can contain several tables
+            (result of previous join).
+        """
+
+        def resolve_column(node):
+            col_name = node.parts[-1].lower()
+            table_name = None
+            if len(node.parts) > 1:
+                table_name = node.parts[-2].lower()
+
+            found = []
+            for prefix, data in (('a', left_data), ('b', right_data)):
+                for i, column in enumerate(data.columns):
+                    if column.name is None or column.name.lower() != col_name:
+                        continue
+                    if table_name is not None and table_name not in (
+                        str(column.table_alias).lower(), str(column.table_name).lower()
+                    ):
+                        continue
+                    found.append(Identifier(parts=[f't{prefix}', f'{prefix}{i}']))
+
+            if len(found) == 0:
+                raise ErKeyColumnDoesNotExist(f'Column not found in join condition: {node}')
+            if len(found) > 1:
+                raise ErLogicError(f'Column is ambiguous in join condition: {node}')
+            return found[0]
+
+        def replace_identifiers(node, is_table=None, **kwargs):
+            if is_table:
+                raise ErNotSupportedYet('Subqueries is not supported in join condition')
+            if isinstance(node, Identifier):
+                return resolve_column(node)
+
+        condition = copy.deepcopy(join.condition)
+        if isinstance(condition, Identifier):
+            condition = resolve_column(condition)
+        else:
+            query_traversal(condition, replace_identifiers)
+
+        df_a = left_data.get_raw_df().copy(deep=False)
+        df_a.columns = [f'a{i}' for i in range(len(left_data.columns))]
+        df_b = right_data.get_raw_df().copy(deep=False)
+        df_b.columns = [f'b{i}' for i in range(len(right_data.columns))]
+
+        table_a = Identifier('table_a', alias=Identifier('ta'))
+        table_b = Identifier('table_b', alias=Identifier('tb'))
+
+        join_type = join.join_type.upper().replace(' OUTER', '')
+        if join_type == 'RIGHT JOIN':
+            # render doesn't support right join: swap tables
+            table_a, table_b = table_b, table_a
+            join_type = 'LEFT JOIN'
+
+        query = Select(
+            targets=[Star()],
+            from_table=Join(
+                left=table_a,
+                right=table_b,
+                join_type=join_type,
+                condition=condition
+            )
+        )
+        query_str = SqlalchemyRender('postgres').get_string(query, with_failback=False)
+
+        resp_df, _ = self.duck_context.execute(query_str, {'table_a': df_a, 'table_b': df_b})
+        # restore order of columns
+        resp_df = resp_df[list(df_a.columns) + list(df_b.columns)]
+        resp_df = resp_df.replace({np.nan: None})
+
+        return ResultSet(
+            columns=left_data.columns + right_data.columns,
+            df=resp_df.set_axis(range(len(resp_df.columns)), axis=1)
+        )
+
     def apply_ts_filter(self, predictor_data, table_data, step, predictor_metadata):
 
         if step.output_time_filter is None:
@@ -1731,26 +1954,22 @@ class SQLQuery():
         return data2
 
     def _make_list_result_view(self, data):
-        if self.outer_query is not None:
-            return data['values']
-        result = []
-        for row in data['values']:
-            data_row = []
-            for column_record in self.columns_list:
-                table_name = (column_record.database, column_record.table_name, column_record.table_alias)
-                column_name = (column_record.name, column_record.alias)
-                if table_name in row is False:
-                    # try without alias
-                    table_name = (table_name[0], table_name[1], None)
-                data_row.append(row[table_name][column_name])
-            result.append(data_row)
-        return result
+        if data is None:
+            return []
+        indexes = [
+            data.get_column_index(column)
+            for column in self.columns_list
+        ]
+        return data.select(indexes).get_records()
 
-    def _make_dict_result_view(self, data):
-        result = []
-        for row in data['values']:
-            data_row = {}
-            for table_name in row:
-                data_row.update(row[table_name])
-            result.append(data_row)
-        return result
+    def _make_dataframe_result_view(self, data):
+        if data is None:
+            return pd.DataFrame([], columns=[
+                col.alias if col.alias is not None else col.name
+                for col in self.columns_list
+            ])
+        indexes = [
+            data.get_column_index(column)
+            for column in self.columns_list
+        ]
+        return data.select(indexes, columns=self.columns_list).to_df()
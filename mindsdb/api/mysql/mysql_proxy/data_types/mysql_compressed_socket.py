@@ -0,0 +1,130 @@
+"""
+*******************************************************
+ * Copyright (C) 2017 MindsDB Inc. <copyright@mindsdb.com>
+ *
+ * This file is part of MindsDB Server.
+ *
+ * MindsDB Server can not be copied and/or distributed without the express
+ * permission of MindsDB Inc
+ *******************************************************
+"""
+
+# https://dev.mysql.com/doc/dev/mysql-server/latest/page_protocol_basic_compression.html
+
+import struct
+import zlib
+
+try:
+    # optional: pip install mindsdb[zstd]
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import MAX_PACKET_SIZE
+
+
+COMPRESSION_ALGORITHM_ZLIB = 'zlib'
+COMPRESSION_ALGORITHM_ZSTD = 'zstd'
+
+# payloads shorter than this are sent without compression
+DEFAULT_MIN_COMPRESS_LENGTH = 50
+DEFAULT_ZLIB_LEVEL = 6
+DEFAULT_ZSTD_LEVEL = 3
+
+
+def is_zstd_available():
+    return zstandard is not None
+
+
+class CompressedSocket:
+    '''
+    Wrapper over socket for compressed protocol.
+    Packets are using it as regular socket (sendall, recv), and it adds compressed packets layer:
+
+        3 bytes: length of compressed payload
+        1 byte: compressed sequence number
+        3 bytes: length of payload before compression, 0 if payload is not compressed
+    '''
+
+    def __init__(self, socket, algorithm=COMPRESSION_ALGORITHM_ZLIB, level=None,
+                 min_length=DEFAULT_MIN_COMPRESS_LENGTH):
+        self.socket = socket
+        self.algorithm = algorithm
+        self.min_length = min_length
+        # sequence number of compressed packets. Client starts every command from 0
+        self.seq = 0
+        self._buffer = bytearray()
+
+        if algorithm == COMPRESSION_ALGORITHM_ZSTD:
+            if zstandard is None:
+                raise Exception('zstandard is not installed')
+            self._compressor = zstandard.ZstdCompressor(level=level or DEFAULT_ZSTD_LEVEL)
+            self._decompressor = zstandard.ZstdDecompressor()
+        elif algorithm == COMPRESSION_ALGORITHM_ZLIB:
+            self.level = level or DEFAULT_ZLIB_LEVEL
+        else:
+            raise Exception(f'Unknown compression algorithm: {algorithm}')
+
+    def __getattr__(self, name):
+        # other methods of socket
+        return getattr(self.socket, name)
+
+    def compress(self, payload):
+        if self.algorithm == COMPRESSION_ALGORITHM_ZSTD:
+            return self._compressor.compress(payload)
+        return zlib.compress(payload, self.level)
+
+    def decompress(self, payload, length):
+        if self.algorithm == COMPRESSION_ALGORITHM_ZSTD:
+            return self._decompressor.decompress(payload, max_output_size=length)
+        return zlib.decompress(payload)
+
+    def sendall(self, data):
+        view = memoryview(data)
+        for offset in range(0, len(view), MAX_PACKET_SIZE):
+            self._send_packet(view[offset:offset + MAX_PACKET_SIZE])
+
+    def _send_packet(self, payload):
+        uncompressed_length = 0
+        if len(payload) >= self.min_length:
+            compressed = self.compress(payload)
+            # send compressed only if it is smaller
+            if len(compressed) < len(payload):
+                uncompressed_length = len(payload)
+                payload = compressed
+
+        header = struct.pack('<II', len(payload) | (self.seq << 24), uncompressed_length)[:7]
+        self.socket.sendall(header + bytes(payload))
+        self.seq = (self.seq + 1) % 256
+
+    def _recv_exactly(self, size):
+        data = b''
+        while len(data) < size:
+            chunk = self.socket.recv(size - len(data))
+            if len(chunk) == 0:
+                break
+            data += chunk
+        return data
+
+    def _read_packet(self):
+        header = self._recv_exactly(7)
+        if len(header) < 7:
+            return False
+        length = int.from_bytes(header[:3], 'little')
+        seq = header[3]
+        uncompressed_length = int.from_bytes(header[4:7], 'little')
+
+        payload = self._recv_exactly(length)
+        if uncompressed_length > 0:
+            payload = self.decompress(payload, uncompressed_length)
+        self._buffer += payload
+        self.seq = (seq + 1) % 256
+        return True
+
+    def recv(self, size):
+        while len(self._buffer) < size:
+            if self._read_packet() is False:
+                break
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
@@ -11,7 +11,9 @@
 import math
 import struct
 
-from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import ONE_BYTE_ENC, TWO_BYTE_ENC, THREE_BYTE_ENC, NULL_VALUE, DEFAULT_CAPABILITIES
+from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import (
+    ONE_BYTE_ENC, TWO_BYTE_ENC, THREE_BYTE_ENC, EIGHT_BYTE_ENC, NULL_VALUE, DEFAULT_CAPABILITIES
+)
 from mindsdb.api.mysql.mysql_proxy.utilities import log
 
 
@@ -104,7 +106,7 @@ class Datum():
         if byte_count <= 3:
             return THREE_BYTE_ENC + struct.pack('i', value)[:3]
         if byte_count <= 8:
-            return THREE_BYTE_ENC + struct.pack('Q', value)[:8]
+            return EIGHT_BYTE_ENC + struct.pack('Q', value)[:8]
 
     def toStringPacket(self):
         if self.type == 'string<packet>':
@@ -153,7 +155,7 @@ class Datum():
                 if byte_count <= 3:
                     return THREE_BYTE_ENC + struct.pack('i', val_len)[:3] + bytes(value, 'utf-8')
                 if byte_count <= 8:
-                    return THREE_BYTE_ENC + struct.pack('Q', val_len)[:8] + bytes(value, 'utf-8')
+                    return EIGHT_BYTE_ENC + struct.pack('Q', val_len)[:8] + bytes(value, 'utf-8')
 
 
 def test():
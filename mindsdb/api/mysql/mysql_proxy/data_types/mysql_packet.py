@@ -14,6 +14,41 @@ import struct
 from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import MAX_PACKET_SIZE
 
 
+def frame_packets(bodies, seq=0):
+    """ Add headers to bodies of packets and write them to one buffer.
+        Bodies longer than MAX_PACKET_SIZE are split to several packets
+
+        Args:
+            bodies: list of bytes
+            seq (int): sequence number of first packet
+        Returns:
+            bytearray with packets and sequence number of the next packet
+    """
+    # every packet has 4 bytes header
+    total_size = sum(
+        len(body) + 4 * (len(body) // MAX_PACKET_SIZE + 1)
+        for body in bodies
+    )
+    buffer = bytearray(total_size)
+    view = memoryview(buffer)
+    pos = 0
+    for body in bodies:
+        length = len(body)
+        offset = 0
+        while True:
+            chunk_length = min(length - offset, MAX_PACKET_SIZE)
+            # 3 bytes of length and 1 byte of sequence number
+            struct.pack_into('<I', buffer, pos, chunk_length | (seq << 24))
+            pos += 4
+            view[pos:pos + chunk_length] = body[offset:offset + chunk_length]
+            pos += chunk_length
+            offset += chunk_length
+            seq = (seq + 1) % 256
+            if chunk_length < MAX_PACKET_SIZE:
+                break
+    return buffer, seq
+
+
 class Packet:
     def __init__(self, length=0, body='', packet_string=None, socket=None, session=None, proxy=None, **kwargs):
         self.mysql_socket = socket
@@ -11,13 +11,208 @@
 import datetime as dt
 import struct
 
+import numpy as np
 import pandas as pd
 
 from mindsdb.api.mysql.mysql_proxy.data_types.mysql_datum import Datum
-from mindsdb.api.mysql.mysql_proxy.data_types.mysql_packet import Packet
+from mindsdb.api.mysql.mysql_proxy.data_types.mysql_packet import Packet, frame_packets
+from mindsdb.api.mysql.mysql_proxy.data_types.mysql_packets.resultset_row_package import encode_lenenc_column
 from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import (NULL_VALUE, TYPES)
 
 
+# numeric codecs: numpy little-endian dtype and python type to cast values
+NUMERIC_CODECS = {
+    TYPES.MYSQL_TYPE_DOUBLE: ('<f8', float),
+    TYPES.MYSQL_TYPE_FLOAT: ('<f4', float),
+    TYPES.MYSQL_TYPE_LONGLONG: ('<i8', int),
+    TYPES.MYSQL_TYPE_LONG: ('<i4', int),
+    TYPES.MYSQL_TYPE_YEAR: ('<i2', int),
+}
+
+DATE_TYPES = (
+    TYPES.MYSQL_TYPE_DATE,
+    TYPES.MYSQL_TYPE_TIMESTAMP,
+    TYPES.MYSQL_TYPE_DATETIME
+)
+
+# length byte, year, month, day
+DATE_DTYPE = np.dtype([
+    ('len', 'u1'), ('year', '<u2'), ('month', 'u1'), ('day', 'u1')
+])
+# + hour, minute, second, microsecond
+DATETIME_DTYPE = np.dtype(DATE_DTYPE.descr + [
+    ('hour', 'u1'), ('minute', 'u1'), ('second', 'u1'), ('microsecond', '<u4')
+])
+
+
+def _split_bytes(buffer, item_size):
+    return [buffer[i:i + item_size] for i in range(0, len(buffer), item_size)]
+
+
+def _is_missing_number(val):
+    # NaN, NaT and NA of pandas/numpy are sent as NULL
+    return pd.api.types.is_scalar(val) and pd.isna(val)
+
+
+def _out_of_range(arr, dtype):
+    """ mask of values which can't be converted to dtype without overflow """
+    if np.dtype(dtype).kind == 'f':
+        if np.dtype(dtype).itemsize == 8:
+            return np.zeros(len(arr), dtype=bool)
+        return np.isfinite(arr) & (np.abs(arr) > np.finfo(dtype).max)
+    info = np.iinfo(dtype)
+    if arr.dtype.kind == 'f':
+        # bounds are powers of 2: exact in float64
+        return ~np.isfinite(arr) | (arr < info.min) | (arr >= float(info.max + 1))
+    return (arr < info.min) | (arr > info.max)
+
+
+def _encode_numeric_column(values, is_null, col_type):
+    dtype, cast = NUMERIC_CODECS[col_type]
+    for i, val in enumerate(values):
+        if not is_null[i] and _is_missing_number(val):
+            is_null[i] = True
+    values = [0 if null else val for val, null in zip(values, is_null)]
+    try:
+        if cast is int and all(type(val) is int for val in values):
+            arr = np.array(values, dtype=np.int64)
+        else:
+            # the same conversion as float(val) / int(float(val)) for every value
+            arr = np.array(values, dtype=np.float64)
+            if cast is int:
+                arr = np.trunc(arr)
+    except (ValueError, TypeError, OverflowError) as e:
+        raise Exception(f'Column values cant be encoded as {dtype}: {e}')
+
+    out_of_range = _out_of_range(arr, dtype)
+    if out_of_range.any():
+        val = values[int(np.argmax(out_of_range))]
+        raise Exception(f'Value {val!r} cant be encoded as {dtype}: out of range')
+    return _split_bytes(arr.astype(dtype).tobytes(), np.dtype(dtype).itemsize)
+
+
+def _is_missing_date(val):
+    # NaT and NaN of pandas/numpy are sent as NULL
+    if val is pd.NaT:
+        return True
+    if isinstance(val, float):
+        return np.isnan(val)
+    if isinstance(val, np.datetime64):
+        return np.isnat(val)
+    return False
+
+
+def _to_datetime(val):
+    """ datetime.datetime from value of date column. Python datetime is used instead
+        of pandas.Timestamp because it covers the whole MySQL range: 0001-01-01 .. 9999-12-31
+    """
+    if isinstance(val, dt.datetime):
+        # including pandas.Timestamp
+        return val
+    if isinstance(val, dt.date):
+        return dt.datetime(val.year, val.month, val.day)
+    if isinstance(val, np.datetime64):
+        return val.astype('datetime64[us]').item()
+    if isinstance(val, str):
+        try:
+            return dt.datetime.fromisoformat(val)
+        except ValueError:
+            return pd.to_datetime(val).to_pydatetime()
+    raise TypeError(f'Unexpected type: {type(val)}')
+
+
+def _encode_date_column(values, is_null, col_type):
+    dtype = DATE_DTYPE if col_type == TYPES.MYSQL_TYPE_DATE else DATETIME_DTYPE
+    fields = dtype.names[1:]
+    empty = (0,) * len(fields)
+
+    records = []
+    for i, val in enumerate(values):
+        if not is_null[i] and _is_missing_date(val):
+            is_null[i] = True
+        if is_null[i]:
+            records.append(empty)
+            continue
+        try:
+            date_value = _to_datetime(val)
+        except (ValueError, TypeError, OverflowError) as e:
+            raise Exception(f'Value {val!r} cant be encoded as date: {e}')
+        records.append(tuple(getattr(date_value, field) for field in fields))
+
+    arr = np.zeros(len(records), dtype=dtype)
+    arr['len'] = dtype.itemsize - 1
+    if len(records) > 0:
+        values = np.array(records, dtype=np.int64)
+        for i, field in enumerate(fields):
+            arr[field] = values[:, i]
+    return _split_bytes(arr.tobytes(), dtype.itemsize)
+
+
+def _null_bitmap(is_null):
+    """ NULL bitmap of binary row has offset 2 bits
+
+        Args:
+            is_null: bool matrix, shape is (rows, columns)
+        Returns:
+            list of bitmaps for every row
+    """
+    rows_count, columns_count = is_null.shape
+    bits = np.zeros((rows_count, columns_count + 2), dtype=bool)
+    bits[:, 2:] = is_null
+    bitmap = np.packbits(bits, axis=1, bitorder='little')
+    return _split_bytes(bitmap.tobytes(), bitmap.shape[1])
+
+
+def encode_binary_rows(columns_data, columns, seq=0):
+    """ Encode batch of rows to BinaryResultsetRow packets (with headers)
+
+        Args:
+            columns_data: column-major data: list of columns values or DataFrame
+            columns (List[dict]): columns definitions with mysql types
+            seq (int): sequence number of first packet
+        Returns:
+            bytearray with packets and sequence number of the next packet
+    """
+    if isinstance(columns_data, pd.DataFrame):
+        columns_data = [columns_data.iloc[:, i].tolist() for i in range(columns_data.shape[1])]
+
+    if len(columns_data) == 0:
+        return bytearray(), seq
+
+    rows_count = len(columns_data[0])
+    is_null = np.zeros((rows_count, len(columns)), dtype=bool)
+
+    columns_cells = []
+    for i, col in enumerate(columns):
+        values = columns_data[i]
+        col_null = np.fromiter((val is None for val in values), dtype=bool, count=rows_count)
+
+        col_type = col['type']
+        if col_type in NUMERIC_CODECS:
+            cells = _encode_numeric_column(values, col_null, col_type)
+        elif col_type in DATE_TYPES:
+            cells = _encode_date_column(values, col_null, col_type)
+        elif col_type in (TYPES.MYSQL_TYPE_TIME, TYPES.MYSQL_TYPE_NEWDECIMAL):
+            raise Exception(f'Column with type {col_type} cant be encripted')
+        else:
+            cells = encode_lenenc_column(values)
+
+        is_null[:, i] = col_null
+        columns_cells.append(cells)
+
+    header = b'\x00'
+    rows = []
+    for row_i, bitmap in enumerate(_null_bitmap(is_null)):
+        row_null = is_null[row_i]
+        rows.append(b''.join([header, bitmap] + [
+            cells[row_i]
+            for cells, null in zip(columns_cells, row_null)
+            if not null
+        ]))
+
+    return frame_packets(rows, seq)
+
+
 class BinaryResultsetRowPacket(Packet):
     '''
     Implementation based on:
@@ -140,5 +335,27 @@ class BinaryResultsetRowPacket(Packet):
         )
 
 
+class BinaryResultsetRowsBatchPacket(Packet):
+    '''
+    Several BinaryResultsetRow packets encoded at once.
+    Input data is column-major: list of columns values or DataFrame
+    '''
+
+    def setup(self):
+        self.data = self._kwargs.get('data', [])
+        self.columns = self._kwargs.get('columns', [])
+
+    def load_from_params(self, length, seq, body):
+        body, next_seq = encode_binary_rows(self.data, self.columns, seq)
+        super().load_from_params(len(body), seq, body)
+        # every row is separate packet. packet factory will increment sequence number once more
+        if self.session is not None:
+            self.session.packet_sequence_number = (next_seq - 1) % 256
+
+    def get_packet_string(self):
+        # body already contains headers of packets
+        return bytes(self._body)
+
+
 if __name__ == "__main__":
     BinaryResultsetRowPacket.test()
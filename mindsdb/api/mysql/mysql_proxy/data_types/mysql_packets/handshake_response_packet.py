@@ -48,6 +48,8 @@ class HandshakeResponsePacket(Packet):
 
         self.client_auth_plugin = Datum('string<NUL>')
 
+        self.zstd_compression_level = None
+
         buffer = body
 
         if len(body) == 32 and body[9:] == (b'\x00' * 23):
@@ -83,10 +85,25 @@ class HandshakeResponsePacket(Packet):
             if capabilities.PLUGIN_AUTH:
                 buffer = self.client_auth_plugin.setFromBuff(buffer)
 
-            # at the end is CLIENT_CONNECT_ATTRS, but we dont use it and dont parse
+            # next is CLIENT_CONNECT_ATTRS, we dont use it: skip
+            if capabilities.CONNECT_ATTRS and len(buffer) > 0:
+                attrs_length, start = self.read_lenenc_int(buffer)
+                buffer = buffer[start + attrs_length:]
+
+            if capabilities.ZSTD_COMPRESSION_ALGORITHM and len(buffer) > 0:
+                self.zstd_compression_level = buffer[0]
 
         self.session.username = self.username.value
 
+    @staticmethod
+    def read_lenenc_int(buffer):
+        # returns value and its length in buffer
+        first_byte = buffer[0]
+        if first_byte < 0xfb:
+            return first_byte, 1
+        size = {0xfc: 2, 0xfd: 3, 0xfe: 8}[first_byte]
+        return int.from_bytes(buffer[1:1 + size], 'little'), 1 + size
+
     def __str__(self):
         return str({
             'header': {'length': self.length, 'seq': self.seq},
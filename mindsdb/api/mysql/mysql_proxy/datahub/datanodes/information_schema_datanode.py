@@ -3,7 +3,7 @@ from functools import partial
 import pandas as pd
 
 from mindsdb_sql.parser.ast.base import ASTNode
-from mindsdb_sql.parser.ast import BinaryOperation, Select, Identifier, Constant
+from mindsdb_sql.parser.ast import BinaryOperation, Select, Identifier, Constant, Tuple
 
 from mindsdb.api.mysql.mysql_proxy.utilities.sql import query_df
 from mindsdb.api.mysql.mysql_proxy.classes.sql_query import get_all_tables
@@ -12,6 +12,7 @@ from mindsdb.api.mysql.mysql_proxy.datahub.datanodes.integration_datanode import
 from mindsdb.api.mysql.mysql_proxy.datahub.datanodes.project_datanode import ProjectDataNode
 from mindsdb.api.mysql.mysql_proxy.datahub.classes.tables_row import TablesRow, TABLES_ROW_TYPE
 from mindsdb.api.mysql.mysql_proxy.utilities import exceptions as exc
+from mindsdb.integrations.libs.metadata_cache import metadata_cache
 
 
 class InformationSchemaDataNode(DataNode):
@@ -185,30 +186,69 @@ class InformationSchemaDataNode(DataNode):
         df = pd.DataFrame(data, columns=columns)
         return df
 
+    @staticmethod
+    def _get_filters(query: ASTNode, columns=('TABLE_SCHEMA', 'TABLE_NAME')) -> dict:
+        """ get values of columns which query is filtered by: 'col = value' or 'col in (values)'
+            joined by 'and' at the top level of 'where'
+
+            Returns:
+                dict: column name -> set of lowercase values
+        """
+        if type(query) != Select or query.where is None:
+            return {}
+
+        filters = {}
+
+        def add_condition(node):
+            if type(node) != BinaryOperation:
+                return
+            if node.op == 'and':
+                for arg in node.args:
+                    add_condition(arg)
+                return
+            if type(node.args[0]) != Identifier:
+                return
+            column_name = node.args[0].parts[-1].upper()
+            if column_name not in columns or column_name in filters:
+                return
+            if node.op == '=' and type(node.args[1]) == Constant:
+                values = [node.args[1].value]
+            elif node.op == 'in' and type(node.args[1]) == Tuple:
+                values = node.args[1].items
+                if not all(type(x) == Constant for x in values):
+                    return
+                values = [x.value for x in values]
+            else:
+                return
+            filters[column_name] = set(str(x).lower() for x in values)
+
+        add_condition(query.where)
+        return filters
+
+    def _get_integration_tables(self, ds_name):
+        ds = self.get(ds_name)
+        rows = []
+        for row in ds.get_tables():
+            row.TABLE_SCHEMA = ds_name
+            rows.append(row.to_list())
+        return rows
+
     def _get_tables(self, query: ASTNode = None):
         columns = self.information_schema['TABLES']
 
-        target_table = None
-        if type(query) == Select and type(query.where) == BinaryOperation and query.where.op == 'and':
-            for arg in query.where.args:
-                if (
-                    type(arg) == BinaryOperation and arg.op == '='
-                    and type(arg.args[0]) == Identifier
-                    and arg.args[0].parts[-1].upper() == 'TABLE_SCHEMA'
-                    and type(arg.args[1]) == Constant
-                ):
-                    target_table = arg.args[1].value
-                    break
+        target_schemas = self._get_filters(query).get('TABLE_SCHEMA')
+
+        def is_skipped(schema_name):
+            return target_schemas is not None and schema_name.lower() not in target_schemas
 
         data = []
-        for name in self.information_schema.keys():
-            if target_table is not None and target_table != name:
-                continue
-            row = TablesRow(TABLE_TYPE=TABLES_ROW_TYPE.SYSTEM_VIEW, TABLE_NAME=name)
-            data.append(row.to_list())
+        if not is_skipped('information_schema'):
+            for name in self.information_schema.keys():
+                row = TablesRow(TABLE_TYPE=TABLES_ROW_TYPE.SYSTEM_VIEW, TABLE_NAME=name)
+                data.append(row.to_list())
 
         for ds_name, ds in self.persis_datanodes.items():
-            if target_table is not None and target_table != ds_name:
+            if is_skipped(ds_name):
                 continue
             ds_tables = ds.get_tables()
             if len(ds_tables) == 0:
@@ -221,22 +261,20 @@ class InformationSchemaDataNode(DataNode):
                 row.TABLE_SCHEMA = ds_name
                 data.append(row.to_list())
 
-        for ds_name in self.get_integrations_names():
-            if target_table is not None and target_table != ds_name:
-                continue
-            if ds_name == 'views':
-                continue
-            try:
-                ds = self.get(ds_name)
-                ds_tables = ds.get_tables()
-                for row in ds_tables:
-                    row.TABLE_SCHEMA = ds_name
-                    data.append(row.to_list())
-            except Exception:
-                print(f"Can't get tables from '{ds_name}'")
+        integrations_names = [
+            ds_name for ds_name in self.get_integrations_names()
+            if ds_name != 'views' and not is_skipped(ds_name)
+        ]
+        integrations_tables = metadata_cache.get_many(
+            self.session.company_id,
+            integrations_names,
+            self._get_integration_tables
+        )
+        for ds_name in integrations_names:
+            data.extend(integrations_tables.get(ds_name, []))
 
         for project_name in self.get_projects_names():
-            if target_table is not None and target_table != project_name:
+            if is_skipped(project_name):
                 continue
             project_dn = self.get(project_name)
             project_tables = project_dn.get_tables()
@@ -311,40 +349,50 @@ class InformationSchemaDataNode(DataNode):
             'float': ['def', 'SCHEMA_NAME', 'TABLE_NAME', 'COLUMN_NAME', 'COL_INDEX', None, 'YES', 'float', None, None, 12, 0, None, None, None, 'float', None, None, 'select', None, None]
         }
 
-        result = []
+        filters = self._get_filters(query)
+        target_schemas = filters.get('TABLE_SCHEMA')
+        target_tables = filters.get('TABLE_NAME')
 
-        for table_name in self.information_schema:
-            table_columns = self.information_schema[table_name]
-            for i, column_name in enumerate(table_columns):
-                result_row = row_templates['text'].copy()
-                result_row[1] = 'information_schema'
-                result_row[2] = table_name
-                result_row[3] = column_name
-                result_row[4] = i
-                result.append(result_row)
+        def is_skipped(schema_name, table_name=None):
+            if target_schemas is not None and schema_name.lower() not in target_schemas:
+                return True
+            if table_name is not None and target_tables is not None and table_name.lower() not in target_tables:
+                return True
+            return False
 
-        mindsdb_dn = self.get('MINDSDB')
-        for table_row in mindsdb_dn.get_tables():
-            table_name = table_row.TABLE_NAME
-            table_columns = mindsdb_dn.get_table_columns(table_name)
+        def add_rows(schema_name, table_name, table_columns):
             for i, column_name in enumerate(table_columns):
                 result_row = row_templates['text'].copy()
-                result_row[1] = 'mindsdb'
+                result_row[1] = schema_name
                 result_row[2] = table_name
                 result_row[3] = column_name
                 result_row[4] = i
                 result.append(result_row)
 
-        files_dn = self.get('FILES')
-        for table_name in files_dn.get_tables():
-            table_columns = files_dn.get_table_columns(table_name)
-            for i, column_name in enumerate(table_columns):
-                result_row = row_templates['text'].copy()
-                result_row[1] = 'files'
-                result_row[2] = table_name
-                result_row[3] = column_name
-                result_row[4] = i
-                result.append(result_row)
+        result = []
+
+        if not is_skipped('information_schema'):
+            for table_name in self.information_schema:
+                if is_skipped('information_schema', table_name):
+                    continue
+                add_rows('information_schema', table_name, self.information_schema[table_name])
+
+        if not is_skipped('mindsdb'):
+            project = self.database_controller.get_project(name='mindsdb')
+            # columns of all models are got at once
+            models_columns = project.get_models_columns()
+            for table_name in project.get_tables():
+                if is_skipped('mindsdb', table_name):
+                    continue
+                add_rows('mindsdb', table_name, models_columns.get(table_name, []))
+
+        if not is_skipped('files'):
+            files_dn = self.get('FILES')
+            for table_row in files_dn.get_tables():
+                table_name = table_row.TABLE_NAME
+                if is_skipped('files', table_name):
+                    continue
+                add_rows('files', table_name, files_dn.get_table_columns(table_name))
 
         df = pd.DataFrame(result, columns=columns)
         return df
@@ -413,7 +461,7 @@ class InformationSchemaDataNode(DataNode):
             data = query_df(dataframe, query, session=self.session)
         except Exception as e:
             print(f'Exception! {e}')
-            return [], []
+            return pd.DataFrame(), []
 
         columns_info = [
             {
@@ -423,4 +471,4 @@ class InformationSchemaDataNode(DataNode):
             for k, v in data.dtypes.items()
         ]
 
-        return data.to_dict(orient='records'), columns_info
+        return data, columns_info
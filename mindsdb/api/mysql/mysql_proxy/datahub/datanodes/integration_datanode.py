@@ -1,15 +1,48 @@
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+
 import numpy as np
+import pandas as pd
 
 from sqlalchemy.types import (
     Integer, Float, Text
 )
-from mindsdb_sql.parser.ast import Insert, Identifier, CreateTable, TableColumn, DropTables
+from mindsdb_sql.parser.ast import Identifier, CreateTable, TableColumn, DropTables, Constant, Parameter, Select, Union
+from mindsdb_sql.planner.utils import query_traversal
 
 from mindsdb.api.mysql.mysql_proxy.datahub.datanodes.datanode import DataNode
+from mindsdb.integrations.libs.base import DatabaseHandler, DEFAULT_STREAM_CHUNK_SIZE
+from mindsdb.interfaces.storage import db
+from mindsdb.utilities.config import Config
 from mindsdb.api.mysql.mysql_proxy.libs.constants.response_type import RESPONSE_TYPE
 from mindsdb.api.mysql.mysql_proxy.datahub.classes.tables_row import TablesRow, TABLES_ROW_TYPE
 
 
+_query_many_executor = None
+_query_many_lock = threading.Lock()
+
+
+def get_query_many_executor():
+    """ Bounded pool for queries executed row by row. Threads are not recreated, so
+        handlers cached for them can be reused.
+
+        Configuration:
+            "query_many": {
+                "chunk_size": 1000,
+                "max_workers": 4
+            }
+    """
+    global _query_many_executor
+    with _query_many_lock:
+        if _query_many_executor is None:
+            _query_many_executor = ThreadPoolExecutor(
+                max_workers=Config().get('query_many', {}).get('max_workers', 4),
+                thread_name_prefix='query_many'
+            )
+        return _query_many_executor
+
+
 class IntegrationDataNode(DataNode):
     type = 'integration'
 
@@ -39,36 +72,23 @@ class IntegrationDataNode(DataNode):
     def get_table_columns(self, tableName):
         return []
 
-    def create_table(self, table_name_parts, columns, data, is_replace=False, is_create=False):
+    def create_table(self, table_name_parts, result_set, is_replace=False, is_create=False):
         # is_create - create table
         # is_replace - drop table if exists
         # is_create==False and is_replace==False: just insert
 
-        table_columns_meta = []
+        df = result_set.to_df()
+
         table_columns = []
-        for table in columns.tables():
-            for column in columns.table_columns(table):
-                column_type = None
-                for row in data:
-                    column_value = row[table][column]
-                    if isinstance(column_value, int):
-                        column_type = Integer
-                    elif isinstance(column_value, float):
-                        column_type = Float
-                    elif isinstance(column_value, str):
-                        column_type = Text
-                column_type = column_type or Text
-                table_columns.append(
-                    TableColumn(
-                        name=column[-1],
-                        type=column_type
-                    )
+        for column_name in df.columns:
+            column_type = self._get_column_type(df[column_name])
+            df[column_name] = self._cast_column(df[column_name], column_type)
+            table_columns.append(
+                TableColumn(
+                    name=column_name,
+                    type=column_type
                 )
-                table_columns_meta.append({
-                    'table': table,
-                    'name': column,
-                    'type': column_type
-                })
+            )
 
         if is_replace:
             # drop
@@ -91,37 +111,160 @@ class IntegrationDataNode(DataNode):
             result = self.integration_handler.query(create_table_ast)
             if result.type == RESPONSE_TYPE.ERROR:
                 raise Exception(result.error_message)
+            self.integration_controller.invalidate_metadata(self.integration_name)
 
-        insert_columns = [Identifier(parts=[x['name'][-1]]) for x in table_columns_meta]
-        formatted_data = []
-        for row in data:
-            new_row = []
-            for column_meta in table_columns_meta:
-                value = row[column_meta['table']][column_meta['name']]
-                python_type = str
-                if column_meta['type'] == Integer:
-                    python_type = int
-                elif column_meta['type'] == Float:
-                    python_type = float
-
-                try:
-                    value = python_type(value) if value is not None else value
-                except Exception:
-                    pass
-                new_row.append(value)
-            formatted_data.append(new_row)
-
-        insert_ast = Insert(
-            table=Identifier(parts=table_name_parts),
-            columns=insert_columns,
-            values=formatted_data
-        )
-
-        result = self.integration_handler.query(insert_ast)
+        table = Identifier(parts=table_name_parts)
+        if isinstance(self.integration_handler, DatabaseHandler):
+            result = self.integration_handler.insert_dataframe(table, df)
+        else:
+            # handler has no bulk-load method: insert by chunks
+            result = DatabaseHandler.insert_dataframe(self.integration_handler, table, df)
         if result.type == RESPONSE_TYPE.ERROR:
             raise Exception(result.error_message)
 
-    def query(self, query=None, native_query=None, session=None):
+    @staticmethod
+    def _get_column_type(values):
+        inferred_type = pd.api.types.infer_dtype(values, skipna=True)
+        if inferred_type in ('integer', 'boolean'):
+            return Integer
+        if inferred_type in ('floating', 'mixed-integer-float', 'decimal'):
+            return Float
+        return Text
+
+    @staticmethod
+    def _cast_column(values, column_type):
+        try:
+            if column_type == Integer:
+                return values.astype('Int64')
+            if column_type == Float:
+                return values.astype(float)
+        except (TypeError, ValueError):
+            return values
+        # text
+        values = values.astype(object)
+        mask = values.notna()
+        values[mask] = values[mask].astype(str)
+        return values
+
+    def query_many(self, query, params):
+        """ execute query for every set of parameters
+
+            If handler supports it, all is done in one call (and one transaction). Otherwise
+            query is executed for every set separately: by chunks in parallel, every thread
+            uses its own handler. In that case changes made before an error are not reverted.
+
+            Args:
+                query (ASTNode): query with Parameter nodes
+                params (List[dict]): values of parameters
+        """
+        if len(params) == 0:
+            return
+
+        if getattr(self.integration_handler, 'supports_query_many', False) is True:
+            result = self.integration_handler.query_many(query, params)
+            if result.type == RESPONSE_TYPE.ERROR:
+                raise Exception(result.error_message)
+            return
+
+        chunk_size = Config().get('query_many', {}).get('chunk_size', 1000)
+        chunks = [params[i:i + chunk_size] for i in range(0, len(params), chunk_size)]
+        if len(chunks) == 1:
+            self._query_chunk(self.integration_handler, query, chunks[0])
+            return
+
+        def run_chunk(chunk):
+            try:
+                handler = self.integration_controller.get_handler(self.integration_name)
+                self._query_chunk(handler, query, chunk)
+            finally:
+                # don't keep transaction open in the pool thread
+                db.session.remove()
+
+        executor = get_query_many_executor()
+        futures = [executor.submit(run_chunk, chunk) for chunk in chunks]
+        done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in not_done:
+            future.cancel()
+        # chunks which are already started can't be cancelled
+        wait(not_done)
+        for future in done:
+            future.result()
+
+    @staticmethod
+    def _query_chunk(handler, query, params):
+        # link parameters with constants of own copy of the query for fast replacing with values
+        query = copy.deepcopy(query)
+        params_map = []
+
+        def replace_parameter(node, **kwargs):
+            if isinstance(node, Parameter):
+                constant = Constant(None)
+                params_map.append([node.value, constant])
+                return constant
+
+        query_traversal(query, replace_parameter)
+
+        for row in params:
+            for name, constant in params_map:
+                constant.value = row[name]
+            result = handler.query(query)
+            if result.type == RESPONSE_TYPE.ERROR:
+                raise Exception(result.error_message)
+
+    def query_stream(self, query=None, native_query=None, chunk_size=None):
+        """ yields result of the query by chunks. If handler supports it, result is read from
+            database by parts and reading can be stopped without fetching of the whole result
+        """
+        if query is not None:
+            stream = self.integration_handler.query_stream(query, chunk_size)
+        else:
+            stream = self.integration_handler.native_query_stream(native_query, chunk_size)
+        try:
+            yield from stream
+        finally:
+            # release cursor of database if reading is stopped
+            stream.close()
+
+    def _read_stream(self, query=None, native_query=None, limit=None):
+        chunk_size = None
+        if limit is not None:
+            chunk_size = min(max(limit, 1), DEFAULT_STREAM_CHUNK_SIZE)
+
+        chunks = []
+        rows_count = 0
+        stream = self.query_stream(query=query, native_query=native_query, chunk_size=chunk_size)
+        try:
+            for df in stream:
+                chunks.append(df)
+                rows_count += len(df)
+                if limit is not None and rows_count >= limit:
+                    # the rest of result is not needed
+                    break
+        finally:
+            stream.close()
+
+        if len(chunks) == 0:
+            df = pd.DataFrame()
+        elif len(chunks) == 1:
+            df = chunks[0]
+        else:
+            df = pd.concat(chunks, ignore_index=True)
+        if limit is not None:
+            df = df.iloc[:limit]
+        # concat fills missing columns of chunks with NaN: replace it after concat
+        return self._make_result(df)
+
+    def query(self, query=None, native_query=None, session=None, limit=None):
+        """ Args:
+                limit (int): count of rows which is needed by caller. If handler supports
+                    streaming, reading of result is stopped after it
+        """
+        if getattr(self.integration_handler, 'supports_stream', False) is True:
+            if isinstance(query, (Select, Union)):
+                return self._read_stream(query=query, limit=limit)
+            if query is None and limit is not None:
+                # native query is used as table
+                return self._read_stream(native_query=native_query, limit=limit)
 
         if query is not None:
             result = self.integration_handler.query(query)
@@ -134,16 +277,23 @@ class IntegrationDataNode(DataNode):
         if result.type == RESPONSE_TYPE.QUERY:
             return result.query, None
         if result.type == RESPONSE_TYPE.OK:
+            if query is None or type(query) in (CreateTable, DropTables):
+                # list of tables might be changed
+                self.integration_controller.invalidate_metadata(self.integration_name)
             return
 
-        df = result.data_frame
-        df = df.replace({np.nan: None})
-        columns_info = [
+        return self._make_result(result.data_frame)
+
+    @staticmethod
+    def _get_columns_info(df):
+        return [
             {
                 'name': k,
                 'type': v
             }
             for k, v in df.dtypes.items()
         ]
-        data = df.to_dict(orient='records')
-        return data, columns_info
+
+    def _make_result(self, df):
+        df = df.replace({np.nan: None})
+        return df, self._get_columns_info(df)
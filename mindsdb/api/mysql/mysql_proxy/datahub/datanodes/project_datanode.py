@@ -123,5 +123,5 @@ class ProjectDataNode(DataNode):
             for k, v in df.dtypes.items()
         ]
 
-        return df.to_dict(orient='records'), columns_info
+        return df, columns_info
         # endregion
\ No newline at end of file
@@ -22,10 +22,24 @@ class ExecuteAnswer:
                  state_track: List[List] = None,
                  error_code: int = None,
                  error_message: str = None,
+                 data_frame=None,
                  ):
         self.columns = columns
-        self.data = data
+        self._data = data
+        # result as DataFrame with values in order of columns. Rows are
+        # converted to list only if .data is used
+        self.data_frame = data_frame
         self.status = status
         self.state_track = state_track
         self.error_code = error_code
         self.error_message = error_message
+
+    @property
+    def data(self):
+        if self._data is None and self.data_frame is not None:
+            self._data = self.data_frame.to_numpy(dtype=object).tolist()
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
@@ -34,6 +34,7 @@ class Executor:
         # returns
         self.columns = []
         self.params = []
+        # list of rows or DataFrame
         self.data = None
         self.state_track = None
         self.server_status = None
@@ -158,7 +159,7 @@ class Executor:
                 #     'type': TYPES.MYSQL_TYPE_VAR_STRING
                 # } for x in result[0].keys()]
 
-                data = [[str(value) for key, value in x.items()] for x in result]
+                data = result.astype(str).values.tolist()
             self.columns = columns
             self.data = data
             return True
@@ -222,7 +223,8 @@ class Executor:
 
         self.is_executed = True
 
-        self.data = ret.data
+        # DataFrame is sent without converting to list of rows
+        self.data = ret.data if ret.data_frame is None else ret.data_frame
         self.server_status = ret.status
         if ret.columns is not None:
             self.columns = ret.columns
@@ -701,9 +701,8 @@ class ExecuteCommands:
         status = HandlerStatusResponse(success=False)
 
         try:
-            handlers_meta = self.session.integration_controller.get_handlers_import_status()
-            handler_meta = handlers_meta[engine]
-            if handler_meta.get('import', {}).get('success') is not True:
+            handler_meta = self.session.integration_controller.get_handler_meta(engine)
+            if handler_meta is None or handler_meta.get('import', {}).get('success') is not True:
                 raise SqlApiException(f"Handler '{engine}' can not be used")
 
             accept_connection_args = handler_meta.get('connection_args')
@@ -1324,12 +1323,12 @@ class ExecuteCommands:
         return ExecuteAnswer(ANSWER_TYPE.OK)
 
     def answer_select(self, query):
-        data = query.fetch()
+        data = query.fetch(view='dataframe')
 
         return ExecuteAnswer(
             answer_type=ANSWER_TYPE.TABLE,
             columns=query.columns_list,
-            data=data['result'],
+            data_frame=data['result'],
         )
 
     def change_default_db(self, db_name):
@@ -44,6 +44,7 @@ class CAPABILITIES(object):
     CLIENT_CAN_HANDLE_EXPIRED_PASSWORDS = 1 << 22
     CLIENT_SESSION_TRACK = 1 << 23
     CLIENT_DEPRECATE_EOF = 1 << 24
+    CLIENT_ZSTD_COMPRESSION_ALGORITHM = 1 << 26
     CLIENT_SSL_VERIFY_SERVER_CERT = 1 << 30
     CLIENT_REMEMBER_OPTIONS = 1 << 31
     CLIENT_SECURE_CONNECTION = 0x00008000
@@ -159,6 +160,27 @@ class FIELD_FLAG(object):
 FIELD_FLAG = FIELD_FLAG()
 
 
+# max display length of column, is sent in column definition
+TYPES_MAX_LENGTH = {
+    TYPES.MYSQL_TYPE_TINY: 4,
+    TYPES.MYSQL_TYPE_SHORT: 6,
+    TYPES.MYSQL_TYPE_INT24: 9,
+    TYPES.MYSQL_TYPE_LONG: 11,
+    TYPES.MYSQL_TYPE_LONGLONG: 20,
+    TYPES.MYSQL_TYPE_FLOAT: 12,
+    TYPES.MYSQL_TYPE_DOUBLE: 22,
+    TYPES.MYSQL_TYPE_DECIMAL: 65,
+    TYPES.MYSQL_TYPE_NEWDECIMAL: 65,
+    TYPES.MYSQL_TYPE_YEAR: 4,
+    TYPES.MYSQL_TYPE_DATE: 10,
+    TYPES.MYSQL_TYPE_TIME: 17,
+    TYPES.MYSQL_TYPE_DATETIME: 26,
+    TYPES.MYSQL_TYPE_TIMESTAMP: 26,
+    TYPES.MYSQL_TYPE_NULL: 0,
+}
+DEFAULT_MAX_LENGTH = 0xffff
+
+
 # HANDSHAKE
 
 DEFAULT_COALLITION_ID = 83
@@ -178,6 +200,7 @@ DEFAULT_CAPABILITIES = sum([
     CAPABILITIES.CLIENT_SSL,
     CAPABILITIES.CLIENT_SECURE_CONNECTION,
     CAPABILITIES.CLIENT_DEPRECATE_EOF,
+    CAPABILITIES.CLIENT_COMPRESS,
 ])
 
 DEFAULT_AUTH_METHOD = 'caching_sha2_password'   # [mysql_native_password|caching_sha2_password]
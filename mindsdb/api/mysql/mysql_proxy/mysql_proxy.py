@@ -23,12 +23,19 @@ import select
 import base64
 from typing import List, Dict
 
+import pandas as pd
 from numpy import dtype as np_dtype
 from pandas.api import types as pd_types
 
 from mindsdb.utilities.wizards import make_ssl_cert
 from mindsdb.utilities.config import Config
 from mindsdb.api.mysql.mysql_proxy.data_types.mysql_packet import Packet
+from mindsdb.api.mysql.mysql_proxy.data_types.mysql_compressed_socket import (
+    CompressedSocket,
+    COMPRESSION_ALGORITHM_ZLIB,
+    COMPRESSION_ALGORITHM_ZSTD,
+    DEFAULT_MIN_COMPRESS_LENGTH
+)
 from mindsdb.api.mysql.mysql_proxy.controllers.session_controller import SessionController
 from mindsdb.api.mysql.mysql_proxy.classes.client_capabilities import ClentCapabilities
 from mindsdb.api.mysql.mysql_proxy.classes.server_capabilities import server_capabilities
@@ -52,7 +59,9 @@ from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import (
     TYPES,
     DEFAULT_AUTH_METHOD,
     SERVER_STATUS,
-    CAPABILITIES
+    CAPABILITIES,
+    TYPES_MAX_LENGTH,
+    DEFAULT_MAX_LENGTH
 )
 
 from mindsdb.api.mysql.mysql_proxy.data_types.mysql_packets import (
@@ -67,10 +76,10 @@ from mindsdb.api.mysql.mysql_proxy.data_types.mysql_packets import (
     CommandPacket,
     ColumnCountPacket,
     ColumnDefenitionPacket,
-    ResultsetRowPacket,
+    ResultsetRowsBatchPacket,
     EofPacket,
     STMTPrepareHeaderPacket,
-    BinaryResultsetRowPacket
+    BinaryResultsetRowsBatchPacket
 )
 
 from mindsdb.interfaces.model.model_controller import ModelController
@@ -81,6 +90,11 @@ from mindsdb.interfaces.database.database import DatabaseController
 from mindsdb.api.mysql.mysql_proxy.executor.executor import Executor
 import mindsdb.utilities.hooks as hooks
 
+# size of encoded packets accumulated before sending to socket
+SEND_BUFFER_SIZE = 1024 * 1024
+# count of rows encoded at once
+ROWS_BATCH_SIZE = 1000
+
 
 def empty_fn():
     pass
@@ -123,6 +137,24 @@ def check_auth(username, password, scramble_func, salt, company_id, config):
         log.error(traceback.format_exc())
 
 
+def get_columns_data(data, start, stop):
+    """ values of rows from start to stop, column by column
+
+        Args:
+            data: list of rows or DataFrame
+        Returns:
+            list of lists of columns values
+    """
+    if isinstance(data, pd.DataFrame):
+        # values are taken from columns directly, without creating of rows
+        batch = data.iloc[start:stop]
+        return [
+            batch.iloc[:, i].to_numpy(dtype=object).tolist()
+            for i in range(batch.shape[1])
+        ]
+    return list(zip(*data[start:stop]))
+
+
 class SQLAnswer:
     def __init__(self, resp_type: RESPONSE_TYPE, columns: List[Dict] = None, data: List[Dict] = None,
                  status: int = None, state_track: List[List] = None, error_code: int = None, error_message: str = None):
@@ -297,31 +329,71 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
             self.session.username = auth_data['username']
             self.session.auth = True
             self.packet(OkPacket).send()
+            # all packets after auth are compressed
+            self.enable_compression(handshake_resp)
             return True
         else:
             self.packet(ErrPacket, err_code=ERR.ER_PASSWORD_NO_MATCH, msg=f'Access denied for user {username}').send()
             log.warning(f'Access denied for user {username}')
             return False
 
+    def enable_compression(self, handshake_resp):
+        if (
+            self.client_capabilities.ZSTD_COMPRESSION_ALGORITHM
+            and server_capabilities.has(CAPABILITIES.CLIENT_ZSTD_COMPRESSION_ALGORITHM)
+        ):
+            algorithm = COMPRESSION_ALGORITHM_ZSTD
+            level = handshake_resp.zstd_compression_level
+        elif self.client_capabilities.COMPRESS:
+            algorithm = COMPRESSION_ALGORITHM_ZLIB
+            level = None
+        else:
+            return
+
+        config = Config()
+        min_length = config['api']['mysql'].get('compression_min_length', DEFAULT_MIN_COMPRESS_LENGTH)
+
+        log.debug(f'Enable compression: {algorithm}')
+        self.socket = CompressedSocket(
+            self.socket,
+            algorithm=algorithm,
+            level=level,
+            min_length=min_length
+        )
+
     def send_package_group(self, packages):
-        string = b''.join([x.accum() for x in packages])
-        self.socket.sendall(string)
+        """ send packets to the socket. Packets can be a generator:
+            they are encoded one by one and flushed when buffer is full
+        """
+        buffer = []
+        buffer_size = 0
+        for package in packages:
+            string = package.accum()
+            buffer.append(string)
+            buffer_size += len(string)
+            if buffer_size >= SEND_BUFFER_SIZE:
+                self.socket.sendall(b''.join(buffer))
+                buffer = []
+                buffer_size = 0
+        if len(buffer) > 0:
+            self.socket.sendall(b''.join(buffer))
 
     def answer_stmt_close(self, stmt_id):
         self.session.unregister_stmt(stmt_id)
 
     def send_query_answer(self, answer: SQLAnswer):
         if answer.type == RESPONSE_TYPE.TABLE:
-            packages = []
-            packages += self.get_tabel_packets(
-                columns=answer.columns,
-                data=answer.data
-            )
-            if answer.status is not None:
-                packages.append(self.last_packet(status=answer.status))
-            else:
-                packages.append(self.last_packet())
-            self.send_package_group(packages)
+            def get_packages():
+                # packets have to be created in order of sending: it is changing sequence number
+                yield from self.get_tabel_packets(
+                    columns=answer.columns,
+                    data=answer.data
+                )
+                if answer.status is not None:
+                    yield self.last_packet(status=answer.status)
+                else:
+                    yield self.last_packet()
+            self.send_package_group(get_packages())
         elif answer.type == RESPONSE_TYPE.OK:
             self.packet(OkPacket, state_track=answer.state_track).send()
         elif answer.type == RESPONSE_TYPE.ERROR:
@@ -331,24 +403,15 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
                 msg=answer.error_message
             ).send()
 
-    def _get_column_defenition_packets(self, columns, data=None):
-        if data is None:
-            data = []
+    def _get_column_defenition_packets(self, columns):
         packets = []
-        for i, column in enumerate(columns):
+        for column in columns:
             table_name = column.get('table_name', 'table_name')
             column_name = column.get('name', 'column_name')
             column_alias = column.get('alias', column_name)
             flags = column.get('flags', 0)
-            if len(data) == 0:
-                length = 0xffff
-            else:
-                length = 1
-                for row in data:
-                    if isinstance(row, dict):
-                        length = max(len(str(row[column_alias])), length)
-                    else:
-                        length = max(len(str(row[i])), length)
+            # length is taken from type: data is not scanned
+            length = TYPES_MAX_LENGTH.get(column['type'], DEFAULT_MAX_LENGTH)
 
             packets.append(
                 self.packet(
@@ -367,15 +430,24 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
         return packets
 
     def get_tabel_packets(self, columns, data, status=0):
+        """ generator of packets of result set, rows are encoded lazily """
         # TODO remove columns order
-        packets = [self.packet(ColumnCountPacket, count=len(columns))]
-        packets.extend(self._get_column_defenition_packets(columns, data))
+        yield self.packet(ColumnCountPacket, count=len(columns))
+        yield from self._get_column_defenition_packets(columns)
 
         if self.client_capabilities.DEPRECATE_EOF is False:
-            packets.append(self.packet(EofPacket, status=status))
+            yield self.packet(EofPacket, status=status)
 
-        packets += [self.packet(ResultsetRowPacket, data=x) for x in data]
-        return packets
+        for i in range(0, len(data), ROWS_BATCH_SIZE):
+            # rows are encoded column by column
+            columns_data = get_columns_data(data, i, i + ROWS_BATCH_SIZE)
+            yield self.packet(ResultsetRowsBatchPacket, columns=columns_data)
+
+    def get_binary_rows_packets(self, data, columns):
+        """ generator of binary protocol rows packets, rows are encoded in batches """
+        for i in range(0, len(data), ROWS_BATCH_SIZE):
+            columns_data = get_columns_data(data, i, i + ROWS_BATCH_SIZE)
+            yield self.packet(BinaryResultsetRowsBatchPacket, data=columns_data, columns=columns)
 
     def decode_utf(self, text):
         try:
@@ -566,18 +638,18 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
 
         if self.client_capabilities.DEPRECATE_EOF is False:
             packages.append(self.packet(EofPacket, status=0x0062))
-        else:
+            return self.send_package_group(packages)
+
+        def get_packages():
+            yield from packages
             # send all
-            for row in executor.data:
-                packages.append(
-                    self.packet(BinaryResultsetRowPacket, data=row, columns=columns_def)
-                )
+            yield from self.get_binary_rows_packets(executor.data, columns_def)
 
             server_status = executor.server_status or 0x0002
-            packages.append(self.last_packet(status=server_status))
-            prepared_stmt['fetched'] += len(executor.data)
+            yield self.last_packet(status=server_status)
 
-        return self.send_package_group(packages)
+        prepared_stmt['fetched'] += len(executor.data)
+        return self.send_package_group(get_packages())
 
     def answer_stmt_fetch(self, stmt_id, limit):
         prepared_stmt = self.session.prepared_stmts[stmt_id]
@@ -591,14 +663,14 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
             )
             return self.send_query_answer(resp)
 
-        packages = []
         columns = self.to_mysql_columns(executor.columns)
-        for row in executor.data[fetched:limit]:
-            packages.append(
-                self.packet(BinaryResultsetRowPacket, data=row, columns=columns)
-            )
+        if isinstance(executor.data, pd.DataFrame):
+            rows = executor.data.iloc[fetched:fetched + limit]
+        else:
+            rows = executor.data[fetched:fetched + limit]
+        packages = list(self.get_binary_rows_packets(rows, columns))
 
-        prepared_stmt['fetched'] += len(executor.data[fetched:limit])
+        prepared_stmt['fetched'] += len(rows)
 
         if len(executor.data) <= limit + fetched:
             status = sum([
@@ -0,0 +1,124 @@
+""" Set operations (UNION, INTERSECT, EXCEPT) over dataframes with the same number of columns.
+
+Columns are matched by position. Rows are compared by codes: every distinct row of both
+inputs gets an integer code from one hash-based groupby over all columns, after that all
+operations are vectorized operations over arrays of codes. NULLs are equal to each other,
+as in SELECT DISTINCT. Order of rows is kept: rows of left input go first.
+
+If inputs together have at least 'duckdb_min_rows' rows and duckdb context is passed,
+distinct operations, INTERSECT ALL and EXCEPT ALL are executed in duckdb, which can spill
+data to disk (see DuckDBContext). In that case order of rows is not kept:
+    "set_operations": {
+        "duckdb_min_rows": 1000000
+    }
+"""
+
+import numpy as np
+import pandas as pd
+
+from mindsdb.utilities.log import log
+
+
+OPERATIONS = ('union', 'intersect', 'except')
+
+DEFAULT_DUCKDB_MIN_ROWS = 1000000
+
+
+def get_rows_codes(df):
+    """ integer code for every row, equal rows have the same code """
+    columns = list(df.columns)
+    if len(df) == 0:
+        return np.zeros(0, dtype=np.int64)
+    try:
+        return df.groupby(columns, dropna=False, sort=False).ngroup().to_numpy()
+    except TypeError:
+        # unhashable values (lists, dicts): compare string representations
+        df = df.apply(lambda column: column.astype(str) if column.dtype == object else column)
+        return df.groupby(columns, dropna=False, sort=False).ngroup().to_numpy()
+
+
+def get_occurrences(codes):
+    """ number of the row among previous rows with the same code: 0, 1, 2, ... """
+    return pd.Series(codes).groupby(codes).cumcount().to_numpy()
+
+
+def _set_operation_pandas(left, right, operation, distinct):
+    if operation == 'union':
+        df = pd.concat([left, right], ignore_index=True)
+        if distinct:
+            codes = get_rows_codes(df)
+            df = df[~pd.Series(codes).duplicated().to_numpy()].reset_index(drop=True)
+        return df
+
+    codes = get_rows_codes(pd.concat([left, right], ignore_index=True))
+    left_codes = codes[:len(left)]
+    right_codes = codes[len(left):]
+
+    if distinct:
+        mask = np.isin(left_codes, right_codes)
+        if operation == 'except':
+            mask = ~mask
+        # only first occurrence of every row
+        mask &= ~pd.Series(left_codes).duplicated().to_numpy()
+    else:
+        # n-th occurrence of the row in left is matched with n-th occurrence in right
+        right_counts = np.bincount(right_codes, minlength=codes.max() + 1 if len(codes) > 0 else 0)
+        mask = get_occurrences(left_codes) < right_counts[left_codes]
+        if operation == 'except':
+            mask = ~mask
+
+    return left[mask].reset_index(drop=True)
+
+
+def _set_operation_duckdb(left, right, operation, distinct, duck_context):
+    names = [f'c{i}' for i in range(len(left.columns))]
+    left = left.set_axis(names, axis=1)
+    right = right.set_axis(names, axis=1)
+
+    op = operation.upper()
+    if not distinct:
+        op += ' ALL'
+    query_str = f'SELECT * FROM left_df {op} SELECT * FROM right_df'
+    df, _ = duck_context.execute(query_str, {'left_df': left, 'right_df': right})
+    return df
+
+
+def set_operation(left, right, operation, distinct=True, duck_context=None, duckdb_min_rows=None):
+    """ Execute set operation over two dataframes
+
+        Args:
+            left (pandas.DataFrame): first input
+            right (pandas.DataFrame): second input, the same number of columns as left
+            operation (str): 'union', 'intersect' or 'except'
+            distinct (bool): remove duplicates (default) or not (ALL)
+            duck_context (DuckDBContext): context to execute operation over big inputs
+            duckdb_min_rows (int): min size of inputs to use duckdb
+        Returns:
+            pandas.DataFrame: with columns of left
+    """
+    if operation not in OPERATIONS:
+        raise ValueError(f'Unknown set operation: {operation}')
+    if len(left.columns) != len(right.columns):
+        raise ValueError(f'Columns count mismatch: {len(left.columns)} != {len(right.columns)}')
+
+    columns = left.columns
+    # columns are matched by position
+    left = left.set_axis(range(len(columns)), axis=1)
+    right = right.set_axis(range(len(columns)), axis=1)
+
+    if duckdb_min_rows is None:
+        duckdb_min_rows = DEFAULT_DUCKDB_MIN_ROWS
+
+    df = None
+    is_big = len(left) + len(right) >= duckdb_min_rows
+    if duck_context is not None and is_big and (distinct or operation != 'union'):
+        try:
+            df = _set_operation_duckdb(left, right, operation, distinct, duck_context)
+        except Exception as e:
+            log.debug(f"Can't execute {operation} in duckdb: {e}")
+
+    if df is None:
+        df = _set_operation_pandas(left, right, operation, distinct)
+
+    df.columns = columns
+    return df
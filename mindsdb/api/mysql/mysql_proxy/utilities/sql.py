@@ -14,12 +14,108 @@ from mindsdb_sql.parser.ast import (
 from mindsdb.utilities.log import log
 
 
-def query_df(df, query, session=None):
+class DuckDBContext:
+    """ DuckDB connection which is shared by all steps of one query.
+
+        Connection is opened at first use and must be closed by owner of the context, e.g. by
+        using it as context manager. After closing it is opened again at next use.
+        Dataframes are registered as views (without copying) and can be referenced by name
+        in any following query until they are unregistered or context is closed.
+        Relations of the connection (for example from_parquet) can be registered as well,
+        in that case filters and projections of a query are pushed down to the scan.
+
+        If memory_limit is set, duckdb spills intermediate data (joins, aggregations)
+        to temp_directory when it exceeds the limit:
+            "duckdb": {
+                "memory_limit": "2GB",
+                "temp_directory": "/tmp/mindsdb_duckdb"
+            }
+    """
+
+    def __init__(self, config=None):
+        self.config = config or {}
+        self._connection = None
+        # name -> True if table is duckdb view
+        self._tables = {}
+        self._counter = 0
+
+    @property
+    def connection(self):
+        if self._connection is None:
+            self._connection = duckdb.connect(database=':memory:')
+            memory_limit = self.config.get('memory_limit')
+            if memory_limit is not None:
+                self._connection.execute(f"SET memory_limit='{memory_limit}'")
+                temp_directory = self.config.get('temp_directory')
+                if temp_directory is not None:
+                    self._connection.execute(f"SET temp_directory='{temp_directory}'")
+        return self._connection
+
+    def register(self, df, name=None):
+        if name is None:
+            self._counter += 1
+            name = f'df_{self._counter}'
+        if isinstance(df, duckdb.DuckDBPyRelation):
+            df.create_view(name)
+            self._tables[name] = True
+        else:
+            self.connection.register(name, df)
+            self._tables[name] = False
+        return name
+
+    def unregister(self, name):
+        if name in self._tables:
+            is_view = self._tables.pop(name)
+            if is_view:
+                self.connection.execute(f'DROP VIEW {name}')
+            else:
+                self.connection.unregister(name)
+
+    def from_parquet(self, path):
+        return self.connection.from_parquet(path)
+
+    def execute(self, query_str, tables=None):
+        """ Execute query with temporary registered tables
+
+            Args:
+                query_str (str): query in duckdb dialect
+                tables (dict): table name -> DataFrame, will be unregistered after execution
+            Returns:
+                pandas.DataFrame, description of result columns
+        """
+        tables = tables or {}
+        for name, df in tables.items():
+            self.register(df, name)
+        try:
+            cursor = self.connection.execute(query_str)
+            result_df = cursor.fetchdf()
+            description = cursor.description
+        finally:
+            for name in tables:
+                self.unregister(name)
+        return result_df, description
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        self._tables = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def query_df(df, query, session=None, duck_context=None):
     """ Perform simple query ('select' from one table, without subqueries and joins) on DataFrame.
 
         Args:
-            df (pandas.DataFrame): data
+            df (pandas.DataFrame | duckdb.DuckDBPyRelation): data, relation must belong to duck_context
             query (mindsdb_sql.parser.ast.Select | str): select query
+            session: session of the query, used to resolve DATABASE()
+            duck_context (DuckDBContext): shared context, temporary one is used if not set
 
         Returns:
             pandas.DataFrame
@@ -69,13 +165,12 @@ def query_df(df, query, session=None):
         )
         query_str = render.get_string(query_ast, with_failback=True)
 
-    con = duckdb.connect(database=':memory:')
-    con.register('df_table', df)
-    result_df = con.execute(query_str).fetchdf()
+    if duck_context is None:
+        with DuckDBContext() as duck_context:
+            result_df, description = duck_context.execute(query_str, {'df_table': df})
+    else:
+        result_df, description = duck_context.execute(query_str, {'df_table': df})
     result_df = result_df.replace({np.nan: None})
-    description = con.description
-    con.unregister('df_table')
-    con.close()
 
     new_column_names = {}
     real_column_names = [x[0] for x in description]
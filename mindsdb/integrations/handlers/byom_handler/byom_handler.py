@@ -1,6 +1,7 @@
 import sys
 import os
 import pickle
+import hashlib
 import subprocess
 from collections import OrderedDict
 
@@ -11,6 +12,8 @@ import numpy as np
 
 from mindsdb.integrations.libs.const import PREDICTOR_STATUS
 
+from .worker_pool import byom_workers
+
 class BYOMHandler(BaseMLEngine):
 
     name = 'byom'
@@ -88,15 +91,18 @@ class BYOMHandler(BaseMLEngine):
             self.model_storage.status_set(PREDICTOR_STATUS.ERROR, status_info=status_info)
 
     def predict(self, df):
-        encoded = self.model_storage.file_get('model')
-        model_params = pickle.loads(encoded)
-        params = {
-            'method': 'predict',
-            'code': self._get_model_code(),
-            'df': df,
-            'model': model_params,
-        }
-        pred_df = self._run_command(params)
+        model_code = self._get_model_code()
+        code_hash = hashlib.sha256(
+            model_code.encode() if isinstance(model_code, str) else model_code
+        ).hexdigest()
+        key = (self.model_storage.company_id, self.model_storage.predictor_id, code_hash)
+        # code and model are sent to the worker only if it doesn't have them yet
+        pred_df = byom_workers.predict(
+            key,
+            df,
+            get_code=lambda: model_code,
+            get_model=lambda: self.model_storage.file_get('model')
+        )
 
         # rename target column
         # target = self.model_storage.get_info()['to_predict'][0]
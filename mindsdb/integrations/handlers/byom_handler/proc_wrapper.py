@@ -16,13 +16,22 @@ The flow is as follows:
     4. A calls to the chosen method of the class is performed with any relevant parameters that were passed
     5. Response is generated, appropriately packaged and sent to stdout
     6. Exit
+
+Started with '--serve' argument, the process works as long-lived worker: it reads requests
+from stdin and writes responses to stdout in frames (8 bytes of length + pickled object)
+until stdin is closed. Model classes and instances of models are kept between requests.
 """
 
 import os
 import re
 import sys
+import struct
 import pickle
 import inspect
+import traceback
+from collections import OrderedDict
+
+FRAME_HEADER = struct.Struct('>Q')
 
 
 def return_output(obj):
@@ -41,6 +50,29 @@ def get_input():
     return obj
 
 
+def write_frame(fd, obj):
+    encoded = pickle.dumps(obj, protocol=5)
+    fd.write(FRAME_HEADER.pack(len(encoded)))
+    fd.write(encoded)
+    fd.flush()
+
+
+def _read_exactly(fd, size):
+    chunks = []
+    while size > 0:
+        chunk = fd.read(size)
+        if not chunk:
+            raise EOFError('Stream is closed')
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def read_frame(fd):
+    size, = FRAME_HEADER.unpack(_read_exactly(fd, FRAME_HEADER.size))
+    return pickle.loads(_read_exactly(fd, size))
+
+
 def import_string(code, module_name='model'):
     # import string as python module
 
@@ -141,5 +173,74 @@ def main():
     raise NotImplementedError(method)
 
 
+class Worker:
+    """ Keeps models of the long-lived process
+
+        models are keyed by (company_id, model_id, code_hash), model classes by code_hash
+    """
+    def __init__(self, max_models=10):
+        self.max_models = max_models
+        self.models = OrderedDict()
+        self.model_classes = {}
+
+    def _get_model(self, request):
+        key = request['key']
+        model = self.models.get(key)
+        if model is not None:
+            self.models.move_to_end(key)
+            return model
+
+        if 'code' not in request:
+            return None
+
+        code_hash = key[-1]
+        model_class = self.model_classes.get(code_hash)
+        if model_class is None:
+            model_class = get_model_class(request['code'])
+            self.model_classes[code_hash] = model_class
+
+        model = model_class()
+        model.__dict__ = pickle.loads(request['model'])
+
+        self.models[key] = model
+        while len(self.models) > self.max_models:
+            self.models.popitem(last=False)
+        return model
+
+    def handle(self, request):
+        method = request['method']
+        if method != 'predict':
+            raise NotImplementedError(method)
+
+        model = self._get_model(request)
+        if model is None:
+            # parent have to send code and model
+            return {'missing': True}
+        return {'result': model.predict(request['df'])}
+
+
+def serve(max_models=10):
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+    # replace print output to stderr
+    sys.stdout = sys.stderr
+
+    worker = Worker(max_models=max_models)
+    while True:
+        try:
+            request = read_frame(stdin)
+        except EOFError:
+            break
+        try:
+            response = worker.handle(request)
+        except Exception:
+            response = {'error': traceback.format_exc()}
+        write_frame(stdout, response)
+
+
 if __name__ == '__main__':
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == '--serve':
+        # proc_wrapper.py --serve [max_models]
+        serve(*[int(x) for x in sys.argv[2:3]])
+    else:
+        main()
@@ -0,0 +1,165 @@
+"""
+Pool of long-lived BYOM worker processes.
+
+Starting of new python process, importing of pandas, executing of the model code and
+unpickling of the model on every predict is slower than predict itself. Workers
+(proc_wrapper.py --serve) keep model classes and models in memory between calls.
+
+Number of workers limits number of concurrent calls. Worker is restarted after
+max_calls calls or if it uses more than max_memory MB. If worker crashes, only the
+current call fails.
+
+Configuration:
+    "byom": {
+        "workers": 2,
+        "max_calls": 1000,
+        "max_memory": 2048,
+        "max_models": 10
+    }
+"""
+
+import os
+import sys
+import threading
+import subprocess
+from collections import deque
+
+import psutil
+
+from mindsdb.utilities.config import Config
+from mindsdb.utilities.log import log
+
+from .proc_wrapper import read_frame, write_frame
+
+
+WRAPPER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'proc_wrapper.py')
+
+
+class WorkerCrashedError(RuntimeError):
+    pass
+
+
+class BYOMWorker:
+    def __init__(self, max_models=10):
+        self.calls = 0
+        self.process = subprocess.Popen(
+            [sys.executable, WRAPPER_PATH, '--serve', str(max_models)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        # the last lines of stderr, to show them if worker crashes
+        self.stderr_tail = deque(maxlen=50)
+        self._stderr_thread = threading.Thread(target=self._read_stderr, daemon=True)
+        self._stderr_thread.start()
+
+    def _read_stderr(self):
+        for line in self.process.stderr:
+            self.stderr_tail.append(line.decode(errors='replace'))
+
+    def is_alive(self):
+        return self.process.poll() is None
+
+    def memory_usage(self):
+        """ resident memory of the process in MB """
+        try:
+            return psutil.Process(self.process.pid).memory_info().rss / 1024 / 1024
+        except psutil.Error:
+            return 0
+
+    def call(self, request):
+        try:
+            write_frame(self.process.stdin, request)
+            response = read_frame(self.process.stdout)
+        except (EOFError, OSError):
+            self.stop()
+            self._stderr_thread.join(timeout=1)
+            raise WorkerCrashedError(
+                f'BYOM worker is crashed (exit code {self.process.returncode}): {"".join(self.stderr_tail)}'
+            )
+        if 'error' in response:
+            raise RuntimeError(response['error'])
+        return response
+
+    def stop(self):
+        if self.is_alive():
+            try:
+                self.process.stdin.close()
+            except OSError:
+                pass
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+
+
+class BYOMWorkerPool:
+    def __init__(self, workers=None, max_calls=None, max_memory=None, max_models=None):
+        config = Config().get('byom', {})
+        self.workers = workers or config.get('workers', 2)
+        self.max_calls = max_calls or config.get('max_calls', 1000)
+        self.max_memory = max_memory or config.get('max_memory', 2048)
+        self.max_models = max_models or config.get('max_models', 10)
+
+        self._semaphore = threading.BoundedSemaphore(self.workers)
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def _acquire(self):
+        self._semaphore.acquire()
+        with self._lock:
+            if len(self._idle) > 0:
+                # the last used worker most likely has the model
+                return self._idle.pop()
+        try:
+            return BYOMWorker(max_models=self.max_models)
+        except Exception:
+            self._semaphore.release()
+            raise
+
+    def _release(self, worker):
+        try:
+            if not worker.is_alive():
+                return
+            if worker.calls >= self.max_calls or worker.memory_usage() > self.max_memory:
+                log.debug('BYOM worker is recycled')
+                worker.stop()
+                return
+            with self._lock:
+                self._idle.append(worker)
+        finally:
+            self._semaphore.release()
+
+    def predict(self, key, df, get_code, get_model):
+        """ make prediction in a worker
+
+            Args:
+                key (tuple): identifies model and its code: (company_id, model_id, code_hash)
+                df (DataFrame): input data
+                get_code (Callable): returns code of the model, called if worker doesn't have the model
+                get_model (Callable): returns pickled model, called if worker doesn't have the model
+            Returns:
+                DataFrame
+        """
+        worker = self._acquire()
+        worker.calls += 1
+        try:
+            request = {'method': 'predict', 'key': key, 'df': df}
+            response = worker.call(request)
+            if response.get('missing'):
+                request['code'] = get_code()
+                request['model'] = get_model()
+                response = worker.call(request)
+            return response['result']
+        finally:
+            self._release(worker)
+
+    def shutdown(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.stop()
+
+
+byom_workers = BYOMWorkerPool()
@@ -4,11 +4,12 @@ import pandas as pd
 import clickhouse_driver
 from sqlalchemy import create_engine
 from clickhouse_sqlalchemy.drivers.base import ClickHouseDialect
+from mindsdb_sql.parser.ast import Identifier
 from mindsdb_sql.parser.ast.base import ASTNode
 from mindsdb_sql.render.sqlalchemy_render import SqlalchemyRender
 
 from mindsdb.utilities.log import log
-from mindsdb.integrations.libs.base import DatabaseHandler
+from mindsdb.integrations.libs.base import DatabaseHandler, dataframe_to_records
 from mindsdb.integrations.libs.response import (
     HandlerStatusResponse as StatusResponse,
     HandlerResponse as Response,
@@ -132,6 +133,38 @@ class ClickHouseHandler(DatabaseHandler):
         query_str = self.renderer.get_string(query, with_failback=True)
         return self.native_query(query_str)
 
+    def insert_dataframe(self, table: Identifier, df: pd.DataFrame, chunk_size: int = None) -> Response:
+        """
+        Load dataframe into the table. With native protocol data is sent in native format by blocks
+        """
+        if self.protocol != 'native':
+            return super().insert_dataframe(table, df, chunk_size)
+
+        preparer = self.renderer.dialect.identifier_preparer
+        columns = ', '.join(preparer.quote(name) for name in df.columns)
+        query_str = f'INSERT INTO {self.render_table_name(self.renderer, table)} ({columns}) VALUES'
+        need_to_close = self.is_connected is False
+
+        connection = self.connect()
+        cur = connection.cursor()
+        try:
+            for records in dataframe_to_records(df, chunk_size):
+                cur.executemany(query_str, records)
+            response = Response(RESPONSE_TYPE.OK)
+        except Exception as e:
+            log.error(f'Error loading data into {table} on {self.connection_data["database"]}!')
+            response = Response(
+                RESPONSE_TYPE.ERROR,
+                error_message=str(e)
+            )
+        finally:
+            cur.close()
+
+        if need_to_close is True:
+            self.disconnect()
+
+        return response
+
     def get_tables(self) -> Response:
         """
         Get a list with all of the tabels in ClickHouse db
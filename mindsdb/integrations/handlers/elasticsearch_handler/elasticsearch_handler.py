@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Iterator
 from collections import OrderedDict
 
 import pandas as pd
@@ -26,6 +26,7 @@ class ElasticsearchHandler(DatabaseHandler):
     """
 
     name = 'elasticsearch'
+    supports_stream = True
 
     def __init__(self, name: str, connection_data: Optional[dict], **kwargs):
         """
@@ -121,46 +122,74 @@ class ElasticsearchHandler(DatabaseHandler):
             HandlerResponse
         """
 
-        need_to_close = self.is_connected is False
-
-        connection = self.connect()
-
         try:
-            response = connection.sql.query(body={'query': query})
-            records = response['rows']
-            columns = response['columns']
-
-            new_records = True
-            while new_records:
-                try:
-                    if response['cursor']:
-                        response = connection.sql.query(body={'query': query, 'cursor': response['cursor']})
-
-                        new_records = response['rows']
-                        records = records + new_records
-                except Exception as e:
-                    new_records = False
-
-            if records:
-                response = Response(
-                    RESPONSE_TYPE.TABLE,
-                    data_frame=pd.DataFrame(
-                        records,
-                        columns=[column['name'] for column in columns]
-                    )
-                )
+            response = Response(
+                RESPONSE_TYPE.TABLE,
+                data_frame=pd.concat(list(self.native_query_stream(query)), ignore_index=True)
+            )
         except Exception as e:
-            log.error(f'Error running query: {query} on {self.connection_data["hosts"]}!')
             response = Response(
                 RESPONSE_TYPE.ERROR,
                 error_message=str(e)
             )
 
-        if need_to_close is True:
-            self.disconnect()
-
         return response
 
+    def native_query_stream(self, query: str, chunk_size: int = None) -> Iterator[pd.DataFrame]:
+        """
+        Receive raw query and yield its result by pages of SQL cursor.
+        Args:
+            query (str): query in native format
+            chunk_size (int): size of the page (fetch_size)
+        Returns:
+            Iterator[pd.DataFrame]
+        """
+
+        need_to_close = self.is_connected is False
+
+        connection = self.connect()
+        cursor = None
+
+        try:
+            body = {'query': query}
+            if chunk_size is not None:
+                body['fetch_size'] = chunk_size
+            response = connection.sql.query(body=body)
+            columns = [column['name'] for column in response['columns']]
+
+            while True:
+                cursor = response.get('cursor') or None
+                yield pd.DataFrame(response['rows'], columns=columns)
+                if cursor is None:
+                    break
+                response = connection.sql.query(body={'cursor': cursor})
+        except Exception:
+            log.error(f'Error running query: {query} on {self.connection_data["hosts"]}!')
+            raise
+        finally:
+            if cursor is not None:
+                # reading was stopped before the end
+                try:
+                    connection.sql.clear_cursor(body={'cursor': cursor})
+                except Exception:
+                    pass
+            if need_to_close is True:
+                self.disconnect()
+
+    def query_stream(self, query: ASTNode, chunk_size: int = None) -> Iterator[pd.DataFrame]:
+        """
+        Receive query as AST (abstract syntax tree) and yield its result by chunks.
+        Args:
+            query (ASTNode): sql query represented as AST
+            chunk_size (int): size of the page
+        Returns:
+            Iterator[pd.DataFrame]
+        """
+
+        renderer = SqlalchemyRender(ESDialect)
+        query_str = renderer.get_string(query, with_failback=True)
+        return self.native_query_stream(query_str, chunk_size)
+
     def query(self, query: ASTNode) -> StatusResponse:
         """
         Receive query as AST (abstract syntax tree) and act upon it somehow.
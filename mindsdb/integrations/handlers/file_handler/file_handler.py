@@ -15,8 +15,9 @@ from mindsdb_sql import parse_sql
 from mindsdb_sql.parser.ast.base import ASTNode
 from mindsdb_sql.parser.ast import DropTables, Select
 
-from mindsdb.api.mysql.mysql_proxy.utilities.sql import query_df
+from mindsdb.api.mysql.mysql_proxy.utilities.sql import query_df, DuckDBContext
 from mindsdb.integrations.libs.base import DatabaseHandler
+from mindsdb.utilities.log import log
 from mindsdb.integrations.libs.response import (
     HandlerStatusResponse as StatusResponse,
     HandlerResponse as Response,
@@ -24,6 +25,10 @@ from mindsdb.integrations.libs.response import (
 )
 
 
+# columnar copy of file data, is stored near the source file
+COLUMNAR_FILE_NAME = '__mindsdb_columnar.parquet'
+
+
 def clean_row(row):
     n_row = []
     for cell in row:
@@ -78,8 +83,18 @@ class FileHandler(DatabaseHandler):
         elif type(query) == Select:
             table_name = query.from_table.parts[-1]
             file_path = self.file_controller.get_file_path(table_name)
-            df, _columns = self._handle_source(file_path, self.clean_rows, self.custom_parser)
-            result_df = query_df(df, query)
+            columnar_path = self._get_columnar_path(file_path)
+            if (
+                self.custom_parser is None and self.clean_rows
+                and os.path.exists(columnar_path)
+            ):
+                # only used columns and row groups are read from the file
+                with DuckDBContext() as duck_context:
+                    table = duck_context.from_parquet(columnar_path)
+                    result_df = query_df(table, query, duck_context=duck_context)
+            else:
+                df, _columns = self._handle_source(file_path, self.clean_rows, self.custom_parser)
+                result_df = query_df(df, query)
             return Response(
                 RESPONSE_TYPE.TABLE,
                 data_frame=result_df
@@ -138,6 +153,33 @@ class FileHandler(DatabaseHandler):
         col_map = dict((col, col) for col in header)
         return pd.DataFrame(file_list_data, columns=header), col_map
 
+    @staticmethod
+    def _get_columnar_path(file_path):
+        return os.path.join(os.path.dirname(file_path), COLUMNAR_FILE_NAME)
+
+    @staticmethod
+    def save_columnar_copy(df, file_path):
+        """ Save parsed data of the file to parquet near the source file.
+            Parquet keeps schema and min/max statistics of row groups, it allows to skip
+            not used columns and row groups during query.
+
+            Args:
+                df (pandas.DataFrame): parsed data of the file
+                file_path (str): path to the source file
+            Returns:
+                bool: True if copy is saved
+        """
+        columnar_path = FileHandler._get_columnar_path(file_path)
+        try:
+            df.to_parquet(columnar_path, index=False, row_group_size=100000)
+        except Exception as e:
+            # for example: columns with mixed types, source file is used in that case
+            log.warning(f'Could not save columnar copy of file: {e}')
+            if os.path.exists(columnar_path):
+                os.remove(columnar_path)
+            return False
+        return True
+
     @staticmethod
     def _get_data_io(file_path):
         """
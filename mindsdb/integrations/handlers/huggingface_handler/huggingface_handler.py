@@ -1,12 +1,112 @@
+import time
+import threading
+
 import pandas as pd
 import transformers
 
 from mindsdb.integrations.libs.base import BaseMLEngine
+from mindsdb.integrations.libs.model_cache import ModelCache, get_folder_size
+from mindsdb.utilities.config import Config
+
+# pipelines are shared between predictors which use the same model
+pipelines_cache = ModelCache(
+    max_size=Config().get('huggingface', {}).get('pipelines_cache_size', 2048) * 1024 ** 2
+)
+
+
+class _BatchRequest:
+    def __init__(self, inputs):
+        self.inputs = inputs
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class PipelineRunner:
+    """ Runs pipeline with batching:
+        - inputs are sorted by length in tokens, so texts in one batch have similar length
+          and padding is minimal (if length_bucketing is true)
+        - inputs of concurrent calls with the same arguments are joined and processed
+          in one pipeline call: the first call waits max_batch_wait seconds for others
+    """
+
+    def __init__(self, pipeline):
+        self.pipeline = pipeline
+        self._lock = threading.Lock()
+        self._run_lock = threading.Lock()
+        # arguments of the call -> list of waiting requests
+        self._pending = {}
+
+    def _run(self, inputs, batch_size, length_bucketing, kwargs):
+        order = list(range(len(inputs)))
+        if length_bucketing and self.pipeline.tokenizer is not None and len(inputs) > batch_size:
+            lengths = [len(x) for x in self.pipeline.tokenizer(inputs, add_special_tokens=False)['input_ids']]
+            order.sort(key=lambda i: lengths[i])
+
+        outputs = self.pipeline([inputs[i] for i in order], batch_size=batch_size, **kwargs)
+
+        result = [None] * len(inputs)
+        for i, output in zip(order, outputs):
+            result[i] = output
+        return result
+
+    def __call__(self, inputs, batch_size=8, length_bucketing=True, max_batch_wait=0.01, **kwargs):
+        group_key = repr((batch_size, length_bucketing, sorted(kwargs.items())))
+        request = _BatchRequest(inputs)
+
+        with self._lock:
+            group = self._pending.get(group_key)
+            is_leader = group is None
+            if is_leader:
+                group = []
+                self._pending[group_key] = group
+            group.append(request)
+
+        if not is_leader:
+            request.done.wait()
+        else:
+            # wait for inputs from concurrent calls
+            if max_batch_wait > 0:
+                time.sleep(max_batch_wait)
+            with self._run_lock:
+                with self._lock:
+                    requests = self._pending.pop(group_key)
+
+                all_inputs = [x for req in requests for x in req.inputs]
+                try:
+                    outputs = self._run(all_inputs, batch_size, length_bucketing, kwargs)
+                    start = 0
+                    for req in requests:
+                        req.result = outputs[start: start + len(req.inputs)]
+                        start += len(req.inputs)
+                except Exception as e:
+                    for req in requests:
+                        req.error = e
+                finally:
+                    for req in requests:
+                        req.done.set()
+
+        if request.error is not None:
+            raise request.error
+        return request.result
 
 
 class HuggingFaceHandler(BaseMLEngine):
     name = 'huggingface'
 
+    def _get_pipeline_runner(self, args):
+        hf_model_storage_path = self.engine_storage.folder_get(args['model_name'])
+
+        key = (str(hf_model_storage_path), args['task_proper'])
+        runner = pipelines_cache.get(key)
+        if runner is None:
+            pipeline = transformers.pipeline(task=args['task_proper'], model=hf_model_storage_path,
+                                             tokenizer=hf_model_storage_path)
+            runner = PipelineRunner(pipeline)
+            # size of model files is used as estimation of memory usage
+            pipelines_cache.set(key, runner, size=get_folder_size(hf_model_storage_path))
+        return runner
+
     def create(self, target, args=None, **kwargs):
 
         args['target'] = target
@@ -62,7 +162,7 @@ class HuggingFaceHandler(BaseMLEngine):
         ###### persist changes to handler folder
         self.engine_storage.folder_sync(model_name)
 
-    def predict(self, df):
+    def predict(self, df, args=None):
 
         def tidy_output_classification(args, result):
             final = {}
@@ -101,34 +201,40 @@ class HuggingFaceHandler(BaseMLEngine):
             return final
 
         ###### get stuff from model folder
+        predict_args = args or {}
         args = self.model_storage.json_get('args')
 
-        hf_model_storage_path = self.engine_storage.folder_get(args['model_name'])
+        pipeline = self._get_pipeline_runner(args)
 
-        pipeline = transformers.pipeline(task=args['task_proper'], model=hf_model_storage_path,
-                                         tokenizer=hf_model_storage_path)
+        # batching options can be defined in USING of the model or of the query
+        batch_options = {}
+        for name, default in (('batch_size', 8), ('length_bucketing', True), ('max_batch_wait', 0.01)):
+            batch_options[name] = predict_args.get(name, args.get(name, default))
 
         input_list = df[args['input_column']]
         input_list_str = [str(x) for x in input_list]
 
         task = args['task']
         if task == 'text-classification':
-            output_list_messy = pipeline(input_list_str, truncation=True, num_workers=1, max_length=args['max_length'])
+            output_list_messy = pipeline(input_list_str, truncation=True, max_length=args['max_length'],
+                                         **batch_options)
             output_list_tidy = [tidy_output_classification(args, x) for x in output_list_messy]
 
         elif task == 'zero-shot-classification':
-            output_list_messy = pipeline(input_list_str, num_workers=1, candidate_labels=args['candidate_labels'],
-                                         truncation=True, top_k=1000, max_length=args['max_length'])
+            output_list_messy = pipeline(input_list_str, candidate_labels=args['candidate_labels'],
+                                         truncation=True, top_k=1000, max_length=args['max_length'],
+                                         **batch_options)
             output_list_tidy = [tidy_output_zero_shot(args, x) for x in output_list_messy]
 
         elif task == 'translation':
-            output_list_messy = pipeline(input_list_str, num_workers=1, max_length=args['max_length'])
+            output_list_messy = pipeline(input_list_str, max_length=args['max_length'], **batch_options)
             output_list_tidy = [tidy_output_translation(args, x) for x in output_list_messy]
 
         elif task == 'summarization':
-            output_list_messy = pipeline(input_list_str, num_workers=1,
+            output_list_messy = pipeline(input_list_str,
                                          min_length=args['min_output_length'],
-                                         max_length=args['max_output_length'])
+                                         max_length=args['max_output_length'],
+                                         **batch_options)
             output_list_tidy = [tidy_output_summarization(args, x) for x in output_list_messy]
         else:
             raise RuntimeError(f'Unknown task: {task}')
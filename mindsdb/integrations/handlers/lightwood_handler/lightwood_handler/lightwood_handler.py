@@ -89,12 +89,17 @@ class LightwoodHandler(BaseMLEngine):
         predictror_code = args['code']
         dtype_dict = args['dtype_dict']
         learn_args = args['learn_args']
-        self.model_storage.fileStorage.pull()
 
-        predictor = lightwood.predictor_from_state(
-            self.model_storage.fileStorage.folder_path / self.model_storage.fileStorage.folder_name,
-            predictror_code
-        )
+        # handler instance is cached between predictions, load model only once
+        predictor = getattr(self, '_predictor', None)
+        if predictor is None:
+            self.model_storage.fileStorage.pull()
+
+            predictor = lightwood.predictor_from_state(
+                self.model_storage.fileStorage.folder_path / self.model_storage.fileStorage.folder_name,
+                predictror_code
+            )
+            self._predictor = predictor
 
         predictions = predictor.predict(df)
         predictions = predictions.to_dict(orient='records')
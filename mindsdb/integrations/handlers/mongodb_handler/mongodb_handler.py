@@ -1,14 +1,18 @@
 import re
+from itertools import islice
+from typing import Iterator
 
 from bson import ObjectId
 import certifi
 import pandas as pd
 from pymongo import MongoClient
+from pymongo.cursor import Cursor
+from pymongo.command_cursor import CommandCursor
 
 from mindsdb_sql.parser.ast.base import ASTNode
 
 from mindsdb.utilities.log import log
-from mindsdb.integrations.libs.base import DatabaseHandler
+from mindsdb.integrations.libs.base import DatabaseHandler, DEFAULT_STREAM_CHUNK_SIZE
 from mindsdb.integrations.libs.response import (
     HandlerStatusResponse as StatusResponse,
     HandlerResponse as Response,
@@ -25,6 +29,7 @@ class MongoDBHandler(DatabaseHandler):
     """
 
     name = 'mongodb'
+    supports_stream = True
 
     def __init__(self, name, **kwargs):
         super().__init__(name)
@@ -109,6 +114,27 @@ class MongoDBHandler(DatabaseHandler):
 
         returns the records from the current recordset
         """
+        try:
+            df = pd.concat(list(self.native_query_stream(query)), ignore_index=True)
+            response = Response(
+                RESPONSE_TYPE.TABLE,
+                df
+            )
+
+        except Exception as e:
+            response = Response(
+                RESPONSE_TYPE.ERROR,
+                error_message=str(e)
+            )
+
+        return response
+
+    def native_query_stream(self, query: [str, MongoQuery, dict], chunk_size: int = None) -> Iterator[pd.DataFrame]:
+        """
+        input str or MongoQuery
+
+        yields the records by batches of chunk_size documents
+        """
         if isinstance(query, str):
             query = MongodbParser().from_string(query)
 
@@ -125,11 +151,15 @@ class MongoDBHandler(DatabaseHandler):
 
             query = mquery
 
+        if chunk_size is None:
+            chunk_size = DEFAULT_STREAM_CHUNK_SIZE
+
         collection = query.collection
         database = self.database
 
         con = self.connect()
 
+        cursor = None
         try:
 
             cursor = con[database][collection]
@@ -138,29 +168,39 @@ class MongoDBHandler(DatabaseHandler):
                 fnc = getattr(cursor, step['method'])
                 cursor = fnc(*step['args'])
 
-            result = []
-            for row in cursor:
-                result.append(self.flatten(row, level=self.flatten_level))
-
-            if len(result) > 0:
-                df = pd.DataFrame(result)
-            else:
-                columns = list(self.get_columns(collection).data_frame.Field)
-                df = pd.DataFrame([], columns=columns)
-
-            response = Response(
-                RESPONSE_TYPE.TABLE,
-                df
-            )
-
-        except Exception as e:
+            if isinstance(cursor, (Cursor, CommandCursor)):
+                cursor.batch_size(chunk_size)
+
+            first = True
+            while True:
+                result = [
+                    self.flatten(row, level=self.flatten_level)
+                    for row in islice(cursor, chunk_size)
+                ]
+                if len(result) > 0:
+                    yield pd.DataFrame(result)
+                elif first:
+                    columns = list(self.get_columns(collection).data_frame.Field)
+                    yield pd.DataFrame([], columns=columns)
+                if len(result) < chunk_size:
+                    break
+                first = False
+
+        except Exception:
             log.error(f'Error running query: {query} on {self.database}.{collection}!')
-            response = Response(
-                RESPONSE_TYPE.ERROR,
-                error_message=str(e)
-            )
+            raise
+        finally:
+            if isinstance(cursor, (Cursor, CommandCursor)):
+                # reading can be stopped before the end
+                cursor.close()
 
-        return response
+    def query_stream(self, query: ASTNode, chunk_size: int = None) -> Iterator[pd.DataFrame]:
+        """
+        Retrieve the data from the SQL statement by chunks.
+        """
+        renderer = MongodbRender()
+        mquery = renderer.to_mongo_query(query)
+        return self.native_query_stream(mquery, chunk_size)
 
     def flatten(self, row, level=0):
         # move sub-keys to upper level
@@ -1,3 +1,4 @@
+from typing import List, Iterator
 from collections import OrderedDict
 
 import pandas as pd
@@ -6,10 +7,11 @@ from sqlalchemy import create_engine
 
 from mindsdb_sql import parse_sql
 from mindsdb_sql.render.sqlalchemy_render import SqlalchemyRender
+from mindsdb_sql.parser.ast import Identifier
 from mindsdb_sql.parser.ast.base import ASTNode
 
 from mindsdb.utilities.log import log
-from mindsdb.integrations.libs.base import DatabaseHandler
+from mindsdb.integrations.libs.base import DatabaseHandler, dataframe_to_records, DEFAULT_STREAM_CHUNK_SIZE
 from mindsdb.integrations.libs.response import (
     HandlerStatusResponse as StatusResponse,
     HandlerResponse as Response,
@@ -18,12 +20,44 @@ from mindsdb.integrations.libs.response import (
 from mindsdb.integrations.libs.const import HANDLER_CONNECTION_ARG_TYPE as ARG_TYPE
 
 
+def estimate_value_size(value) -> int:
+    """ Upper bound of length of the value in query: escaping can double length of strings """
+    if value is None:
+        return 4
+    if isinstance(value, bytes):
+        return len(value) * 2 + 10
+    if isinstance(value, str):
+        return len(value.encode('utf-8')) * 2 + 2
+    return len(str(value)) + 2
+
+
+def split_records_by_size(records: List[list], max_size: int) -> Iterator[List[list]]:
+    """ Splits rows to batches which are not longer than max_size in multi-row insert.
+        A row which is longer than max_size is sent in separate batch
+    """
+    batch = []
+    batch_size = 0
+    for row in records:
+        # values, separators and parentheses
+        row_size = sum(estimate_value_size(value) for value in row) + len(row) + 3
+        if len(batch) > 0 and batch_size + row_size > max_size:
+            yield batch
+            batch = []
+            batch_size = 0
+        batch.append(row)
+        batch_size += row_size
+    if len(batch) > 0:
+        yield batch
+
+
 class MySQLHandler(DatabaseHandler):
     """
     This handler handles connection and execution of the MySQL statements.
     """
 
     name = 'mysql'
+    supports_query_many = True
+    supports_stream = True
 
     def __init__(self, name, **kwargs):
         super().__init__(name)
@@ -138,6 +172,50 @@ class MySQLHandler(DatabaseHandler):
 
         return response
 
+    def native_query_stream(self, query: str, chunk_size: int = None) -> Iterator[pd.DataFrame]:
+        """
+        Yield result of the query by chunks, rows are read from unbuffered cursor
+        """
+        if chunk_size is None:
+            chunk_size = DEFAULT_STREAM_CHUNK_SIZE
+        need_to_close = self.is_connected is False
+
+        connection = self.connect()
+        cur = connection.cursor(buffered=False)
+        try:
+            cur.execute(query)
+            if cur.with_rows:
+                columns = [x[0] for x in cur.description]
+                first = True
+                while True:
+                    result = cur.fetchmany(chunk_size)
+                    if len(result) > 0 or first:
+                        yield pd.DataFrame(result, columns=columns)
+                    if len(result) < chunk_size:
+                        break
+                    first = False
+            connection.commit()
+        except Exception:
+            log.error(f'Error running query: {query} on {self.connection_data["database"]}!')
+            connection.rollback()
+            raise
+        finally:
+            if connection.unread_result:
+                # reading was stopped: the rest of result is not read from server,
+                # connection is dropped instead and server aborts the query
+                connection.shutdown()
+                self.connection = None
+                self.is_connected = False
+            else:
+                cur.close()
+                if need_to_close is True:
+                    self.disconnect()
+
+    def query_stream(self, query: ASTNode, chunk_size: int = None) -> Iterator[pd.DataFrame]:
+        renderer = SqlalchemyRender('mysql')
+        query_str = renderer.get_string(query, with_failback=True)
+        return self.native_query_stream(query_str, chunk_size)
+
     def query(self, query: ASTNode) -> Response:
         """
         Retrieve the data from the SQL statement.
@@ -146,6 +224,71 @@ class MySQLHandler(DatabaseHandler):
         query_str = renderer.get_string(query, with_failback=True)
         return self.native_query(query_str)
 
+    def query_many(self, query: ASTNode, params: List[dict]) -> Response:
+        """
+        Execute the query for every set of parameters in one transaction
+        """
+        query_str = self.render_pyformat(SqlalchemyRender('mysql'), query)
+        need_to_close = self.is_connected is False
+
+        connection = self.connect()
+        with connection.cursor() as cur:
+            try:
+                cur.executemany(query_str, params)
+                connection.commit()
+                response = Response(RESPONSE_TYPE.OK)
+            except Exception as e:
+                log.error(f'Error running query: {query_str} on {self.connection_data["database"]}!')
+                response = Response(
+                    RESPONSE_TYPE.ERROR,
+                    error_message=str(e)
+                )
+                connection.rollback()
+
+        if need_to_close is True:
+            self.disconnect()
+
+        return response
+
+    def insert_dataframe(self, table: Identifier, df: pd.DataFrame, chunk_size: int = None) -> Response:
+        """
+        Load dataframe into the table by multi-row inserts of chunk_size rows, in one transaction.
+        Every insert is also limited by max_allowed_packet of the server
+        """
+        renderer = SqlalchemyRender('mysql')
+        preparer = renderer.dialect.identifier_preparer
+        columns = ', '.join(preparer.quote(name) for name in df.columns)
+        placeholders = ', '.join(['%s'] * len(df.columns))
+        query_str = f'INSERT INTO {self.render_table_name(renderer, table)} ({columns}) VALUES ({placeholders})'
+        need_to_close = self.is_connected is False
+
+        connection = self.connect()
+        with connection.cursor() as cur:
+            try:
+                cur.execute('SELECT @@max_allowed_packet')
+                max_allowed_packet = int(cur.fetchone()[0])
+                # space for beginning of the query and packet header
+                max_size = max_allowed_packet - len(query_str.encode('utf-8')) - 1024
+
+                for records in dataframe_to_records(df, chunk_size):
+                    for batch in split_records_by_size(records, max_size):
+                        # is sent as one multi-row insert
+                        cur.executemany(query_str, batch)
+                connection.commit()
+                response = Response(RESPONSE_TYPE.OK)
+            except Exception as e:
+                log.error(f'Error loading data into {table} on {self.connection_data["database"]}!')
+                response = Response(
+                    RESPONSE_TYPE.ERROR,
+                    error_message=str(e)
+                )
+                connection.rollback()
+
+        if need_to_close is True:
+            self.disconnect()
+
+        return response
+
     def get_tables(self) -> Response:
         """
         Get a list with all of the tabels in MySQL
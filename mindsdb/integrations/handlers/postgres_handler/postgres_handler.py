@@ -1,12 +1,16 @@
+from typing import List, Iterator
+
 import psycopg
+from psycopg import sql
 from psycopg.pq import ExecStatus
 from pandas import DataFrame
 
 from mindsdb_sql import parse_sql
 from mindsdb_sql.render.sqlalchemy_render import SqlalchemyRender
+from mindsdb_sql.parser.ast import Identifier, Select, Union
 from mindsdb_sql.parser.ast.base import ASTNode
 
-from mindsdb.integrations.libs.base import DatabaseHandler
+from mindsdb.integrations.libs.base import DatabaseHandler, dataframe_to_records, DEFAULT_STREAM_CHUNK_SIZE
 from mindsdb.utilities.log import log
 from mindsdb.integrations.libs.response import (
     HandlerStatusResponse as StatusResponse,
@@ -20,6 +24,8 @@ class PostgresHandler(DatabaseHandler):
     This handler handles connection and execution of the PostgreSQL statements.
     """
     name = 'postgres'
+    supports_query_many = True
+    supports_stream = True
 
     def __init__(self, name=None, **kwargs):
         super().__init__(name)
@@ -132,6 +138,107 @@ class PostgresHandler(DatabaseHandler):
         query_str = self.renderer.get_string(query, with_failback=True)
         return self.native_query(query_str)
 
+    def native_query_stream(self, query: str, chunk_size: int = None) -> Iterator[DataFrame]:
+        """
+        Yield result of the query by chunks. SELECT is read using server-side cursor,
+        other queries are executed by native_query
+        """
+        if not query.lstrip().lower().startswith('select'):
+            yield from super().native_query_stream(query, chunk_size)
+            return
+
+        if chunk_size is None:
+            chunk_size = DEFAULT_STREAM_CHUNK_SIZE
+        need_to_close = self.is_connected is False
+
+        connection = self.connect()
+        try:
+            with connection.cursor(name='mindsdb_stream') as cur:
+                cur.execute(query)
+                columns = [x.name for x in cur.description]
+                first = True
+                while True:
+                    result = cur.fetchmany(chunk_size)
+                    if len(result) > 0 or first:
+                        yield DataFrame(result, columns=columns)
+                    if len(result) < chunk_size:
+                        break
+                    first = False
+        except Exception:
+            log.error(f'Error running query: {query} on {self.database}!')
+            raise
+        finally:
+            # query is read-only. Also closes transaction if reading was stopped before the end
+            connection.rollback()
+            if need_to_close is True:
+                self.disconnect()
+
+    def query_stream(self, query: ASTNode, chunk_size: int = None) -> Iterator[DataFrame]:
+        if not isinstance(query, (Select, Union)):
+            return super().query_stream(query, chunk_size)
+        query_str = self.renderer.get_string(query, with_failback=True)
+        return self.native_query_stream(query_str, chunk_size)
+
+    def query_many(self, query: ASTNode, params: List[dict]) -> Response:
+        """
+        Execute the query for every set of parameters in one transaction
+        """
+        query_str = self.render_pyformat(self.renderer, query)
+        need_to_close = self.is_connected is False
+
+        connection = self.connect()
+        with connection.cursor() as cur:
+            try:
+                cur.executemany(query_str, params)
+                connection.commit()
+                response = Response(RESPONSE_TYPE.OK)
+            except Exception as e:
+                log.error(f'Error running query: {query_str} on {self.database}!')
+                response = Response(
+                    RESPONSE_TYPE.ERROR,
+                    error_code=0,
+                    error_message=str(e)
+                )
+                connection.rollback()
+
+        if need_to_close is True:
+            self.disconnect()
+
+        return response
+
+    def insert_dataframe(self, table: Identifier, df: DataFrame, chunk_size: int = None) -> Response:
+        """
+        Load dataframe into the table using COPY, in one transaction
+        """
+        copy_query = sql.SQL('COPY {} ({}) FROM STDIN').format(
+            sql.Identifier(*table.parts),
+            sql.SQL(', ').join(sql.Identifier(name) for name in df.columns)
+        )
+        need_to_close = self.is_connected is False
+
+        connection = self.connect()
+        with connection.cursor() as cur:
+            try:
+                with cur.copy(copy_query) as copy:
+                    for records in dataframe_to_records(df, chunk_size):
+                        for row in records:
+                            copy.write_row(row)
+                connection.commit()
+                response = Response(RESPONSE_TYPE.OK)
+            except Exception as e:
+                log.error(f'Error loading data into {table} on {self.database}!')
+                response = Response(
+                    RESPONSE_TYPE.ERROR,
+                    error_code=0,
+                    error_message=str(e)
+                )
+                connection.rollback()
+
+        if need_to_close is True:
+            self.disconnect()
+
+        return response
+
     def get_tables(self) -> Response:
         """
         List all tabels in PostgreSQL without the system tables information_schema and pg_catalog
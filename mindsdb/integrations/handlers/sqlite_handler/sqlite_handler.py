@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Iterator
 from collections import OrderedDict
 
 import pandas as pd
@@ -6,8 +6,9 @@ import sqlite3
 
 from mindsdb_sql import parse_sql
 from mindsdb_sql.render.sqlalchemy_render import SqlalchemyRender
-from mindsdb.integrations.libs.base import DatabaseHandler
+from mindsdb.integrations.libs.base import DatabaseHandler, dataframe_to_records, DEFAULT_STREAM_CHUNK_SIZE
 
+from mindsdb_sql.parser.ast import Identifier
 from mindsdb_sql.parser.ast.base import ASTNode
 
 from mindsdb.utilities.log import log
@@ -25,6 +26,7 @@ class SQLiteHandler(DatabaseHandler):
     """
 
     name = 'sqlite'
+    supports_stream = True
 
     def __init__(self, name: str, connection_data: Optional[dict], **kwargs):
         """
@@ -139,6 +141,58 @@ class SQLiteHandler(DatabaseHandler):
 
         return response
 
+    def native_query_stream(self, query: str, chunk_size: int = None) -> Iterator[pd.DataFrame]:
+        """
+        Receive raw query and yield its result by chunks.
+        Args:
+            query (str): query in native format
+            chunk_size (int): max number of rows in one chunk
+        Returns:
+            Iterator[pd.DataFrame]
+        """
+
+        if chunk_size is None:
+            chunk_size = DEFAULT_STREAM_CHUNK_SIZE
+        need_to_close = self.is_connected is False
+
+        connection = self.connect()
+        cursor = connection.cursor()
+
+        try:
+            cursor.execute(query)
+            if cursor.description is None:
+                connection.commit()
+                return
+            columns = [x[0] for x in cursor.description]
+            first = True
+            while True:
+                result = cursor.fetchmany(chunk_size)
+                if len(result) > 0 or first:
+                    yield pd.DataFrame(result, columns=columns)
+                if len(result) < chunk_size:
+                    break
+                first = False
+        except Exception:
+            log.error(f'Error running query: {query} on {self.connection_data["db_file"]}!')
+            raise
+        finally:
+            cursor.close()
+            if need_to_close is True:
+                self.disconnect()
+
+    def query_stream(self, query: ASTNode, chunk_size: int = None) -> Iterator[pd.DataFrame]:
+        """
+        Receive query as AST (abstract syntax tree) and yield its result by chunks.
+        Args:
+            query (ASTNode): sql query represented as AST
+            chunk_size (int): max number of rows in one chunk
+        Returns:
+            Iterator[pd.DataFrame]
+        """
+        renderer = SqlalchemyRender('sqlite')
+        query_str = renderer.get_string(query, with_failback=True)
+        return self.native_query_stream(query_str, chunk_size)
+
     def query(self, query: ASTNode) -> StatusResponse:
         """
         Receive query as AST (abstract syntax tree) and act upon it somehow.
@@ -152,6 +206,47 @@ class SQLiteHandler(DatabaseHandler):
         query_str = renderer.get_string(query, with_failback=True)
         return self.native_query(query_str)
 
+    def insert_dataframe(self, table: Identifier, df: pd.DataFrame, chunk_size: int = None) -> StatusResponse:
+        """
+        Load dataframe into the table using executemany, in one transaction.
+        Args:
+            table (Identifier): name of the table
+            df (pd.DataFrame): data
+            chunk_size (int): number of rows passed to executemany at once
+        Returns:
+            HandlerResponse
+        """
+
+        renderer = SqlalchemyRender('sqlite')
+        preparer = renderer.dialect.identifier_preparer
+        columns = ', '.join(preparer.quote(name) for name in df.columns)
+        placeholders = ', '.join(['?'] * len(df.columns))
+        query_str = f'INSERT INTO {self.render_table_name(renderer, table)} ({columns}) VALUES ({placeholders})'
+
+        need_to_close = self.is_connected is False
+
+        connection = self.connect()
+        cursor = connection.cursor()
+
+        try:
+            for records in dataframe_to_records(df, chunk_size):
+                cursor.executemany(query_str, records)
+            connection.commit()
+            response = Response(RESPONSE_TYPE.OK)
+        except Exception as e:
+            log.error(f'Error loading data into {table} on {self.connection_data["db_file"]}!')
+            response = Response(
+                RESPONSE_TYPE.ERROR,
+                error_message=str(e)
+            )
+            connection.rollback()
+
+        cursor.close()
+        if need_to_close is True:
+            self.disconnect()
+
+        return response
+
     def get_tables(self) -> StatusResponse:
         """
         Return list of entities that will be accessible as tables.
@@ -1,7 +1,9 @@
 """Parent class for all clients - DB and ML."""
+import json
 import requests
 from pandas import read_json
 from mindsdb.integrations.libs.net_helpers import sending_attempts
+from mindsdb.integrations.libs.arrow_ipc import ARROW_STREAM_MIME, arrow_stream_to_dataframe
 from mindsdb.utilities.log import log
 
 
@@ -11,10 +13,12 @@ class BaseClient:
     Attributes:
         headers: dict of default headers
         as_service: if false - delegates all calls to a handler instance
+        session: keeps connections to the service alive between requests
     """
     def __init__(self, as_service=True):
         self.headers = {"Content-Type": "application/json"}
         self.as_service = as_service
+        self.session = requests.Session()
 
     # Make the wrapper a very thin layout between user and LightwoodHandler
     # in case of local lightwood installation
@@ -38,6 +42,20 @@ class BaseClient:
             resp["data_frame"] = df
         return resp
 
+    def _read_response(self, r):
+        """Reads response of the service: json or Arrow IPC stream.
+
+        In case of stream the data_frame is read by record batches and other fields
+        of the response are taken from 'X-Handler-Response' header.
+        """
+        if r.headers.get("Content-Type", "").startswith(ARROW_STREAM_MIME):
+            resp = json.loads(r.headers["X-Handler-Response"])
+            r.raw.decode_content = True
+            resp["data_frame"] = arrow_stream_to_dataframe(r.raw)
+            # read rest of the body, so the connection can be reused
+            r.raw.read()
+            return resp
+        return self._convert_response(r.json())
 
     @sending_attempts()
     def _do(self, endpoint, _type="get", **params) -> requests.Response:
@@ -55,11 +73,11 @@ class BaseClient:
         call = None
         _type = _type.lower()
         if _type == "get":
-            call = requests.get
+            call = self.session.get
         elif _type == "post":
-            call = requests.post
+            call = self.session.post
         elif _type == "put":
-            call = requests.put
+            call = self.session.put
 
         url = f"{self.base_url}/{endpoint}"
 
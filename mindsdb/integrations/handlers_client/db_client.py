@@ -25,6 +25,7 @@ from mindsdb.integrations.libs.response import (
 )
 from mindsdb_sql.parser.ast.base import ASTNode
 from mindsdb.integrations.handlers_client.base_client import BaseClient
+from mindsdb.integrations.libs.arrow_ipc import ARROW_STREAM_MIME
 from mindsdb.integrations.libs.handler_helpers import define_handler as define_db_handler
 from mindsdb.utilities.log import log
 
@@ -53,6 +54,8 @@ class DBServiceClient(BaseClient):
             kwargs: dict connection args for db if as_service=False or to DBHandler service otherwise
         """
         super().__init__(as_service=as_service)
+        # dataframes are received as Arrow IPC stream if service supports it
+        self.headers["Accept"] = f"{ARROW_STREAM_MIME}, application/json"
         connection_data = kwargs.get("connection_data", None)
         if connection_data is None:
             raise Exception("No connection data provided.")
@@ -66,6 +69,15 @@ class DBServiceClient(BaseClient):
             handler_class = define_db_handler(handler_type)
             self.handler = handler_class(handler_class.name, **kwargs)
 
+    @staticmethod
+    def _to_response(r: dict) -> Response:
+        # service sends 'type' and 'error', but older versions used 'resp_type' and 'error_message'
+        return Response(data_frame=r.get("data_frame", None),
+                        resp_type=r.get("type", r.get("resp_type")),
+                        error_code=r.get("error_code", 0),
+                        error_message=r.get("error", r.get("error_message")),
+                        query=r.get("query"))
+
     def connect(self) -> bool: 
         """Establish a connection.
 
@@ -117,13 +129,9 @@ class DBServiceClient(BaseClient):
         response = None
         log.info("%s: calling 'native_query' for query - %s", self.__class__.__name__, query)
         try:
-            r = self._do("/native_query", _type="post", json={"query": query})
-            r = self._convert_response(r.json())
-            response = Response(data_frame=r.get("data_frame", None),
-                                resp_type=r.get("resp_type"),
-                                error_code=r.get("error_code", 0),
-                                error_message=r.get("error_message", None),
-                                query=r.get("query"))
+            r = self._do("/native_query", _type="post", json={"query": query}, stream=True)
+            r = self._read_response(r)
+            response = self._to_response(r)
             log.info("%s: db service has replied. error_code - %s", self.__class__.__name__, response.error_code)
 
         except Exception as e:
@@ -149,13 +157,9 @@ class DBServiceClient(BaseClient):
 
         log.info("%s: calling 'query' for query - %s", self.__class__.__name__, query)
         try:
-            r = self._do("/query", data=s_query)
-            r = self._convert_response(r.json())
-            response = Response(data_frame=r.get("data_frame", None),
-                                resp_type=r.get("resp_type"),
-                                error_code=r.get("error_code", 0),
-                                error_message=r.get("error_message", None),
-                                query=r.get("query"))
+            r = self._do("/query", data=s_query, stream=True)
+            r = self._read_response(r)
+            response = self._to_response(r)
             log.info("%s: db service has replied. error_code - %s", self.__class__.__name__, response.error_code)
 
         except Exception as e:
@@ -179,13 +183,9 @@ class DBServiceClient(BaseClient):
         log.info("%s: calling 'get_tables'", self.__class__.__name__)
 
         try:
-            r = self._do("/get_tables")
-            r = self._convert_response(r.json())
-            response = Response(data_frame=r.get("data_frame", None),
-                                resp_type=r.get("resp_type"),
-                                error_code=r.get("error_code", 0),
-                                error_message=r.get("error_message", None),
-                                query=r.get("query"))
+            r = self._do("/get_tables", stream=True)
+            r = self._read_response(r)
+            response = self._to_response(r)
             log.info("%s: db service has replied. error_code - %s", self.__class__.__name__, response.error_code)
 
         except Exception as e:
@@ -209,13 +209,9 @@ class DBServiceClient(BaseClient):
 
         log.info("%s: calling 'get_columns' for table - %s", self.__class__.__name__, table_name)
         try:
-            r = self._do("/get_columns", json={"table": table_name})
-            r = self._convert_response(r.json())
-            response = Response(data_frame=r.get("data_frame", None),
-                                resp_type=r.get("resp_type"),
-                                error_code=r.get("error_code", 0),
-                                error_message=r.get("error_message", None),
-                                query=r.get("query"))
+            r = self._do("/get_columns", json={"table": table_name}, stream=True)
+            r = self._read_response(r)
+            response = self._to_response(r)
 
             log.info("%s: db service has replied. error_code - %s", self.__class__.__name__, response.error_code)
         except Exception as e:
@@ -18,15 +18,21 @@ Basic usage:
     app.run(debug=True, host=host, port=port)
 
 """
+import json
 import pickle
 import traceback
-from flask import Flask, request
+from flask import Flask, request, Response as FlaskResponse
 from mindsdb.integrations.libs.response import (
     HandlerStatusResponse as StatusResponse,
     HandlerResponse as Response,
     RESPONSE_TYPE
 )
 from mindsdb.integrations.libs.handler_helpers import define_handler
+from mindsdb.integrations.libs.arrow_ipc import (
+    ARROW_STREAM_MIME,
+    dataframe_to_arrow_table,
+    arrow_table_to_chunks
+)
 from mindsdb.utilities.log import log
 
 class BaseDBWrapper:
@@ -87,6 +93,31 @@ class DBHandlerWrapper(BaseDBWrapper):
         self.query = query_route(self.query)
         log.info("%s: additional params and routes have been initialized", self.__class__.__name__)
 
+    def _make_response(self, result, status=200):
+        """Returns data_frame as Arrow IPC stream if client accepts it, or the whole response as json otherwise.
+        Other fields of the response are sent in 'X-Handler-Response' header in case of stream.
+        """
+        if (
+            result.data_frame is not None
+            and ARROW_STREAM_MIME in request.headers.get("Accept", "")
+        ):
+            try:
+                table = dataframe_to_arrow_table(result.data_frame)
+            except Exception:
+                log.warning("%s: can't convert dataframe to arrow, json is used", self.__class__.__name__)
+            else:
+                meta = {"type": result.resp_type,
+                        "query": result.query,
+                        "error_code": result.error_code,
+                        "error": result.error_message}
+                return FlaskResponse(
+                    arrow_table_to_chunks(table),
+                    status=status,
+                    mimetype=ARROW_STREAM_MIME,
+                    headers={"X-Handler-Response": json.dumps(meta)}
+                )
+        return result.to_json(), status
+
     def connect(self):
         try:
             self.handler.connect()
@@ -115,7 +146,7 @@ class DBHandlerWrapper(BaseDBWrapper):
         log.info("%s: calling 'native_query' with query - %s", self.__class__.__name__, query)
         try:
             result = self.handler.native_query(query)
-            return result.to_json(), 200
+            return self._make_response(result)
         except Exception as e:
             msg = traceback.format_exc()
             log.error(msg)
@@ -131,7 +162,7 @@ class DBHandlerWrapper(BaseDBWrapper):
         log.info("%s: calling 'query' with query - %s", self.__class__.__name__, query)
         try:
             result = self.handler.query(query)
-            return result.to_json(), 200
+            return self._make_response(result)
         except Exception as e:
             msg = traceback.format_exc()
             log.error(msg)
@@ -144,7 +175,7 @@ class DBHandlerWrapper(BaseDBWrapper):
         log.info("%s: calling 'get_tables'", self.__class__.__name__)
         try:
             result = self.handler.get_tables()
-            return result.to_json(), 200
+            return self._make_response(result)
         except Exception as e:
             msg = traceback.format_exc()
             log.error(msg)
@@ -158,7 +189,7 @@ class DBHandlerWrapper(BaseDBWrapper):
         try:
             log.info("%s: calling 'get_columns' for table - %s", self.__class__.__name__, table)
             result = self.handler.get_columns(table)
-            return result.to_json(), 200
+            return self._make_response(result)
         except Exception as e:
             msg = traceback.format_exc()
             log.error(msg)
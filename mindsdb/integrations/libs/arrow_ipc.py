@@ -0,0 +1,51 @@
+"""Transfer of dataframes between handler service and client in Arrow IPC stream format.
+
+Comparing with json it is faster, keeps dtypes (datetimes, nullable ints, etc)
+and allows to send and read big dataframes by chunks.
+"""
+import io
+
+import pandas as pd
+import pyarrow as pa
+
+ARROW_STREAM_MIME = 'application/vnd.apache.arrow.stream'
+
+# number of rows in one record batch
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def dataframe_to_arrow_table(df: pd.DataFrame) -> pa.Table:
+    """Converts dataframe to arrow table. Raises exception if dataframe can't be converted:
+    it is better to check it before start of streaming
+    """
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def arrow_table_to_chunks(table: pa.Table, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Yields parts of IPC stream: schema, record batches by chunk_size rows and end of stream"""
+    buffer = io.BytesIO()
+
+    def pop_buffer():
+        data = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    with pa.ipc.new_stream(buffer, table.schema) as writer:
+        for batch in table.to_batches(max_chunksize=chunk_size):
+            writer.write_batch(batch)
+            yield pop_buffer()
+    yield pop_buffer()
+
+
+def dataframe_to_arrow_chunks(df: pd.DataFrame, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    return arrow_table_to_chunks(dataframe_to_arrow_table(df), chunk_size)
+
+
+def arrow_stream_to_dataframe(source) -> pd.DataFrame:
+    """Reads IPC stream from bytes or file-like object (it is read by record batches)"""
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    with pa.ipc.open_stream(source) as reader:
+        table = reader.read_all()
+    return table.to_pandas()
@@ -1,9 +1,43 @@
-from typing import Any, Union, Optional, Dict
+import copy
+from typing import Any, Union, Optional, Dict, List, Iterator
 
 import pandas as pd
-from mindsdb_sql.parser.ast import Join
+from mindsdb_sql.parser.ast import Join, Parameter, Identifier, Insert
 from mindsdb_sql.parser.ast.base import ASTNode
-from mindsdb.integrations.libs.response import HandlerResponse, HandlerStatusResponse
+from mindsdb_sql.planner.utils import query_traversal
+from mindsdb.integrations.libs.response import HandlerResponse, HandlerStatusResponse, RESPONSE_TYPE
+
+
+# max number of rows sent to database in one query by insert_dataframe
+DEFAULT_INSERT_CHUNK_SIZE = 10000
+# max number of rows in one dataframe yielded by query_stream
+DEFAULT_STREAM_CHUNK_SIZE = 10000
+
+
+def dataframe_to_records(df: pd.DataFrame, chunk_size: int = None):
+    """ Yields rows of dataframe by chunks as lists of python values, missing values are None """
+    if chunk_size is None:
+        chunk_size = DEFAULT_INSERT_CHUNK_SIZE
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start:start + chunk_size].astype(object)
+        yield chunk.where(chunk.notna(), None).values.tolist()
+
+
+def response_to_chunks(response: HandlerResponse, chunk_size: int = None) -> Iterator[pd.DataFrame]:
+    """ Splits table of the handler response to dataframes of chunk_size rows.
+        Raises exception if response is error, nothing is yielded if response is not table
+    """
+    if response.type == RESPONSE_TYPE.ERROR:
+        raise Exception(response.error_message)
+    if response.type != RESPONSE_TYPE.TABLE:
+        return
+    if chunk_size is None:
+        chunk_size = DEFAULT_STREAM_CHUNK_SIZE
+    df = response.data_frame
+    # first chunk is yielded even if table is empty: to pass columns
+    yield df.iloc[:chunk_size]
+    for start in range(chunk_size, len(df), chunk_size):
+        yield df.iloc[start:start + chunk_size]
 
 
 class BaseHandler:
@@ -13,6 +47,9 @@ class BaseHandler:
     broader MindsDB ecosystem via SQL commands.
     """
 
+    # native_query_stream and query_stream read result from the database by chunks
+    supports_stream: bool = False
+
     def __init__(self, name: str):
         """ constructor
         Args:
@@ -72,6 +109,35 @@ class BaseHandler:
         """
         raise NotImplementedError()
 
+    def native_query_stream(self, query: Any, chunk_size: int = None) -> Iterator[pd.DataFrame]:
+        """Receive raw query and yield its result by chunks.
+
+        Handlers which can fetch result by parts (e.g. using server-side cursors)
+        should override it and set supports_stream. By default the whole result
+        of native_query is fetched and split.
+
+        Args:
+            query (Any): query in native format
+            chunk_size (int): max number of rows in one chunk
+
+        Returns:
+            Iterator[pd.DataFrame]: at least one dataframe (maybe empty) if query returns table,
+                nothing if it doesn't. Exception is raised if query is failed
+        """
+        return response_to_chunks(self.native_query(query), chunk_size)
+
+    def query_stream(self, query: ASTNode, chunk_size: int = None) -> Iterator[pd.DataFrame]:
+        """Receive query as AST and yield its result by chunks, the same as native_query_stream
+
+        Args:
+            query (ASTNode): sql query represented as AST
+            chunk_size (int): max number of rows in one chunk
+
+        Returns:
+            Iterator[pd.DataFrame]
+        """
+        return response_to_chunks(self.query(query), chunk_size)
+
     def get_tables(self) -> HandlerResponse:
         """ Return list of entities
 
@@ -104,9 +170,76 @@ class DatabaseHandler(BaseHandler):
     """
     Base class for handlers associated to data storage systems (e.g. databases, data warehouses, streaming services, etc.)
     """
+
+    # handler implements query_many
+    supports_query_many: bool = False
+
     def __init__(self, name: str):
         super().__init__(name)
 
+    def query_many(self, query: ASTNode, params: List[dict]) -> HandlerResponse:
+        """Execute the same query for every set of parameters, in one transaction.
+        Used for bulk update: without it query is executed for every row separately.
+
+        Args:
+            query (ASTNode): query with Parameter nodes, value of the node is name of the parameter
+            params (List[dict]): names and values of parameters, one dict for every execution
+
+        Returns:
+            HandlerResponse
+        """
+        raise NotImplementedError()
+
+    def insert_dataframe(self, table: Identifier, df: pd.DataFrame, chunk_size: int = None) -> HandlerResponse:
+        """Load dataframe into existing table.
+
+        By default rows are sent in INSERT queries by chunks of chunk_size rows, every
+        chunk is committed separately. Handlers can replace it with native bulk-load
+        method of the database.
+
+        Args:
+            table (Identifier): name of the table
+            df (pd.DataFrame): data, columns have the same names as in the table
+            chunk_size (int): max number of rows in one query
+
+        Returns:
+            HandlerResponse
+        """
+        columns = [Identifier(parts=[name]) for name in df.columns]
+        for records in dataframe_to_records(df, chunk_size):
+            result = self.query(Insert(table=table, columns=columns, values=records))
+            if result.type == RESPONSE_TYPE.ERROR:
+                return result
+        return HandlerResponse(RESPONSE_TYPE.OK)
+
+    @staticmethod
+    def render_table_name(renderer, table: Identifier) -> str:
+        """Render quoted name of the table using dialect of the renderer"""
+        preparer = renderer.dialect.identifier_preparer
+        return '.'.join(preparer.quote(part) for part in table.parts)
+
+    @staticmethod
+    def render_pyformat(renderer, query: ASTNode) -> str:
+        """Render query with Parameter nodes to string with %(name)s placeholders
+        (pyformat paramstyle, is used by psycopg and mysql-connector)
+        """
+        query = copy.deepcopy(query)
+        markers = {}
+
+        def replace_parameter(node, **kwargs):
+            if isinstance(node, Parameter):
+                marker = f'__mindsdb_param_{len(markers)}__'
+                markers[marker] = node.value
+                return Parameter(marker)
+
+        query_traversal(query, replace_parameter)
+
+        # other percent signs must be escaped
+        query_str = renderer.get_string(query, with_failback=True).replace('%', '%%')
+        for marker, name in markers.items():
+            query_str = query_str.replace(marker, f'%({name})s')
+        return query_str
+
 
 class PredictiveHandler(BaseHandler):
     """
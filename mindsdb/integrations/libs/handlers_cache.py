@@ -0,0 +1,150 @@
+"""
+Process-wide cache of data handlers instances.
+
+Creating a handler requires a query to the integration record, preparing of its file
+storage and, usually, a new connection to the remote database on every query. The cache
+keeps connected handlers between queries, so the connection is reused.
+
+Handlers are keyed by (company_id, integration_id, version): version is changed every time
+the integration record is changed. Connections of most drivers are not thread-safe, so
+every handler is owned by the thread which got it. When the thread is finished, its
+handlers are free and are given to other threads (e.g. to threads of new connections to
+mysql api).
+
+Handlers of alive threads can be in use, they are never disconnected by the cache. Free
+handlers which were not used longer than idle_timeout are disconnected and removed. If
+number of handlers exceeds max_size, least recently used free handlers are disconnected and
+removed. Handlers which were not used longer than health_check_interval are checked by
+check_connection before reuse.
+
+Configuration (timeouts in seconds):
+    "handlers_cache": {
+        "max_size": 100,
+        "idle_timeout": 300,
+        "health_check_interval": 60
+    }
+"""
+
+import time
+import threading
+from collections import OrderedDict
+
+from mindsdb.utilities.config import Config
+from mindsdb.utilities.log import log
+
+
+def _disconnect(handler):
+    try:
+        handler.disconnect()
+    except Exception as e:
+        log.warning(f'Error during disconnecting of handler: {e}')
+
+
+class HandlersCache:
+    def __init__(self, max_size=None, idle_timeout=None, health_check_interval=None):
+        config = Config().get('handlers_cache', {})
+        if max_size is None:
+            max_size = config.get('max_size', 100)
+        if idle_timeout is None:
+            idle_timeout = config.get('idle_timeout', 300)
+        if health_check_interval is None:
+            health_check_interval = config.get('health_check_interval', 60)
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+
+        # (key, owner thread) -> [handler, last usage time]. order of items is order of usage
+        self._items = OrderedDict()
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def make_key(company_id, integration_id, version):
+        return (company_id, integration_id, version)
+
+    def get(self, key):
+        thread = threading.current_thread()
+        item_key = (key, thread)
+        with self._lock:
+            self._cleanup()
+            item = self._items.get(item_key)
+            if item is None:
+                item = self._take_free(key, thread)
+                if item is None:
+                    return None
+            handler, last_used = item
+            idle_time = time.time() - last_used
+            if idle_time > self.idle_timeout:
+                self._remove(item_key, disconnect=True)
+                return None
+            self._items.move_to_end(item_key)
+            item[1] = time.time()
+
+        if idle_time > self.health_check_interval:
+            try:
+                success = handler.check_connection().success
+            except Exception:
+                success = False
+            if not success:
+                with self._lock:
+                    if item_key in self._items:
+                        self._remove(item_key, disconnect=True)
+                return None
+        return handler
+
+    def set(self, key, handler):
+        item_key = (key, threading.current_thread())
+        with self._lock:
+            if item_key in self._items:
+                self._remove(item_key)
+            self._items[item_key] = [handler, time.time()]
+            self._cleanup()
+
+    def invalidate(self, company_id, integration_id):
+        """ remove all handlers of the integration, free handlers are disconnected """
+        with self._lock:
+            for item_key in list(self._items.keys()):
+                key, owner = item_key
+                if key[0] == company_id and key[1] == integration_id:
+                    self._remove(item_key, disconnect=not owner.is_alive())
+
+    def clear(self):
+        with self._lock:
+            for item_key in list(self._items.keys()):
+                self._remove(item_key, disconnect=True)
+
+    def __len__(self):
+        return len(self._items)
+
+    def _take_free(self, key, thread):
+        """ moves handler of finished thread to the thread """
+        for item_key in self._items.keys():
+            if item_key[0] == key and not item_key[1].is_alive():
+                item = self._items.pop(item_key)
+                self._items[(key, thread)] = item
+                return item
+        return None
+
+    def _remove(self, item_key, disconnect=False):
+        handler, _ = self._items.pop(item_key)
+        if disconnect:
+            _disconnect(handler)
+
+    def _cleanup(self):
+        now = time.time()
+        free_keys = [
+            item_key
+            for item_key in self._items.keys()
+            if not item_key[1].is_alive()
+        ]
+        for item_key in free_keys:
+            if now - self._items[item_key][1] > self.idle_timeout:
+                self._remove(item_key, disconnect=True)
+        # least recently used first
+        for item_key in free_keys:
+            if len(self._items) <= self.max_size:
+                break
+            if item_key in self._items:
+                self._remove(item_key, disconnect=True)
+
+
+handlers_cache = HandlersCache()
@@ -0,0 +1,141 @@
+"""
+Process-wide cache of integrations metadata (lists of tables) used by information_schema.
+
+BI tools query information_schema on every connect, and without cache each query asks
+every integration for the list of its tables. Cached values live ttl seconds and are
+invalidated explicitly when integration is changed or DDL query is executed in it
+(in the current process; in other processes value expires by ttl).
+
+Missing values are fetched concurrently in a bounded thread pool. Integrations which
+are not responded in 'timeout' seconds are skipped, but fetching is not interrupted:
+its result will be stored in cache when it is finished.
+
+Configuration (timeouts in seconds):
+    "metadata_cache": {
+        "ttl": 60,
+        "max_workers": 8,
+        "timeout": 10
+    }
+"""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from mindsdb.interfaces.storage import db
+from mindsdb.utilities.config import Config
+from mindsdb.utilities.log import log
+
+
+class MetadataCache:
+    def __init__(self, ttl=None, max_workers=None, timeout=None):
+        config = Config().get('metadata_cache', {})
+        if ttl is None:
+            ttl = config.get('ttl', 60)
+        if max_workers is None:
+            max_workers = config.get('max_workers', 8)
+        if timeout is None:
+            timeout = config.get('timeout', 10)
+        self.ttl = ttl
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+        # (company_id, integration name) -> [value, creation time]
+        self._items = {}
+        self._lock = threading.Lock()
+        self._executor = None
+
+    @staticmethod
+    def _make_key(company_id, name):
+        return (company_id, name.lower())
+
+    def get(self, company_id, name):
+        key = self._make_key(company_id, name)
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            if time.time() - item[1] > self.ttl:
+                del self._items[key]
+                return None
+            return item[0]
+
+    def set(self, company_id, name, value):
+        with self._lock:
+            self._items[self._make_key(company_id, name)] = [value, time.time()]
+
+    def invalidate(self, company_id, name=None):
+        """ remove cached metadata of the integration, or of all integrations if name is None """
+        with self._lock:
+            if name is not None:
+                self._items.pop(self._make_key(company_id, name), None)
+            else:
+                for key in list(self._items.keys()):
+                    if key[0] == company_id:
+                        del self._items[key]
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def _get_executor(self):
+        with self._lock:
+            # threads are not recreated, so handlers cached for them can be reused
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='metadata_cache'
+                )
+            return self._executor
+
+    def _fetch(self, company_id, name, fetch_fn):
+        try:
+            value = fetch_fn(name)
+        finally:
+            # don't keep transaction open in the pool thread
+            db.session.remove()
+        self.set(company_id, name, value)
+        return value
+
+    def get_many(self, company_id, names, fetch_fn):
+        """ get metadata of integrations, fetch missing using fetch_fn(name)
+
+            Args:
+                company_id (int)
+                names (List[str]): names of integrations
+                fetch_fn (Callable): function to get metadata of one integration
+            Returns:
+                dict: name -> metadata. Integrations for which fetch_fn failed or
+                    not finished in time are not included
+        """
+        result = {}
+        missing = []
+        for name in names:
+            value = self.get(company_id, name)
+            if value is None:
+                missing.append(name)
+            else:
+                result[name] = value
+
+        if len(missing) == 0:
+            return result
+
+        executor = self._get_executor()
+        futures = {
+            executor.submit(self._fetch, company_id, name, fetch_fn): name
+            for name in missing
+        }
+        done, not_done = wait(futures, timeout=self.timeout)
+        for future in done:
+            name = futures[future]
+            try:
+                result[name] = future.result()
+            except Exception as e:
+                log.warning(f"Can't get metadata from '{name}': {e}")
+        for future in not_done:
+            log.warning(f"Can't get metadata from '{futures[future]}': timeout")
+
+        return result
+
+
+metadata_cache = MetadataCache()
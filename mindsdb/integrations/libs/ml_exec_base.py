@@ -57,6 +57,7 @@ from mindsdb.utilities.functions import mark_process
 from mindsdb.integrations.utilities.utils import format_exception_error
 from mindsdb.interfaces.database.database import DatabaseController
 from mindsdb.interfaces.storage.fs import ModelStorage, HandlerStorage
+from mindsdb.integrations.libs.model_cache import model_cache, get_folder_size
 
 import torch.multiprocessing as mp
 ctx = mp.get_context('spawn')
@@ -125,17 +126,26 @@ def predict_process(class_path, company_id, integration_id, predictor_id, df, re
     module = importlib.import_module(module_name)
     HandlerClass = getattr(module, class_name)
 
-    handlerStorage = HandlerStorage(company_id, integration_id)
-    modelStorage = ModelStorage(company_id, predictor_id)
+    predictor_record = db.Predictor.query.get(predictor_id)
 
-    ml_handler = HandlerClass(
-        engine_storage=handlerStorage,
-        model_storage=modelStorage,
-    )
+    # handler keeps loaded model between predictions.
+    # it is taken from the cache for the time of prediction: not used by concurrent predictions
+    cache_key = (predictor_id, predictor_record.updated_at)
+    cached = model_cache.checkout(cache_key)
+    if cached is not None:
+        ml_handler, model_size = cached
+    else:
+        model_size = None
+        handlerStorage = HandlerStorage(company_id, integration_id)
+        modelStorage = ModelStorage(company_id, predictor_id)
+
+        ml_handler = HandlerClass(
+            engine_storage=handlerStorage,
+            model_storage=modelStorage,
+        )
 
     # FIXME
     if class_name == 'LightwoodHandler':
-        predictor_record = db.Predictor.query.get(predictor_id)
         args['code'] = predictor_record.code
         args['target'] = predictor_record.to_predict[0]
         args['dtype_dict'] = predictor_record.dtype_dict
@@ -143,6 +153,10 @@ def predict_process(class_path, company_id, integration_id, predictor_id, df, re
 
     predictions = ml_handler.predict(df, args)
 
+    if model_size is None:
+        model_size = get_folder_size(ml_handler.model_storage.fileStorage.folder_path)
+    model_cache.set(cache_key, ml_handler, size=model_size)
+
     # mdb indexes
     if '__mindsdb_row_id' not in predictions.columns and '__mindsdb_row_id' in df.columns:
         predictions['__mindsdb_row_id'] = df['__mindsdb_row_id']
@@ -395,6 +409,8 @@ class BaseMLEngineExec:
         db.session.add(new_predictor_record)
         db.session.commit()
 
+        model_cache.invalidate(base_predictor_record.id)
+
         data_handler_meta = self.handler_controller.get_by_id(base_predictor_record.data_integration_id)
         data_handler = self.handler_controller.get_handler(data_handler_meta['name'])
         ast = self.parser(base_predictor_record.fetch_data_query, dialect=self.dialect)
@@ -522,6 +538,7 @@ class BaseMLEngineExec:
                     raise Exception('You are unable to delete models currently in progress, please wait before trying again')
 
         for predictor_record in predictors_records:
+            model_cache.invalidate(predictor_record.id)
             if is_cloud:
                 predictor_record.deleted_at = dt.datetime.now()
             else:
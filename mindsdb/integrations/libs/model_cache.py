@@ -0,0 +1,125 @@
+"""
+In-process cache of ML handlers with loaded models.
+
+Loading a model (pulling files from storage and deserializing it) is usually much more
+expensive than predicting with it. The cache keeps handler instances between
+predictions, so an engine can keep the loaded model on the instance.
+
+Entries are keyed by (predictor_id, version), where version is changed every time
+the predictor record is changed. Old entries are evicted in LRU order when total size
+of entries exceeds the budget. Size of entry is not less than min_entry_size: handler
+and loaded model take memory even if files of the model are small.
+
+Handlers are not thread-safe, so one handler is not used by concurrent predictions:
+prediction takes the handler out of the cache (checkout) and puts it back after use.
+Concurrent prediction with the same model loads its own copy of the model.
+
+Configuration (sizes in megabytes):
+    "model_cache": {
+        "max_size": 1024,
+        "min_entry_size": 1
+    }
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+from mindsdb.utilities.config import Config
+
+
+def get_folder_size(path) -> int:
+    """ total size of files in folder, is used as estimation of loaded model size """
+    size = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                size += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return size
+
+
+class ModelCache:
+    def __init__(self, max_size=None, min_entry_size=None):
+        """
+        Args:
+            max_size (int): memory budget of the cache in bytes
+            min_entry_size (int): min size of one entry in bytes
+        """
+        config = Config().get('model_cache', {})
+        if max_size is None:
+            max_size = config.get('max_size', 1024) * 1024 ** 2
+        if min_entry_size is None:
+            min_entry_size = config.get('min_entry_size', 1) * 1024 ** 2
+        self.max_size = max_size
+        self.min_entry_size = min_entry_size
+
+        # key -> (value, size). order of items is order of usage
+        self._items = OrderedDict()
+        self._total_size = 0
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._items)
+
+    @property
+    def total_size(self):
+        return self._total_size
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._items:
+                return None
+            self._items.move_to_end(key)
+            return self._items[key][0]
+
+    def checkout(self, key):
+        """ takes value out of the cache, it has to be returned by set after use
+
+            Returns:
+                tuple: (value, size) or None
+        """
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            self._pop(key)
+            return item
+
+    def set(self, key, value, size=0):
+        size = max(size, self.min_entry_size)
+        with self._lock:
+            self._pop(key)
+
+            if size > self.max_size:
+                # it will not fit anyway
+                return
+
+            self._items[key] = (value, size)
+            self._total_size += size
+
+            # evict least recently used
+            while self._total_size > self.max_size:
+                oldest_key = next(iter(self._items))
+                self._pop(oldest_key)
+
+    def invalidate(self, predictor_id):
+        """ remove all versions of predictor """
+        with self._lock:
+            for key in list(self._items.keys()):
+                if key[0] == predictor_id:
+                    self._pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._total_size = 0
+
+    def _pop(self, key):
+        item = self._items.pop(key, None)
+        if item is not None:
+            self._total_size -= item[1]
+
+
+model_cache = ModelCache()
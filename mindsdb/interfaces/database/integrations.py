@@ -1,3 +1,4 @@
+import ast
 import copy
 import base64
 import shutil
@@ -20,6 +21,12 @@ from mindsdb.integrations.libs.const import HANDLER_CONNECTION_ARG_TYPE as ARG_T
 from mindsdb.utilities.log import log
 from mindsdb.integrations.handlers_client.db_client import DBServiceClient
 from mindsdb.integrations.libs.const import PREDICTOR_STATUS
+from mindsdb.integrations.libs.handlers_cache import handlers_cache
+from mindsdb.integrations.libs.metadata_cache import metadata_cache
+
+
+# metadata of handlers, it is read once per process
+_handlers_static_meta = None
 
 
 class IntegrationController:
@@ -39,6 +46,7 @@ class IntegrationController:
         )
         session.add(integration_record)
         session.commit()
+        metadata_cache.invalidate(company_id, name)
         return integration_record.id
 
     def add(self, name, engine, connection_args, company_id=None):
@@ -48,8 +56,7 @@ class IntegrationController:
 
         log.debug("%s: add method calling name=%s, engine=%s, connection_args=%s, company_id=%s",
                   self.__class__.__name__, name, engine, connection_args, company_id)
-        handlers_meta = self.get_handlers_import_status()
-        handler_meta = handlers_meta[engine]
+        handler_meta = self.get_handler_meta(engine)
         accept_connection_args = handler_meta.get('connection_args')
         log.debug("%s: accept_connection_args - %s", self.__class__.__name__, accept_connection_args)
 
@@ -88,6 +95,12 @@ class IntegrationController:
 
         integration_record.data = data
         session.commit()
+        handlers_cache.invalidate(company_id, integration_record.id)
+        metadata_cache.invalidate(company_id, name)
+
+    def invalidate_metadata(self, name, company_id=None):
+        """ forget cached list of integration's tables, must be called after DDL queries """
+        metadata_cache.invalidate(company_id, name)
 
     def delete(self, name, company_id=None):
 
@@ -95,8 +108,8 @@ class IntegrationController:
             raise Exception('Unable to drop: is system database')
 
         # check permanent integration
-        if name in self.handler_modules:
-            handler = self.handler_modules[name]
+        if name in self.handlers_static_meta:
+            handler = self.get_handler_module(name)
 
             if getattr(handler, 'permanent', False) is True:
                 raise Exception('Unable to drop: is permanent integration')
@@ -136,6 +149,8 @@ class IntegrationController:
         #     FsStore().delete(folder_name)
         # except Exception:
         #     pass
+        handlers_cache.invalidate(company_id, integration_record.id)
+        metadata_cache.invalidate(company_id, name)
         session.delete(integration_record)
         session.commit()
 
@@ -178,10 +193,7 @@ class IntegrationController:
             ):
                 data['connection'] = None
 
-        integration_type = None
-        integration_module = self.handler_modules.get(integration_record.engine)
-        if hasattr(integration_module, 'type'):
-            integration_type = integration_module.type
+        integration_type = self.handlers_static_meta.get(integration_record.engine, {}).get('type')
 
         return {
             'id': integration_record.id,
@@ -242,7 +254,7 @@ class IntegrationController:
                 ViewController(),
                 company_id=company_id
             )
-        elif self.handler_modules.get(handler_type, False).type == HANDLER_TYPE.ML:
+        elif self.handlers_static_meta.get(handler_type, {}).get('type') == HANDLER_TYPE.ML:
             handler_ars['handler_controller'] = WithKWArgsWrapper(
                 IntegrationController(),
                 company_id=company_id
@@ -292,7 +304,7 @@ class IntegrationController:
         if as_service:
             log.debug("%s create_tmp_handler: create a client to db of %s type", self.__class__.__name__, handler_type)
             return DBServiceClient(handler_type, as_service=as_service, **handler_ars)
-        return self.handler_modules[handler_type].Handler(**handler_ars)
+        return self.get_handler_module(handler_type).Handler(**handler_ars)
 
     def get_handler(self, name, company_id=None, case_sensitive=False):
         if case_sensitive:
@@ -303,13 +315,27 @@ class IntegrationController:
                 & (func.lower(Integration.name) == func.lower(name))
             ).first()
 
+        if integration_record is None:
+            raise Exception(f"Can't find integration: {name}")
+
+        integration_engine = integration_record.engine
+        is_data_handler = (
+            self.handlers_static_meta.get(integration_engine, {}).get('type') == HANDLER_TYPE.DATA
+            and not (integration_record.data or {}).get('as_service', False)
+        )
+        if is_data_handler:
+            cache_key = handlers_cache.make_key(company_id, integration_record.id, integration_record.updated_at)
+            handler = handlers_cache.get(cache_key)
+            if handler is not None:
+                return handler
+
         integration_data = self._get_integration_record_data(integration_record, True)
         connection_data = integration_data.get('connection_data', {})
-        integration_engine = integration_data['engine']
         integration_name = integration_data['name']
         log.debug("%s get_handler: connection_data=%s, engine=%s", self.__class__.__name__, connection_data, integration_engine)
 
-        if integration_engine not in self.handler_modules:
+        handler_module = self.get_handler_module(integration_engine)
+        if handler_module is None:
             raise Exception(f"Cant find handler for '{integration_name}' ({integration_engine})")
 
         integration_meta = self.handlers_import_status[integration_engine]
@@ -342,7 +368,7 @@ class IntegrationController:
         handler_ars['file_storage'] = fs_store
         handler_ars['integration_id'] = integration_data['id']
 
-        handler_type = self.handler_modules[integration_engine].type
+        handler_type = handler_module.type
         if handler_type == 'ml':
             handler_ars['storage_factory'] = FileStorageFactory(
                 resource_group=RESOURCE_GROUP.PREDICTOR,
@@ -352,7 +378,7 @@ class IntegrationController:
         from mindsdb.integrations.libs.base import BaseMLEngine
         from mindsdb.integrations.libs.ml_exec_base import BaseMLEngineExec
 
-        HandlerClass = self.handler_modules[integration_engine].Handler
+        HandlerClass = handler_module.Handler
 
         if isinstance(HandlerClass, type) and issubclass(HandlerClass, BaseMLEngine):
             handler_ars['handler_class'] = HandlerClass
@@ -364,9 +390,22 @@ class IntegrationController:
             log.debug("%s get_handler: create a client to db service of %s type", self.__class__.__name__, handler_type)
             return DBServiceClient(handler_type, as_service=as_service, **handler_ars)
 
+        if is_data_handler:
+            # keep connection open between queries
+            try:
+                handler.connect()
+            except Exception as e:
+                log.warning(f"Can't connect to integration '{integration_name}': {e}")
+            else:
+                handlers_cache.set(cache_key, handler)
+
         return handler
 
     def reload_handler_module(self, handler_name):
+        if self.get_handler_module(handler_name) is None:
+            # import was failed, try again
+            self._import_handler(handler_name)
+            return
         importlib.reload(self.handler_modules[handler_name])
         try:
             handler_meta = self._get_handler_meta(self.handler_modules[handler_name])
@@ -447,34 +486,148 @@ class IntegrationController:
         return handler_meta
 
     def _load_handler_modules(self):
-        mindsdb_path = Path(importlib.util.find_spec('mindsdb').origin).parent
-        handlers_path = mindsdb_path.joinpath('integrations/handlers')
+        """ Handlers are not imported here (it is slow because of their dependencies).
+            Metadata which is required to find handler is read from handlers files,
+            modules are imported on first use.
+        """
+        global _handlers_static_meta
         self.handler_modules = {}
         self.handlers_import_status = {}
+        if _handlers_static_meta is None:
+            _handlers_static_meta = self._read_handlers_static_meta()
+        self.handlers_static_meta = _handlers_static_meta
+
+    def _read_handlers_static_meta(self):
+        mindsdb_path = Path(importlib.util.find_spec('mindsdb').origin).parent
+        handlers_path = mindsdb_path.joinpath('integrations/handlers')
+        handlers_meta = {}
         for handler_dir in handlers_path.iterdir():
             if handler_dir.is_dir() is False or handler_dir.name.startswith('__'):
                 continue
-            handler_folder_name = str(handler_dir.name)
-
             try:
-                handler_module = importlib.import_module(f'mindsdb.integrations.handlers.{handler_folder_name}')
-                handler_meta = self._get_handler_meta(handler_module)
-            except Exception as e:
-                handler_name = handler_folder_name
-                if handler_name.endswith('_handler'):
-                    handler_name = handler_name[:-8]
-                dependencies = self._read_dependencies(handler_dir)
-                handler_meta = {
-                    'import': {
-                        'success': False,
-                        'error_message': str(e),
-                        'folder': handler_folder_name,
-                        'dependencies': dependencies
-                    },
-                    'name': handler_name
-                }
-
-            self.handlers_import_status[handler_meta['name']] = handler_meta
+                handler_meta = self._get_handler_static_meta(handler_dir)
+            except Exception:
+                handler_meta = None
+            if handler_meta is None:
+                # can't be read without import
+                handler_meta = self._import_handler_folder(handler_dir.name)
+            handlers_meta[handler_meta['name']] = handler_meta
+        return handlers_meta
+
+    @staticmethod
+    def _read_module_constants(path):
+        """ values of constants of python file, including imported from '__about__' module """
+        constants = {}
+        tree = ast.parse(path.read_text())
+        for node in tree.body:
+            if (
+                isinstance(node, ast.Assign)
+                and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name)
+            ):
+                name = node.targets[0].id
+                value = node.value
+                if isinstance(value, ast.Constant):
+                    constants[name] = value.value
+                elif (
+                    isinstance(value, ast.Attribute)
+                    and isinstance(value.value, ast.Name)
+                    and value.value.id == 'HANDLER_TYPE'
+                ):
+                    constants[name] = getattr(HANDLER_TYPE, value.attr)
+            elif (
+                isinstance(node, ast.ImportFrom)
+                and node.level == 1
+                and node.module is not None
+                and node.module.split('.')[-1] == '__about__'
+            ):
+                about_file = path.parent.joinpath(*node.module.split('.')).with_suffix('.py')
+                if not about_file.is_file():
+                    continue
+                about_constants = IntegrationController._read_module_constants(about_file)
+                for alias in node.names:
+                    if alias.name in about_constants:
+                        constants[alias.asname or alias.name] = about_constants[alias.name]
+        return constants
+
+    def _get_handler_static_meta(self, handler_dir):
+        init_file = handler_dir.joinpath('__init__.py')
+        if not init_file.is_file():
+            return None
+
+        constants = self._read_module_constants(init_file)
+        if not isinstance(constants.get('name'), str) or 'type' not in constants:
+            return None
+
+        handler_meta = {
+            'import': {
+                # unknown until module is imported
+                'success': None,
+                'folder': handler_dir.name,
+                'dependencies': self._read_dependencies(handler_dir)
+            },
+        }
+        for attr in ('name', 'type', 'title', 'description', 'version', 'permanent'):
+            if attr in constants:
+                handler_meta[attr] = constants[attr]
+        if 'permanent' not in handler_meta:
+            handler_meta['permanent'] = handler_meta['name'] in ('files', 'views', 'lightwood')
+        return handler_meta
+
+    def _import_handler_folder(self, handler_folder_name):
+        try:
+            handler_module = importlib.import_module(f'mindsdb.integrations.handlers.{handler_folder_name}')
+            handler_meta = self._get_handler_meta(handler_module)
+        except Exception as e:
+            handler_name = handler_folder_name
+            if handler_name.endswith('_handler'):
+                handler_name = handler_name[:-8]
+            mindsdb_path = Path(importlib.util.find_spec('mindsdb').origin).parent
+            handler_dir = mindsdb_path.joinpath('integrations/handlers').joinpath(handler_folder_name)
+            dependencies = self._read_dependencies(handler_dir)
+            handler_meta = {
+                'import': {
+                    'success': False,
+                    'error_message': str(e),
+                    'folder': handler_folder_name,
+                    'dependencies': dependencies
+                },
+                'name': handler_name
+            }
+
+        if handler_meta['import']['success'] is not True:
+            log.info(
+                f"Dependencies for the handler '{handler_meta['name']}' are not installed by default. "
+                f"If you want to use it please install: {handler_meta['import']['dependencies']}"
+            )
+
+        self.handlers_import_status[handler_meta['name']] = handler_meta
+        return handler_meta
+
+    def _import_handler(self, handler_name):
+        static_meta = self.handlers_static_meta.get(handler_name)
+        if static_meta is None:
+            return
+        self._import_handler_folder(static_meta['import']['folder'])
+
+    def get_handler_module(self, handler_name):
+        """ returns module of handler, import it if it wasn't imported yet """
+        if handler_name not in self.handlers_import_status:
+            self._import_handler(handler_name)
+        return self.handler_modules.get(handler_name)
+
+    def get_handler_meta(self, handler_name):
+        """ returns import status and metadata of handler, import it if it wasn't imported yet """
+        if handler_name not in self.handlers_import_status:
+            self._import_handler(handler_name)
+        return self.handlers_import_status.get(handler_name)
+
+    def get_handlers_static_meta(self):
+        """ metadata of all handlers, without import of them """
+        return self.handlers_static_meta
 
     def get_handlers_import_status(self):
+        for handler_name in self.handlers_static_meta:
+            if handler_name not in self.handlers_import_status:
+                self._import_handler(handler_name)
         return self.handlers_import_status
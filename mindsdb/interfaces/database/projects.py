@@ -156,6 +156,24 @@ class Project:
 
         return columns
 
+    def get_models_columns(self) -> dict:
+        """ columns of all active models of the project, got by one query
+
+            Returns:
+                dict: model name -> list of columns
+        """
+        predictor_records = db.Predictor.query.filter_by(
+            company_id=self.company_id,
+            project_id=self.id,
+            deleted_at=sa.null(),
+            active=True
+        ).all()
+        return {
+            record.name: list(record.dtype_dict.keys())
+            for record in predictor_records
+            if isinstance(record.dtype_dict, dict)
+        }
+
 
 class ProjectController:
     def __init__(self):
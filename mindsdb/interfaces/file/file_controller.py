@@ -5,6 +5,7 @@ import shutil
 
 from mindsdb.interfaces.storage.db import session, File
 from mindsdb.integrations.handlers.file_handler import Handler as FileHandler
+from mindsdb.integrations.handlers.file_handler.file_handler import COLUMNAR_FILE_NAME
 from mindsdb.utilities.log import log
 from mindsdb.utilities.config import Config
 from mindsdb.interfaces.storage.fs import FsStore
@@ -96,6 +97,9 @@ class FileController():
             # NOTE may be delay between db record exists and file is really in folder
             shutil.move(file_path, str(source))
 
+            if file_name != COLUMNAR_FILE_NAME:
+                FileHandler.save_columnar_copy(df, str(source))
+
             self.fs_store.put(store_file_path, base_dir=self.dir)
         except Exception as e:
             log.error(e)
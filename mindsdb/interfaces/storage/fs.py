@@ -1,7 +1,9 @@
 import os
 import re
+import json
 import shutil
 import hashlib
+import threading
 from pathlib import Path
 from abc import ABC, abstractmethod
 from typing import Union, Optional
@@ -15,9 +17,15 @@ from mindsdb.integrations.libs.const import PREDICTOR_STATUS
 from checksumdir import dirhash
 try:
     import boto3
+    from boto3.s3.transfer import TransferConfig
 except Exception:
     # Only required for remote storage on s3
     pass
+try:
+    import fcntl
+except ImportError:
+    # not available on windows
+    fcntl = None
 
 from mindsdb.utilities.config import Config
 
@@ -103,45 +111,172 @@ class LocalFSStore(BaseFSStore):
         pass
 
 
+def file_hash(path):
+    md5 = hashlib.md5()
+    with open(path, 'rb') as fd:
+        for chunk in iter(lambda: fd.read(1024 * 1024), b''):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def get_folder_state(path, previous_state=None):
+    """ size, mtime and hash of each file in folder. Hash is not recalculated
+        for files with the same size and mtime as in previous_state
+
+        Returns:
+            dict: relative path -> [size, mtime_ns, hash]
+    """
+    previous_state = previous_state or {}
+    state = {}
+    for root, _, files in os.walk(path):
+        for name in files:
+            file_path = os.path.join(root, name)
+            rel_path = os.path.relpath(file_path, path)
+            stat = os.stat(file_path)
+            previous = previous_state.get(rel_path)
+            if previous is not None and previous[:2] == [stat.st_size, stat.st_mtime_ns]:
+                content_hash = previous[2]
+            else:
+                content_hash = file_hash(file_path)
+            state[rel_path] = [stat.st_size, stat.st_mtime_ns, content_hash]
+    return state
+
+
+def is_same_content(state_a, state_b):
+    if state_a.keys() != state_b.keys():
+        return False
+    return all(state_a[key][2] == state_b[key][2] for key in state_a)
+
+
+class _FolderLock:
+    """ prevents simultaneous sync of the same folder by threads and processes """
+
+    _thread_locks = {}
+    _thread_locks_lock = threading.Lock()
+
+    def __init__(self, lock_path):
+        self.lock_path = lock_path
+        with self._thread_locks_lock:
+            self.thread_lock = self._thread_locks.setdefault(lock_path, threading.Lock())
+        self.fd = None
+
+    def __enter__(self):
+        self.thread_lock.acquire()
+        if fcntl is not None:
+            self.fd = open(self.lock_path, 'w')
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *args):
+        if self.fd is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+            self.fd.close()
+            self.fd = None
+        self.thread_lock.release()
+
+
 class S3FSStore(BaseFSStore):
     """Storage that stores files in amazon s3
+
+    Folder is stored as one archive. Next to the local copy of the folder there is manifest
+    with ETag of the archive and state of files (size, mtime, hash) after last sync. It is used
+    to skip download if the archive is not changed and local copy is not modified, and to skip
+    upload if files are not changed. Archive is transferred by parts in parallel.
+
+    Configuration:
+        "permanent_storage": {
+            "location": "s3",
+            "bucket": "...",
+            "max_concurrency": 10,
+            "multipart_chunksize": 64
+        }
     """
 
     def __init__(self):
         super().__init__()
-        if 's3_credentials' in self.config['permanent_storage']:
-            self.s3 = boto3.client('s3', **self.config['permanent_storage']['s3_credentials'])
+        permanent_storage_config = self.config['permanent_storage']
+        if 's3_credentials' in permanent_storage_config:
+            self.s3 = boto3.client('s3', **permanent_storage_config['s3_credentials'])
         else:
             self.s3 = boto3.client('s3')
-        self.bucket = self.config['permanent_storage']['bucket']
+        self.bucket = permanent_storage_config['bucket']
+        chunksize = permanent_storage_config.get('multipart_chunksize', 64) * 1024 ** 2
+        self.transfer_config = TransferConfig(
+            multipart_threshold=chunksize,
+            multipart_chunksize=chunksize,
+            max_concurrency=permanent_storage_config.get('max_concurrency', 10)
+        )
+
+    @staticmethod
+    def _manifest_path(local_name, base_dir):
+        return os.path.join(base_dir, f'.{local_name}.manifest.json')
+
+    def _read_manifest(self, local_name, base_dir):
+        try:
+            with open(self._manifest_path(local_name, base_dir), 'rt') as fd:
+                return json.load(fd)
+        except (OSError, ValueError):
+            return None
+
+    def _write_manifest(self, local_name, base_dir, etag, state):
+        with open(self._manifest_path(local_name, base_dir), 'wt') as fd:
+            json.dump({'etag': etag, 'files': state}, fd)
+
+    def _get_remote_etag(self, remote_ziped_name):
+        return self.s3.head_object(Bucket=self.bucket, Key=remote_ziped_name)['ETag']
 
     def get(self, local_name, base_dir):
         remote_name = local_name
         remote_ziped_name = f'{remote_name}.tar.gz'
         local_ziped_name = f'{local_name}.tar.gz'
         local_ziped_path = os.path.join(base_dir, local_ziped_name)
+        local_path = os.path.join(base_dir, local_name)
         os.makedirs(base_dir, exist_ok=True)
-        self.s3.download_file(self.bucket, remote_ziped_name, local_ziped_path)
-        shutil.unpack_archive(local_ziped_path, base_dir)
-        os.system(f'chmod -R 777 {base_dir}')
-        os.remove(local_ziped_path)
+
+        with _FolderLock(os.path.join(base_dir, f'.{local_name}.lock')):
+            etag = self._get_remote_etag(remote_ziped_name)
+            manifest = self._read_manifest(local_name, base_dir)
+            if manifest is not None and manifest['etag'] == etag and os.path.exists(local_path):
+                state = get_folder_state(local_path, manifest['files'])
+                if is_same_content(state, manifest['files']):
+                    # local copy is actual
+                    return
+
+            self.s3.download_file(self.bucket, remote_ziped_name, local_ziped_path, Config=self.transfer_config)
+            shutil.unpack_archive(local_ziped_path, base_dir)
+            os.system(f'chmod -R 777 {base_dir}')
+            os.remove(local_ziped_path)
+
+            self._write_manifest(local_name, base_dir, etag, get_folder_state(local_path))
 
     def put(self, local_name, base_dir):
-        # NOTE: This `make_archive` function is implemente poorly and will create an empty archive file even if
-        # the file/dir to be archived doesn't exist or for some other reason can't be archived
         remote_name = local_name
-        shutil.make_archive(
-            os.path.join(base_dir, remote_name),
-            'gztar',
-            root_dir=base_dir,
-            base_dir=local_name
-        )
-        self.s3.upload_file(
-            os.path.join(base_dir, f'{remote_name}.tar.gz'),
-            self.bucket,
-            f'{remote_name}.tar.gz'
-        )
-        os.remove(os.path.join(base_dir, remote_name + '.tar.gz'))
+        local_path = os.path.join(base_dir, local_name)
+
+        with _FolderLock(os.path.join(base_dir, f'.{local_name}.lock')):
+            manifest = self._read_manifest(local_name, base_dir)
+            state = get_folder_state(local_path, manifest['files'] if manifest is not None else None)
+            if manifest is not None and is_same_content(state, manifest['files']):
+                # nothing is changed since last sync
+                return
+
+            # NOTE: This `make_archive` function is implemente poorly and will create an empty archive file even if
+            # the file/dir to be archived doesn't exist or for some other reason can't be archived
+            shutil.make_archive(
+                os.path.join(base_dir, remote_name),
+                'gztar',
+                root_dir=base_dir,
+                base_dir=local_name
+            )
+            self.s3.upload_file(
+                os.path.join(base_dir, f'{remote_name}.tar.gz'),
+                self.bucket,
+                f'{remote_name}.tar.gz',
+                Config=self.transfer_config
+            )
+            os.remove(os.path.join(base_dir, remote_name + '.tar.gz'))
+
+            self._write_manifest(local_name, base_dir, self._get_remote_etag(f'{remote_name}.tar.gz'), state)
 
     def delete(self, remote_name):
         self.s3.delete_object(Bucket=self.bucket, Key=remote_name)
@@ -19,7 +19,14 @@ How to use it:
 Configuration:
 
 - max_size size of cache in count of records, default is 50
-- serializer, module for serialization, default is dill
+- max_bytes size of cache in bytes, not limited by default
+- ttl time to live of records in seconds, not limited by default
+- memory_max_size size of in-memory cache (L1) in megabytes, default is 64. 0 to disable it
+- serializer, module for serialization, default is dill. DataFrames are always serialized
+  with pickle protocol 5
+- index_refresh_interval, for FileCache: seconds after which the list of files is re-read
+  from the folder, default is 5. Folder is shared by processes (http and mysql api): files
+  written by other processes are counted in limits after re-reading
 
 It can be set via:
 - get_cache function:
@@ -31,6 +38,18 @@ It can be set via:
         "type": "redis",
         "max_size": 2
     }
+- settings can be overridden for specific category:
+    "cache": {
+        "max_bytes": 1073741824,
+        "namespaces": {
+            "predict": {"max_bytes": 268435456, "ttl": 3600, "memory_max_size": 128}
+        }
+    }
+
+Two levels:
+
+By default get_cache returns TieredCache: in-memory LRU (MemoryCache) over FileCache or
+RedisCache. Counters of hits, misses and evictions are returned by cache.get_stats()
 
 Cache engines:
 
@@ -46,6 +65,21 @@ By default is used local redis server. You can specify
         }
     }
 
+Row level cache:
+
+    RowsCache stores values for separate rows of dataframe, rows are identified by
+    vectorized hash of their values (see dataframe_rows_checksums):
+
+    cache = RowsCache()
+    hashes = dataframe_rows_checksums(df)
+    values = cache.get_many(namespace, hashes)  # None for missed rows
+    cache.set_many(namespace, hashes, new_values)
+
+    Cache is stored in memory of the process. Size in count of rows, default is 100000:
+    "cache": {
+        "rows_max_size": 100000
+    }
+
 How to test:
 
     env PYTHONPATH=./ pytest tests/unit/test_cache.py
@@ -54,10 +88,13 @@ How to test:
 
 import os
 import time
+import threading
 from abc import ABC
 from pathlib import Path
+from collections import OrderedDict
 import hashlib
 import json
+import pickle
 import dill
 import pandas as pd
 import walrus
@@ -71,6 +108,30 @@ def dataframe_checksum(df: pd.DataFrame):
     return checksum
 
 
+def dataframe_rows_checksums(df: pd.DataFrame):
+    """ 64-bit hash of every row of dataframe, calculated vectorized.
+        Columns names are not included in hash.
+
+        Returns:
+            numpy.ndarray of uint64
+    """
+    # values of object columns are hashed by their string form: 1, '1' and 1.0 are
+    # the same. Types of values are hashed with them
+    types = [
+        df.iloc[:, i].map(lambda val: type(val).__name__)
+        for i, dtype in enumerate(df.dtypes)
+        if dtype == object
+    ]
+    if len(types) > 0:
+        df = pd.concat([df] + types, axis=1, ignore_index=True)
+    try:
+        hashes = pd.util.hash_pandas_object(df, index=False)
+    except TypeError:
+        # not hashable values: lists, dicts
+        hashes = pd.util.hash_pandas_object(df.astype(str), index=False)
+    return hashes.to_numpy()
+
+
 def json_checksum(obj: [dict, list]):
     checksum = str_checksum(CustomJSONEncoder().encode(obj))
     return checksum
@@ -82,11 +143,17 @@ def str_checksum(obj: str):
 
 
 class BaseCache(ABC):
-    def __init__(self, max_size=None, serializer=None):
+    def __init__(self, max_size=None, serializer=None, max_bytes=None, ttl=None):
         self.config = Config()
         if max_size is None:
             max_size = self.config["cache"].get("max_size", 50)
         self.max_size = max_size
+        if max_bytes is None:
+            max_bytes = self.config["cache"].get("max_bytes")
+        self.max_bytes = max_bytes
+        if ttl is None:
+            ttl = self.config["cache"].get("ttl")
+        self.ttl = ttl
         if serializer is None:
             serializer_module = self.config["cache"].get('serializer')
             if serializer_module == 'pickle':
@@ -95,6 +162,10 @@ class BaseCache(ABC):
                 import dill as s_module
             self.serializer = s_module
 
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
     # default functions
 
     def set_df(self, name, df):
@@ -103,15 +174,97 @@ class BaseCache(ABC):
     def get_df(self, name):
         return self.get(name)
 
+    def set(self, name, value):
+        self.set_raw(name, self.serialize(value))
+
+    def get(self, name):
+        value = self.get_raw(name)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self.deserialize(value)
+
     def serialize(self, value):
+        if isinstance(value, pd.DataFrame):
+            # protocol 5 stores numpy buffers without copying them into intermediate objects.
+            # dill and pickle are able to load it
+            return pickle.dumps(value, protocol=5)
         return self.serializer.dumps(value)
 
     def deserialize(self, value):
         return self.serializer.loads(value)
 
+    def get_stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+
+class MemoryCache(BaseCache):
+    """
+        In-memory LRU cache of serialized values. It is bounded by size of values in bytes.
+        Values are stored serialized: cached object can't be changed by consumer of the cache
+    """
+    def __init__(self, category, **kwargs):
+        super().__init__(**kwargs)
+        self.category = category
+        # name -> (value, expire time)
+        self._items = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def set_raw(self, name, value):
+        if self.max_bytes is not None and len(value) > self.max_bytes:
+            return
+        expire_at = None
+        if self.ttl is not None:
+            expire_at = time.time() + self.ttl
+        with self._lock:
+            self._delete(name)
+            self._items[name] = (value, expire_at)
+            self._total_bytes += len(value)
+            self.clear_old_cache()
+
+    def get_raw(self, name):
+        with self._lock:
+            item = self._items.get(name)
+            if item is None:
+                return None
+            value, expire_at = item
+            if expire_at is not None and expire_at < time.time():
+                self._delete(name)
+                return None
+            self._items.move_to_end(name)
+            return value
+
+    def clear_old_cache(self):
+        while len(self._items) > 0 and (
+            self.max_size is not None and len(self._items) > self.max_size
+            or self.max_bytes is not None and self._total_bytes > self.max_bytes
+        ):
+            value, _ = self._items.popitem(last=False)[1]
+            self._total_bytes -= len(value)
+            self.evictions += 1
+
+    def delete(self, name):
+        with self._lock:
+            self._delete(name)
+
+    def _delete(self, name):
+        item = self._items.pop(name, None)
+        if item is not None:
+            self._total_bytes -= len(item[0])
+
+    @property
+    def total_bytes(self):
+        return self._total_bytes
+
 
 class FileCache(BaseCache):
-    def __init__(self, category, path=None, **kwargs):
+    def __init__(self, category, path=None, index_refresh_interval=None, **kwargs):
         super().__init__(**kwargs)
 
         if path is None:
@@ -124,21 +277,71 @@ class FileCache(BaseCache):
 
         self.path = cache_path
 
+        if index_refresh_interval is None:
+            index_refresh_interval = self.config['cache'].get('index_refresh_interval', 5)
+        self.index_refresh_interval = index_refresh_interval
+
+        # index of files: name -> size, ordered by modification time.
+        # is used to remove old files without listing the folder on every adding. It is
+        # re-read periodically to include files of other processes
+        self._index = None
+        self._index_loaded_at = 0
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def _check_index(self):
+        if self._index is None or time.time() - self._index_loaded_at > self.index_refresh_interval:
+            self._load_index()
+
+    def _load_index(self):
+        files = []
+        for file in Path(self.path).iterdir():
+            try:
+                stat = file.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, file.name, stat.st_size))
+        files.sort()
+        self._index = OrderedDict((name, size) for _, name, size in files)
+        self._total_bytes = sum(self._index.values())
+        self._index_loaded_at = time.time()
+
+    def _index_add(self, name, size):
+        with self._lock:
+            self._check_index()
+            self._index_remove(name)
+            self._index[name] = size
+            self._total_bytes += size
+
+    def _index_remove(self, name):
+        if self._index is not None and name in self._index:
+            self._total_bytes -= self._index.pop(name)
+
     def clear_old_cache(self):
         # buffer to delete, to not run delete on every adding
         buffer_size = 5
 
-        if self.max_size is None:
-            return
+        with self._lock:
+            self._check_index()
 
-        cur_count = len(os.listdir(self.path))
+            # remove oldest
+            if self.max_size is not None and len(self._index) > self.max_size + buffer_size:
+                while len(self._index) > self.max_size:
+                    self._evict_oldest()
 
-        # remove oldest
-        if cur_count > self.max_size + buffer_size:
+            if self.max_bytes is not None:
+                while len(self._index) > 0 and self._total_bytes > self.max_bytes:
+                    self._evict_oldest()
 
-            files = sorted(Path(self.path).iterdir(), key=os.path.getmtime)
-            for file in files[:cur_count-self.max_size]:
-                self.delete_file(file)
+    def _evict_oldest(self):
+        name, size = self._index.popitem(last=False)
+        self._total_bytes -= size
+        self.evictions += 1
+        try:
+            os.unlink(self.file_path(name))
+        except FileNotFoundError:
+            # was removed by another process
+            pass
 
     def file_path(self, name):
         return self.path / name
@@ -146,38 +349,50 @@ class FileCache(BaseCache):
     def set_df(self, name, df):
         path = self.file_path(name)
         df.to_pickle(path)
+        self._index_add(name, os.path.getsize(path))
         self.clear_old_cache()
 
-    def set(self, name, value):
+    def set_raw(self, name, value):
         path = self.file_path(name)
-        value = self.serialize(value)
 
         with open(path, 'wb') as fd:
             fd.write(value)
+        self._index_add(name, len(value))
         self.clear_old_cache()
 
+    def _is_expired(self, path):
+        if self.ttl is None:
+            return False
+        try:
+            return os.path.getmtime(path) + self.ttl < time.time()
+        except FileNotFoundError:
+            return True
+
     def get_df(self, name):
         path = self.file_path(name)
 
-        if not os.path.exists(path):
+        if not os.path.exists(path) or self._is_expired(path):
             return None
         return pd.read_pickle(path)
 
-    def get(self, name):
+    def get_raw(self, name):
         path = self.file_path(name)
 
-        if not os.path.exists(path):
+        if self._is_expired(path):
+            return None
+        try:
+            with open(path, 'rb') as fd:
+                return fd.read()
+        except FileNotFoundError:
             return None
-        with open(path, 'rb') as fd:
-            value = fd.read()
-        value = self.deserialize(value)
-        return value
 
     def delete(self, name):
         path = self.file_path(name)
         self.delete_file(path)
 
     def delete_file(self, path):
+        with self._lock:
+            self._index_remove(Path(path).name)
         os.unlink(path)
 
 
@@ -186,6 +401,8 @@ class RedisCache(BaseCache):
         super().__init__(**kwargs)
 
         self.category = category
+        # sorted set of keys, score is modification time
+        self.index_key = f'{category}__index'
 
         if connection_info is None:
             # if no params will be used local redis
@@ -200,41 +417,30 @@ class RedisCache(BaseCache):
         # buffer to delete, to not run delete on every adding
         buffer_size = 5
 
-        cur_count = self.client.hlen(self.category)
+        cur_count = self.client.zcard(self.index_key)
 
         # remove oldest
         if cur_count > self.max_size + buffer_size:
-            # 5 is buffer to delete, to not run delete on every adding
-
-            keys = self.client.hgetall(self.category)
-            # to list
-            keys = list(keys.items())
-            # sort by timestamp
-            keys.sort(key=lambda x: x[1])
-
-            for key, _ in keys[:cur_count - self.max_size]:
+            keys = self.client.zrange(self.index_key, 0, cur_count - self.max_size - 1)
+            for key in keys:
                 self.delete_key(key)
+                self.evictions += 1
 
     def redis_key(self, name):
         return f'{self.category}_{name}'
 
-    def set(self, name, value):
+    def set_raw(self, name, value):
         key = self.redis_key(name)
-        value = self.serialize(value)
 
-        self.client.set(key, value)
-        # using key with category name to store all keys with modify time
-        self.client.hset(self.category, key, int(time.time()*1000))
+        # expired keys are deleted by redis, and skipped by index on eviction
+        self.client.set(key, value, ex=self.ttl)
+        self.client.zadd(self.index_key, {key: time.time()})
 
         self.clear_old_cache(key)
 
-    def get(self, name):
+    def get_raw(self, name):
         key = self.redis_key(name)
-        value = self.client.get(key)
-        if value is None:
-            # no value in cache
-            return None
-        return self.deserialize(value)
+        return self.client.get(key)
 
     def delete(self, name):
         key = self.redis_key(name)
@@ -243,7 +449,98 @@ class RedisCache(BaseCache):
 
     def delete_key(self, key):
         self.client.delete(key)
-        self.client.hdel(self.category, key)
+        self.client.zrem(self.index_key, key)
+
+
+class TieredCache(BaseCache):
+    """
+        Two levels cache: in-memory LRU (L1) over file or redis cache (L2).
+        Values are found in L2 are copied to L1
+    """
+    def __init__(self, category, storage, memory_max_bytes=None, **kwargs):
+        super().__init__(**kwargs)
+        self.category = category
+        self.storage = storage
+        self.memory = MemoryCache(category, max_size=self.max_size, max_bytes=memory_max_bytes, ttl=self.ttl)
+        self.memory_hits = 0
+
+    def set_df(self, name, df):
+        self.set(name, df)
+
+    def get_df(self, name):
+        return self.get(name)
+
+    def set_raw(self, name, value):
+        self.memory.set_raw(name, value)
+        self.storage.set_raw(name, value)
+
+    def get_raw(self, name):
+        value = self.memory.get_raw(name)
+        if value is not None:
+            self.memory_hits += 1
+            return value
+        value = self.storage.get_raw(name)
+        if value is not None:
+            self.memory.set_raw(name, value)
+        return value
+
+    def delete(self, name):
+        self.memory.delete(name)
+        self.storage.delete(name)
+
+    def get_stats(self):
+        stats = super().get_stats()
+        stats['memory_hits'] = self.memory_hits
+        stats['evictions'] = self.memory.evictions + self.storage.evictions
+        return stats
+
+
+class RowsCache:
+    """
+        In-memory LRU cache of values of separate rows.
+        Keys are (namespace, row_hash)
+    """
+    def __init__(self, max_size=None):
+        config = Config()
+        if max_size is None:
+            max_size = config["cache"].get("rows_max_size", 100000)
+        self.max_size = max_size
+        self.enabled = config["cache"]["type"] != 'none'
+
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, namespace, hashes):
+        """ returns list of values, None for not cached rows """
+        if not self.enabled:
+            return [None] * len(hashes)
+        values = []
+        with self._lock:
+            for row_hash in hashes:
+                key = (namespace, row_hash)
+                value = self._items.get(key)
+                if value is not None:
+                    self._items.move_to_end(key)
+                values.append(value)
+        return values
+
+    def set_many(self, namespace, hashes, values):
+        if not self.enabled:
+            return
+        with self._lock:
+            for row_hash, value in zip(hashes, values):
+                key = (namespace, row_hash)
+                self._items[key] = value
+                self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
 
 
 class NoCache:
@@ -262,9 +559,28 @@ class NoCache:
 
 def get_cache(category, **kwargs):
     config = Config()
-    if config.get('cache')['type'] == 'redis':
-        return RedisCache(category, **kwargs)
-    if config.get('cache')['type'] == 'none':
+    cache_config = config.get('cache')
+    if cache_config['type'] == 'none':
         return NoCache(category, **kwargs)
+
+    # settings of category override common settings
+    category_config = cache_config.get('namespaces', {}).get(category, {})
+    for key in ('max_size', 'max_bytes', 'ttl'):
+        if key in category_config:
+            kwargs.setdefault(key, category_config[key])
+
+    if cache_config['type'] == 'redis':
+        storage = RedisCache(category, **kwargs)
     else:
-        return FileCache(category, **kwargs)
+        storage = FileCache(category, **kwargs)
+
+    # in megabytes
+    memory_max_size = category_config.get('memory_max_size', cache_config.get('memory_max_size', 64))
+    if not memory_max_size:
+        return storage
+    return TieredCache(
+        category,
+        storage,
+        memory_max_bytes=memory_max_size * 1024 ** 2,
+        **kwargs
+    )
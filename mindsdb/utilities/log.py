@@ -1,6 +1,10 @@
 import os
 import sys
+import time
+import queue
 import logging
+import datetime
+import threading
 import traceback
 
 from mindsdb.interfaces.storage.db import session, Log
@@ -48,10 +52,71 @@ class LoggerWrapper(object):
         return 1  # stdout
 
 class DbHandler(logging.Handler):
-    def __init__(self):
+    """ Writes records to 'log' table.
+
+        Records are put to bounded queue and written by background thread in batches,
+        so logging thread is not blocked by database. If queue is full, new records are dropped.
+        Repeated messages (same source and text) are sampled: not more than
+        sample_limit records per sample_window seconds.
+
+        It is attached to logger only if it is enabled in config (disabled by default).
+
+        Configuration:
+            "log": {
+                "db_sink": {
+                    "enabled": true,
+                    "queue_size": 10000,
+                    "batch_size": 100,
+                    "flush_interval": 1,
+                    "sample_window": 60,
+                    "sample_limit": 10
+                }
+            }
+    """
+    def __init__(self, queue_size=None, batch_size=None, flush_interval=None,
+                 sample_window=None, sample_limit=None):
         logging.Handler.__init__(self)
         self.company_id = os.environ.get('MINDSDB_COMPANY_ID', None)
 
+        sink_config = global_config['log'].get('db_sink', {})
+        self.batch_size = batch_size or sink_config.get('batch_size', 100)
+        self.flush_interval = flush_interval or sink_config.get('flush_interval', 1)
+        self.sample_window = sample_window or sink_config.get('sample_window', 60)
+        self.sample_limit = sample_limit or sink_config.get('sample_limit', 10)
+
+        self.queue = queue.Queue(maxsize=queue_size or sink_config.get('queue_size', 10000))
+        self.dropped = 0
+        self.suppressed = 0
+        # (source, message) -> [window start, count]
+        self._samples = {}
+        self._samples_lock = threading.Lock()
+
+        self._stop_event = threading.Event()
+        self._writer = threading.Thread(target=self._writer_loop, name='mindsdb_log_writer', daemon=True)
+        self._writer.start()
+
+    def _is_sampled_out(self, source, payload):
+        now = time.time()
+        key = (source, payload)
+        with self._samples_lock:
+            sample = self._samples.get(key)
+            if sample is None or now - sample[0] > self.sample_window:
+                if len(self._samples) > 1000:
+                    self._samples.clear()
+                self._samples[key] = [now, 1]
+                return False
+            sample[1] += 1
+            if sample[1] > self.sample_limit:
+                self.suppressed += 1
+                return True
+            return False
+
+    def _put(self, row):
+        try:
+            self.queue.put_nowait(row)
+        except queue.Full:
+            self.dropped += 1
+
     def emit(self, record):
         self.format(record)
         if (
@@ -64,6 +129,9 @@ class DbHandler(logging.Handler):
         source = f'file: {record.pathname} - line: {record.lineno}'
         payload = record.msg
 
+        if self._is_sampled_out(source, str(payload)):
+            return
+
         if telemtry_enabled:
             pass
             # @TODO: Enable once we are sure no sensitive info is being outputed in the logs
@@ -81,11 +149,13 @@ class DbHandler(logging.Handler):
             #        level='debug',
             #    )
 
+        created_at = datetime.datetime.fromtimestamp(record.created)
         if log_type in ['ERROR', 'WARNING']:
             trace = str(traceback.format_stack(limit=20))
-            trac_log = Log(log_type='traceback', source=source, payload=trace, company_id=self.company_id)
-            session.add(trac_log)
-            session.commit()
+            self._put(dict(
+                log_type='traceback', source=source, payload=trace,
+                company_id=self.company_id, created_at=created_at
+            ))
 
             if telemtry_enabled:
                 add_breadcrumb(
@@ -98,9 +168,47 @@ class DbHandler(logging.Handler):
                 if log_type in ['WARNING']:
                     capture_message(str(payload))
 
-        log = Log(log_type=str(log_type), source=source, payload=str(payload), company_id=self.company_id)
-        session.add(log)
-        session.commit()
+        self._put(dict(
+            log_type=str(log_type), source=source, payload=str(payload),
+            company_id=self.company_id, created_at=created_at
+        ))
+
+    def _write(self, rows):
+        try:
+            session.bulk_insert_mappings(Log, rows)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            # can't use logger here
+            print(f'Error during writing logs to db: {e}', file=sys.__stderr__)
+
+    def _writer_loop(self):
+        while not self._stop_event.is_set() or not self.queue.empty():
+            rows = []
+            deadline = time.time() + self.flush_interval
+            while len(rows) < self.batch_size:
+                timeout = deadline - time.time()
+                if timeout <= 0:
+                    break
+                try:
+                    rows.append(self.queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            if len(rows) > 0:
+                self._write(rows)
+                for _ in rows:
+                    self.queue.task_done()
+
+    def flush(self):
+        """ wait until all records in queue are written """
+        if self._writer.is_alive():
+            self.queue.join()
+
+    def close(self):
+        self._stop_event.set()
+        self.flush()
+        self._writer.join(timeout=self.flush_interval * 2)
+        logging.Handler.close(self)
 
 
 def fmt_log_record(log_record):
@@ -160,10 +268,11 @@ def initialize_log(config=global_config, logger_name='main', wrap_print=False):
     console_handler.setFormatter(formatter)
     log.addHandler(console_handler)
 
-    # db_handler = DbHandler()
-    # db_handler.setLevel(config['log']['level'].get('db', logging.WARNING))
-    # db_handler.setFormatter(formatter)
-    # log.addHandler(db_handler)
+    if config['log'].get('db_sink', {}).get('enabled', False) is True:
+        db_handler = DbHandler()
+        db_handler.setLevel(config['log']['level'].get('db', logging.WARNING))
+        db_handler.setFormatter(formatter)
+        log.addHandler(db_handler)
 
     if wrap_print:
         sys.stdout = LoggerWrapper([log.debug, log.info, log.warning, log.error], 1)
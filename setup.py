@@ -58,6 +58,10 @@ setup(
     long_description_content_type="text/markdown",
     packages=find_packages(),
     install_requires=pkgs,
+    extras_require={
+        # zstd compression of mysql protocol, zlib is used without it
+        'zstd': ['zstandard >= 0.15'],
+    },
     dependency_links=new_links,
     include_package_data=True,
     classifiers=[
@@ -76,6 +76,9 @@ class BaseUnitTest:
         db.session.flush()
         self.lw_integration_id = r.id
         db.session.commit()
+
+        from mindsdb.integrations.libs.metadata_cache import metadata_cache
+        metadata_cache.clear()
         return db
 
     @staticmethod
@@ -141,10 +144,14 @@ class BaseExecutorTest(BaseUnitTest):
         self.command_executor = ExecuteCommands(sql_session, executor=None)
 
         # disable cache. it is need to check predictor input
-        config_patch = mock.patch('mindsdb.utilities.cache.FileCache.get')
+        config_patch = mock.patch('mindsdb.utilities.cache.BaseCache.get')
         self.mock_config = config_patch.__enter__()
         self.mock_config.side_effect = lambda x: None
 
+        rows_cache_patch = mock.patch('mindsdb.utilities.cache.RowsCache.get_many')
+        self.mock_rows_cache = rows_cache_patch.__enter__()
+        self.mock_rows_cache.side_effect = lambda namespace, hashes: [None] * len(hashes)
+
     def set_handler(self, mock_handler, name, tables, engine='postgres'):
         # integration
         # delete by name
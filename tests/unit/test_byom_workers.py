@@ -0,0 +1,64 @@
+import pickle
+import unittest
+
+import pandas as pd
+
+from mindsdb.integrations.handlers.byom_handler.worker_pool import BYOMWorkerPool, WorkerCrashedError
+
+MODEL_CODE = '''
+import os
+
+
+class Model:
+    def train(self, df, target):
+        pass
+
+    def predict(self, df):
+        if df['x'][0] == -1:
+            os._exit(1)
+        df['y'] = df['x'] * self.k
+        df['pid'] = os.getpid()
+        return df
+'''
+
+
+class TestBYOMWorkers(unittest.TestCase):
+
+    def test_pool(self):
+        pool = BYOMWorkerPool(workers=1, max_calls=3, max_memory=10000)
+        loads = []
+
+        def predict(x, model_id=1):
+            def get_model():
+                loads.append(model_id)
+                return pickle.dumps({'k': model_id * 10})
+
+            df = pd.DataFrame({'x': [x]})
+            return pool.predict(
+                (None, model_id, 'hash'), df, get_code=lambda: MODEL_CODE, get_model=get_model
+            )
+
+        try:
+            res1 = predict(1)
+            assert res1['y'][0] == 10
+            # model is loaded once and worker is reused
+            res2 = predict(2)
+            assert res2['y'][0] == 20
+            assert res2['pid'][0] == res1['pid'][0]
+            assert loads == [1]
+
+            res3 = predict(1, model_id=2)
+            assert res3['y'][0] == 20
+            assert res3['pid'][0] == res1['pid'][0]
+            assert loads == [1, 2]
+
+            # worker is recycled after 3 calls
+            res4 = predict(1)
+            assert res4['pid'][0] != res1['pid'][0]
+
+            # crash of worker fails only current call
+            with self.assertRaises(WorkerCrashedError):
+                predict(-1)
+            assert predict(3)['y'][0] == 30
+        finally:
+            pool.shutdown()
@@ -1,4 +1,5 @@
 import datetime as dt
+import tempfile
 import time
 import unittest
 import traceback
@@ -7,7 +8,10 @@ import warnings
 
 import pandas as pd
 
-from mindsdb.utilities.cache import get_cache, RedisCache, FileCache, dataframe_checksum
+from mindsdb.utilities.cache import (
+    get_cache, RedisCache, FileCache, RowsCache, MemoryCache, TieredCache,
+    dataframe_checksum, dataframe_rows_checksums
+)
 
 
 class TestCashe(unittest.TestCase):
@@ -26,6 +30,89 @@ class TestCashe(unittest.TestCase):
 
         self.cache_test(cache)
 
+    def test_file_shared_folder(self):
+        # folder is shared by processes: files of other instance are evicted too
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_a = FileCache('predict', path=tmp_dir, max_size=2, index_refresh_interval=0)
+            cache_b = FileCache('predict', path=tmp_dir, max_size=2, index_refresh_interval=0)
+
+            cache_b.set('b', 1)
+            cache_a.set('first', 1)
+            for i in range(8):
+                time.sleep(0.01)
+                cache_b.set(str(i), 1)
+
+            assert cache_a.get('first') is None
+
+    def test_tiered(self):
+        storage = FileCache('predict_tiered', max_size=2)
+        cache = TieredCache('predict_tiered', storage, max_size=2)
+
+        self.cache_test(cache)
+
+        # value from L2 is copied to L1
+        cache.set('key', [1, 2])
+        cache.memory.delete('key')
+        assert cache.get('key') == [1, 2]
+        assert cache.get('key') == [1, 2]
+        stats = cache.get_stats()
+        assert stats['memory_hits'] >= 1
+        assert stats['evictions'] > 0
+
+    def test_memory_budget(self):
+        cache = MemoryCache('predict', max_size=100, max_bytes=1000, ttl=0.1)
+
+        cache.set_raw('a', b'a' * 400)
+        cache.set_raw('b', b'b' * 400)
+        assert cache.get_raw('a') is not None
+        cache.set_raw('c', b'c' * 400)
+
+        # the least recently used is evicted
+        assert cache.get_raw('b') is None
+        assert cache.get_raw('a') is not None
+        assert cache.total_bytes == 800
+        assert cache.evictions == 1
+
+        # bigger than budget
+        cache.set_raw('d', b'd' * 2000)
+        assert cache.get_raw('d') is None
+
+        # expired
+        time.sleep(0.2)
+        assert cache.get_raw('a') is None
+
+    def test_rows(self):
+        cache = RowsCache(max_size=3)
+
+        df = pd.DataFrame([
+            [1, 'a', [1]],
+            [2, 'b', [2]],
+            [1, 'a', [1]],
+        ], columns=['x', 'y', 'z'])
+        hashes = dataframe_rows_checksums(df)
+        assert hashes[0] == hashes[2]
+        assert hashes[0] != hashes[1]
+
+        assert cache.get_many('model', hashes) == [None, None, None]
+        cache.set_many('model', hashes[:2], ['pred_a', 'pred_b'])
+        assert cache.get_many('model', hashes) == ['pred_a', 'pred_b', 'pred_a']
+        assert cache.get_many('other_model', hashes) == [None, None, None]
+
+        # values of different types
+        df_types = pd.DataFrame({'x': [1, '1', 1.0, True, 1]})
+        hashes_types = dataframe_rows_checksums(df_types)
+        assert len(set(hashes_types)) == 4
+        assert hashes_types[0] == hashes_types[4]
+
+        # changed row
+        df.loc[1, 'y'] = 'c'
+        assert cache.get_many('model', dataframe_rows_checksums(df)) == ['pred_a', None, 'pred_a']
+
+        # oldest is removed
+        cache.set_many('model', [10, 11], ['pred_10', 'pred_11'])
+        assert len(cache) == 3
+        assert cache.get_many('model', hashes) == ['pred_a', None, 'pred_a']
+
     def cache_test(self, cache):
 
         # test save
@@ -209,6 +209,86 @@ class Test(BaseExecutorTestMockModel):
         assert ret_df.t.min() == dt.datetime(2020, 1, 2)
         assert ret_df.t.max() == dt.datetime(2020, 1, 3)
 
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_ts_predictor_many_groups(self, mock_handler):
+        df = pd.DataFrame([
+            {'a': i * 10 + day, 't': dt.datetime(2020, 1, day), 'g': g}
+            for i, g in enumerate(['x', 'y', 'z'])
+            for day in (1, 2, 3)
+        ])
+        self.set_handler(mock_handler, name='pg', tables={'tasks': df})
+
+        predictor = {
+            'name': 'task_model',
+            'predict': 'a',
+            'problem_definition': {
+                'timeseries_settings': {
+                    'is_timeseries': True,
+                    'window': 2,
+                    'order_by': 't',
+                    'group_by': 'g',
+                    'horizon': 3
+                }
+            },
+            'dtypes': {
+                'a': dtype.integer,
+                't': dtype.date,
+                'g': dtype.categorical,
+            },
+            'predicted_value': ''
+        }
+        self.set_predictor(predictor)
+        self.set_project({'name': 'mindsdb'})
+
+        predict_data = []
+
+        def predict_f(data, *args, **kwargs):
+            predict_data.append(data)
+            return data
+
+        self.mock_predict.side_effect = predict_f
+
+        ret = self.command_executor.execute_command(parse_sql('''
+                select p.* from pg.tasks t
+                join mindsdb.task_model p
+                where t.t > '2020-01-02'
+            ''', dialect='mindsdb'))
+        assert ret.error_code is None
+
+        queries = [
+            call[0][0].to_string()
+            for call in mock_handler().query.call_args_list
+        ]
+        # groups + window for every group (it is limited) + data of all groups in one query
+        assert len(queries) == 5
+        # queries are executed concurrently, the order is not fixed
+        batch_queries = [query for query in queries if "g IN ('x', 'y', 'z')" in query]
+        assert len(batch_queries) == 1
+        assert '__mindsdb_var_0' in batch_queries[0]
+
+        # data is ordered by groups, window is ordered by time desc
+        input_df = predict_data[0]
+        assert list(input_df['g']) == ['x', 'x', 'x', 'y', 'y', 'y', 'z', 'z', 'z']
+        assert list(input_df['a']) == [2, 1, 3, 12, 11, 13, 22, 21, 23]
+
+    def test_split_vars_groups(self):
+        from mindsdb.api.mysql.mysql_proxy.classes.sql_query import split_vars_groups
+
+        # values are converted to type of column
+        values = {'a': pd.Series([5, 6, 5]), 'b': pd.Series(['X', 'y', 'x '])}
+        groups = [{'a': '5', 'b': 'x'}, {'a': 6, 'b': 'Y'}]
+        assert split_vars_groups(values, groups) == [[0, 2], [1]]
+
+        dates = pd.Series(pd.to_datetime(['2020-01-01', '2020-01-02']))
+        groups = [{'d': '2020-01-02'}, {'d': dt.date(2020, 1, 1)}]
+        assert split_vars_groups({'d': dates}, groups) == [[1], [0]]
+
+        # groups are the same for case insensitive collation
+        assert split_vars_groups(values, [{'a': 5, 'b': 'x'}, {'a': 5, 'b': 'X'}]) is None
+
+        # row doesn't match any group
+        assert split_vars_groups(values, [{'a': 5, 'b': 'x'}]) is None
+
     def test_ts_predictor_file(self):
         # set integration data
 
@@ -361,6 +441,41 @@ class TestComplexQueries(BaseExecutorTestMockModel):
         assert list(ret_df.columns) == ['a1', 'target']
         assert ret_df.shape[0] == 3
 
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_join_integrations(self, mock_handler):
+        df2 = pd.DataFrame([
+            {'id': 1, 'name': 'one'},
+            {'id': 2, 'name': 'two'},
+            {'id': 3, 'name': 'three'},
+        ])
+        tables = {'tasks': self.df, 'users': df2}
+        self.set_handler(mock_handler, name='pg', tables=tables)
+        self.set_handler(mock_handler, name='pg2', tables=tables)
+        self.set_project({'name': 'mindsdb'})
+
+        sql = '''
+            SELECT t.b, u.name, u.id
+              FROM pg.tasks as t
+              {join} pg2.users as u on t.a = u.id and t.b != 'bbb'
+        '''
+        ret = self.command_executor.execute_command(
+            parse_sql(sql.format(join='JOIN'), dialect='mindsdb'))
+        assert ret.error_code is None
+
+        ret_df = self.ret_to_df(ret)
+        assert list(ret_df.columns) == ['b', 'name', 'id']
+        assert sorted(ret_df['b']) == ['aaa', 'ccc']
+        assert list(ret_df['name']) == ['one', 'one']
+
+        # not matched rows of right table
+        ret = self.command_executor.execute_command(
+            parse_sql(sql.format(join='RIGHT JOIN'), dialect='mindsdb'))
+        assert ret.error_code is None
+
+        ret_df = self.ret_to_df(ret)
+        assert ret_df.shape[0] == 4
+        assert sorted(ret_df['id']) == [1, 1, 2, 3]
+
     @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
     def test_update_from_select(self, mock_handler):
         self.set_handler(mock_handler, name='pg', tables={'tasks': self.df})
@@ -397,6 +512,44 @@ class TestComplexQueries(BaseExecutorTestMockModel):
         # second is update
         assert mock_handler().query.call_args_list[1][0][0].to_string() == "update table2 set a1=1, c1='ccc' where (a1 = 1) AND (b1 = 'ccc')"
 
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_update_from_select_bulk(self, mock_handler):
+        from mindsdb.integrations.libs.base import DatabaseHandler
+        from mindsdb.integrations.libs.response import HandlerResponse as Response, RESPONSE_TYPE
+
+        self.set_handler(mock_handler, name='pg', tables={'tasks': self.df})
+        mock_handler().supports_query_many = True
+        mock_handler().query_many.return_value = Response(RESPONSE_TYPE.OK)
+
+        self.set_predictor(self.task_predictor)
+        self.set_project({'name': 'mindsdb'})
+        sql = '''
+            update pg.table2
+            set a1 = df.a, c1 = df.c
+            from (
+                SELECT model.a as a, model.b as b, model.p as c
+                  FROM pg.tasks as t
+                  JOIN mindsdb.task_model as model
+                 WHERE t.a=1
+            ) as df
+            where table2.a1 = df.a and table2.b1 like '%x' and table2.b1 = df.b
+        '''
+
+        ret = self.command_executor.execute_command(parse_sql(sql, dialect='mindsdb'))
+        assert ret.error_code is None
+
+        # only select is executed row by row
+        assert mock_handler().query.call_count == 1
+        assert mock_handler().query_many.call_count == 1
+
+        query, params = mock_handler().query_many.call_args[0]
+        assert params == [{'a': 1, 'b': 'aaa', 'c': 'ccc'}, {'a': 1, 'b': 'ccc', 'c': 'ccc'}]
+
+        query_str = DatabaseHandler.render_pyformat(SqlalchemyRender('postgres'), query)
+        assert query_str.replace('\n', '') == (
+            "UPDATE table2 SET a1=%(a)s, c1=%(c)s WHERE a1 = %(a)s AND b1 LIKE '%%x' AND b1 = %(b)s"
+        )
+
     @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
     def test_create_table(self, mock_handler):
         self.set_handler(mock_handler, name='pg', tables={'tasks': self.df})
@@ -617,6 +770,37 @@ class TestTableau(BaseExecutorTestMockModel):
         # 3: count rows, 4: sum of 'a', 5 max of prediction
         assert ret.data[0] == [2]
 
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_information_schema_tables(self, mock_handler):
+        self.set_handler(mock_handler, name='pg', tables={'tasks': self.task_table})
+        self.set_handler(mock_handler, name='pg2', tables={'tasks': self.task_table})
+        self.set_project({'name': 'mindsdb'})
+
+        sql = "select table_schema, table_name from information_schema.tables where table_schema = 'pg'"
+        ret = self.command_executor.execute_command(parse_sql(sql, dialect='mindsdb'))
+        assert ret.error_code is None
+        assert ret.data == [['pg', 'table1']]
+        # only one integration is requested
+        assert mock_handler().get_tables.call_count == 1
+
+        # result is cached
+        self.command_executor.execute_command(parse_sql(sql, dialect='mindsdb'))
+        assert mock_handler().get_tables.call_count == 1
+
+        # and is dropped after ddl query
+        self.command_executor.execute_command(parse_sql(
+            'create table pg.table2 (select * from pg.tasks)', dialect='mindsdb'
+        ))
+        self.command_executor.execute_command(parse_sql(sql, dialect='mindsdb'))
+        assert mock_handler().get_tables.call_count == 2
+
+        ret = self.command_executor.execute_command(parse_sql(
+            "select table_schema, table_name from information_schema.tables where table_schema in ('pg', 'pg2')",
+            dialect='mindsdb'
+        ))
+        assert sorted(ret.data) == [['pg', 'table1'], ['pg2', 'table1']]
+
+
 class TestWithNativeQuery(BaseExecutorTestMockModel):
     @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
     def test_integration_native_query(self, mock_handler):
@@ -0,0 +1,64 @@
+import threading
+import datetime as dt
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+from werkzeug.serving import make_server
+
+from mindsdb.integrations.libs.response import HandlerResponse as Response, RESPONSE_TYPE
+
+
+class Handler:
+    df = pd.DataFrame({
+        'a': pd.array([1, None, 3], dtype='Int64'),
+        'b': [dt.datetime(2020, 1, 1), dt.datetime(2020, 1, 2), None],
+        'c': ['x', None, 'z'],
+    })
+
+    def __init__(self, **kwargs):
+        pass
+
+    def native_query(self, query):
+        if query == 'big':
+            df = pd.DataFrame({'a': range(200000)})
+        else:
+            df = self.df
+        return Response(RESPONSE_TYPE.TABLE, df)
+
+
+class TestHandlerService(unittest.TestCase):
+
+    def test_arrow_transport(self):
+        from mindsdb.integrations.handlers_wrapper.db_handler_wrapper import DBHandlerWrapper
+        from mindsdb.integrations.handlers_client.db_client import DBServiceClient
+
+        with patch('mindsdb.integrations.handlers_wrapper.db_handler_wrapper.define_handler', return_value=Handler):
+            wrapper = DBHandlerWrapper(name='test', type='test')
+
+        server = make_server('127.0.0.1', 0, wrapper.app, threaded=True)
+        server_thread = threading.Thread(target=server.serve_forever)
+        server_thread.start()
+        try:
+            client = DBServiceClient(
+                'test',
+                as_service=True,
+                connection_data={'host': '127.0.0.1', 'port': server.port}
+            )
+
+            response = client.native_query('select')
+            assert response.type == RESPONSE_TYPE.TABLE
+            # dtypes are kept
+            assert response.data_frame.equals(Handler.df)
+
+            response = client.native_query('big')
+            assert list(response.data_frame['a']) == list(range(200000))
+
+            # json is used if client doesn't accept arrow
+            client.headers['Accept'] = 'application/json'
+            response = client.native_query('select')
+            assert response.type == RESPONSE_TYPE.TABLE
+            assert list(response.data_frame['c']) == ['x', None, 'z']
+        finally:
+            server.shutdown()
+            server_thread.join()
@@ -0,0 +1,89 @@
+import time
+import threading
+import unittest
+from types import SimpleNamespace
+
+from mindsdb.integrations.libs.handlers_cache import HandlersCache
+
+
+class Handler:
+    def __init__(self, is_alive=True):
+        self.is_alive = is_alive
+        self.is_connected = True
+
+    def check_connection(self):
+        return SimpleNamespace(success=self.is_alive)
+
+    def disconnect(self):
+        self.is_connected = False
+
+
+class TestHandlersCache(unittest.TestCase):
+
+    @staticmethod
+    def run_in_thread(func):
+        result = []
+        thread = threading.Thread(target=lambda: result.append(func()))
+        thread.start()
+        thread.join()
+        return result[0]
+
+    def test_lru_and_invalidate(self):
+        cache = HandlersCache(max_size=2, idle_timeout=60, health_check_interval=60)
+
+        key1 = cache.make_key(None, 1, 'v1')
+        key2 = cache.make_key(None, 2, 'v1')
+        key3 = cache.make_key(None, 3, 'v1')
+        handler1 = Handler()
+        handler2 = Handler()
+
+        # handlers of finished threads are free
+        self.run_in_thread(lambda: cache.set(key1, handler1))
+        self.run_in_thread(lambda: cache.set(key2, handler2))
+        assert self.run_in_thread(lambda: cache.get(key1)) is handler1
+
+        self.run_in_thread(lambda: cache.set(key3, Handler()))
+        assert cache.get(key2) is None
+        assert handler2.is_connected is False
+        assert cache.get(key1) is handler1
+
+        # new version of integration
+        assert cache.get(cache.make_key(None, 1, 'v2')) is None
+
+        # handler of alive thread is not disconnected
+        cache.invalidate(None, 1)
+        assert cache.get(key1) is None
+        assert handler1.is_connected is True
+        assert len(cache) == 1
+
+    def test_threads(self):
+        cache = HandlersCache(max_size=10, idle_timeout=60, health_check_interval=60)
+        key = cache.make_key(None, 1, 'v1')
+
+        handler = Handler()
+        cache.set(key, handler)
+
+        # handler is in use by alive thread
+        assert self.run_in_thread(lambda: cache.get(key)) is None
+
+        # handler of finished thread is reused by new thread
+        free_handler = Handler()
+        self.run_in_thread(lambda: cache.set(key, free_handler))
+        assert cache.get(key) is handler
+        assert self.run_in_thread(lambda: cache.get(key)) is free_handler
+        assert len(cache) == 2
+
+    def test_idle_and_health_check(self):
+        cache = HandlersCache(max_size=10, idle_timeout=0.2, health_check_interval=0)
+
+        key = cache.make_key(None, 1, 'v1')
+        dead_handler = Handler(is_alive=False)
+        cache.set(key, dead_handler)
+        time.sleep(0.01)
+        assert cache.get(key) is None
+
+        idle_handler = Handler()
+        cache.set(key, idle_handler)
+        time.sleep(0.3)
+        assert cache.get(key) is None
+        assert idle_handler.is_connected is False
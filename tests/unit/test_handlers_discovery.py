@@ -0,0 +1,27 @@
+import unittest
+
+from mindsdb.interfaces.database.integrations import IntegrationController
+
+
+class TestHandlersDiscovery(unittest.TestCase):
+
+    def test_lazy_import(self):
+        controller = IntegrationController()
+
+        # metadata is available without import
+        meta = controller.handlers_static_meta['postgres']
+        assert meta['type'] == 'data'
+        assert meta['title'] == 'PostgreSQL'
+        assert meta['import']['folder'] == 'postgres_handler'
+        assert meta['import']['success'] is None
+        assert 'postgres' not in controller.handler_modules
+
+        assert controller.handlers_static_meta['files']['permanent'] is True
+
+        module = controller.get_handler_module('postgres')
+        assert module.name == 'postgres'
+        imported_meta = controller.get_handler_meta('postgres')
+        for attr in ('name', 'type', 'title', 'description', 'version'):
+            assert imported_meta[attr] == meta[attr]
+
+        assert controller.get_handler_module('not_existing_handler') is None
@@ -0,0 +1,55 @@
+import threading
+import unittest
+
+from mindsdb.integrations.handlers.huggingface_handler.huggingface_handler import PipelineRunner
+
+
+class Tokenizer:
+    def __call__(self, inputs, add_special_tokens=True):
+        return {'input_ids': [x.split() for x in inputs]}
+
+
+class Pipeline:
+    tokenizer = Tokenizer()
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, inputs, batch_size=1, **kwargs):
+        self.calls.append(list(inputs))
+        return [{'label': x.upper(), **kwargs} for x in inputs]
+
+
+class TestPipelineRunner(unittest.TestCase):
+
+    def test_length_bucketing(self):
+        pipeline = Pipeline()
+        runner = PipelineRunner(pipeline)
+
+        inputs = ['a b c', 'a', 'a b c d', 'a b']
+        result = runner(inputs, batch_size=2, max_batch_wait=0, truncation=True)
+
+        # sorted by length for pipeline, result is in original order
+        assert pipeline.calls == [['a', 'a b', 'a b c', 'a b c d']]
+        assert [x['label'] for x in result] == [x.upper() for x in inputs]
+        assert result[0]['truncation'] is True
+
+    def test_micro_batching(self):
+        pipeline = Pipeline()
+        runner = PipelineRunner(pipeline)
+
+        results = {}
+
+        def predict(i):
+            results[i] = runner([f'text {i}'], max_batch_wait=0.2)
+
+        threads = [threading.Thread(target=predict, args=(i,)) for i in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # concurrent calls are joined
+        assert len(pipeline.calls) < 5
+        for i in range(5):
+            assert results[i] == [{'label': f'TEXT {i}'}]
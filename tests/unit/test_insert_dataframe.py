@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+from mindsdb_sql.parser.ast import Identifier
+
+from mindsdb.integrations.libs.base import DatabaseHandler, dataframe_to_records
+from mindsdb.integrations.libs.response import HandlerResponse as Response, RESPONSE_TYPE
+
+
+class TestInsertDataframe(unittest.TestCase):
+
+    df = pd.DataFrame({
+        'a': pd.array([1, None, 3, 4, 5], dtype='Int64'),
+        'b': [1.5, np.nan, 3.5, 4.5, 5.5],
+        'c': ['x', None, 'z', 'y', 'w'],
+    })
+
+    def test_records(self):
+        chunks = list(dataframe_to_records(self.df, chunk_size=2))
+        assert [len(x) for x in chunks] == [2, 2, 1]
+        assert chunks[0] == [[1, 1.5, 'x'], [None, None, None]]
+        assert type(chunks[0][0][0]) is int
+
+    def test_default_by_chunks(self):
+        queries = []
+
+        class Handler(DatabaseHandler):
+            def query(self, query):
+                queries.append(query)
+                return Response(RESPONSE_TYPE.OK)
+
+        result = Handler('test').insert_dataframe(Identifier('t1'), self.df, chunk_size=2)
+        assert result.type == RESPONSE_TYPE.OK
+        assert len(queries) == 3
+        assert queries[2].to_string() == "INSERT INTO t1(a, b, c) VALUES (5, 5.5, 'w')"
+
+    def test_sqlite(self):
+        from mindsdb.integrations.handlers.sqlite_handler.sqlite_handler import SQLiteHandler
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            handler = SQLiteHandler('test', {'db_file': os.path.join(tmp_dir, 'test.db')})
+            handler.native_query('create table t1 (a integer, b float, c text)')
+
+            result = handler.insert_dataframe(Identifier('t1'), self.df, chunk_size=2)
+            assert result.type == RESPONSE_TYPE.OK
+
+            ret = handler.native_query('select * from t1')
+            assert ret.data_frame.shape == (5, 3)
+            assert list(ret.data_frame['c']) == ['x', None, 'z', 'y', 'w']
+
+            # wrong column
+            result = handler.insert_dataframe(Identifier('t1'), pd.DataFrame({'d': [1]}))
+            assert result.type == RESPONSE_TYPE.ERROR
+
+    def test_mysql_split_by_size(self):
+        from mindsdb.integrations.handlers.mysql_handler.mysql_handler import split_records_by_size
+
+        records = [[1, 'x' * 10], [2, None], [3, 'y' * 100], [4, 'z']]
+
+        batches = list(split_records_by_size(records, 60))
+        # a row longer than limit is sent alone
+        assert batches == [records[:2], [records[2]], [records[3]]]
+
+        assert list(split_records_by_size(records, 10 ** 6)) == [records]
@@ -0,0 +1,78 @@
+import logging
+import unittest
+
+from mindsdb.utilities.log import DbHandler, initialize_log
+
+
+class MemoryDbHandler(DbHandler):
+    def __init__(self, *args, **kwargs):
+        self.batches = []
+        super().__init__(*args, **kwargs)
+
+    def _write(self, rows):
+        self.batches.append(rows)
+
+
+class TestDbHandler(unittest.TestCase):
+
+    def get_logger(self, handler):
+        logger = logging.getLogger('test_db_handler')
+        logger.propagate = False
+        logger.handlers = [handler]
+        logger.setLevel(logging.INFO)
+        return logger
+
+    def test_batches(self):
+        handler = MemoryDbHandler(batch_size=5, flush_interval=0.1, sample_limit=100)
+        logger = self.get_logger(handler)
+
+        for i in range(12):
+            logger.info(f'message {i}')
+        logger.warning('warning')
+        handler.close()
+
+        rows = [row for batch in handler.batches for row in batch]
+        assert max(len(batch) for batch in handler.batches) <= 5
+        assert [row['payload'] for row in rows if row['log_type'] == 'INFO'] == [f'message {i}' for i in range(12)]
+        assert [row['log_type'] for row in rows[-2:]] == ['traceback', 'WARNING']
+
+    def test_sampling_and_overflow(self):
+        handler = MemoryDbHandler(batch_size=100, flush_interval=0.1, sample_limit=3)
+        logger = self.get_logger(handler)
+
+        for _ in range(10):
+            logger.info('same message')
+        handler.close()
+
+        rows = [row for batch in handler.batches for row in batch]
+        assert len(rows) == 3
+        assert handler.suppressed == 7
+
+        handler = MemoryDbHandler(queue_size=2, sample_limit=100)
+        # writer is stopped, queue is not drained
+        handler._stop_event.set()
+        handler._writer.join()
+        logger = self.get_logger(handler)
+        for i in range(5):
+            logger.info(f'message {i}')
+        assert handler.dropped == 3
+
+    def test_initialize(self):
+        config = {
+            'log': {
+                'level': {'console': 'INFO', 'file': 'INFO', 'db': 'WARNING'},
+                'db_sink': {'enabled': True}
+            }
+        }
+        logger = initialize_log(config, 'test_db_sink')
+        handlers = [h for h in logger.handlers if isinstance(h, DbHandler)]
+        assert len(handlers) == 1
+        assert handlers[0].level == logging.WARNING
+        for handler in handlers:
+            logger.removeHandler(handler)
+            handler.close()
+
+        # disabled by default
+        del config['log']['db_sink']
+        logger = initialize_log(config, 'test_db_sink_disabled')
+        assert not any(isinstance(h, DbHandler) for h in logger.handlers)
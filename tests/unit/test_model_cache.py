@@ -0,0 +1,64 @@
+import unittest
+
+from mindsdb.integrations.libs.model_cache import ModelCache
+
+
+class TestModelCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = ModelCache(max_size=100, min_entry_size=0)
+
+        cache.set((1, 'v1'), 'model1', size=40)
+        cache.set((2, 'v1'), 'model2', size=40)
+
+        # use first model, second becomes the oldest
+        assert cache.get((1, 'v1')) == 'model1'
+
+        cache.set((3, 'v1'), 'model3', size=40)
+
+        assert cache.get((2, 'v1')) is None
+        assert cache.get((1, 'v1')) == 'model1'
+        assert cache.get((3, 'v1')) == 'model3'
+        assert cache.total_size == 80
+
+        # bigger than budget: is not cached
+        cache.set((4, 'v1'), 'model4', size=200)
+        assert cache.get((4, 'v1')) is None
+        assert len(cache) == 2
+
+    def test_invalidate(self):
+        cache = ModelCache(max_size=100, min_entry_size=0)
+
+        cache.set((1, 'v1'), 'model1', size=10)
+        cache.set((1, 'v2'), 'model1_2', size=10)
+        cache.set((2, 'v1'), 'model2', size=10)
+
+        cache.invalidate(1)
+
+        assert cache.get((1, 'v1')) is None
+        assert cache.get((1, 'v2')) is None
+        assert cache.get((2, 'v1')) == 'model2'
+        assert cache.total_size == 10
+
+    def test_checkout(self):
+        cache = ModelCache(max_size=100, min_entry_size=0)
+
+        cache.set((1, 'v1'), 'model1', size=10)
+
+        # is not available for concurrent usage
+        assert cache.checkout((1, 'v1')) == ('model1', 10)
+        assert cache.checkout((1, 'v1')) is None
+        assert cache.total_size == 0
+
+        # is returned after usage
+        cache.set((1, 'v1'), 'model1', size=10)
+        assert cache.get((1, 'v1')) == 'model1'
+
+    def test_min_entry_size(self):
+        cache = ModelCache(max_size=100, min_entry_size=30)
+
+        for i in range(5):
+            cache.set((i, 'v1'), f'model{i}', size=0)
+
+        assert len(cache) == 3
+        assert cache.total_size == 90
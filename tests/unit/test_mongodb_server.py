@@ -90,6 +90,27 @@ class TestMongoDBServer(BaseUnitTest):
         '''
         assert parse_sql(expected_sql, 'mindsdb').to_string() == ast.to_string()
 
+    def t_cursor(self, client_con, mock_executor):
+        # ==== test batches ===
+        mock_executor.side_effect = lambda x: ExecuteAnswer(
+            ANSWER_TYPE.TABLE,
+            columns=[Column('a')],
+            data=[[i] for i in range(250)]
+        )
+
+        # first batch is 101 by default, then getMore
+        res = list(client_con.mindsdb.fish_model1.find({}))
+        assert res == [{'a': i} for i in range(250)]
+
+        res = list(client_con.mindsdb.fish_model1.find({}, batch_size=100))
+        assert res == [{'a': i} for i in range(250)]
+        assert mock_executor.call_count == 2
+
+        # killCursors
+        cursor = client_con.mindsdb.fish_model1.find({}, batch_size=10)
+        assert next(cursor) == {'a': 0}
+        cursor.close()
+
     def t_single_join(self, client_con, mock_executor):
         # ==== test join ===
 
@@ -189,3 +210,38 @@ class TestMongoDBServer(BaseUnitTest):
         '''
         assert parse_sql(expected_sql, 'mindsdb').to_string() == ast.to_string()
 
+
+
+class TestCursorsRegistry(unittest.TestCase):
+
+    def test_batches(self):
+        from mindsdb.api.mongo.classes import CursorsRegistry
+
+        registry = CursorsRegistry(timeout=60)
+        documents = ({'a': i} for i in range(25))
+
+        cursor = registry.open('mindsdb.t', documents, company_id=1, batch_size=10)
+        assert cursor['firstBatch'] == [{'a': i} for i in range(10)]
+        cursor_id = cursor['id']
+        assert cursor_id != 0 and len(registry) == 1
+
+        # cursor of other company
+        assert registry.get_more(cursor_id, company_id=2) is None
+
+        cursor = registry.get_more(cursor_id, company_id=1, batch_size=10)
+        assert cursor['id'] == cursor_id
+        assert cursor['nextBatch'] == [{'a': i} for i in range(10, 20)]
+
+        # the last batch closes cursor
+        cursor = registry.get_more(cursor_id, company_id=1, batch_size=5)
+        assert cursor['id'] == 0
+        assert cursor['nextBatch'] == [{'a': i} for i in range(20, 25)]
+        assert len(registry) == 0
+
+        # result fits into first batch
+        cursor = registry.open('mindsdb.t', [{'a': 1}], company_id=1)
+        assert cursor['id'] == 0
+
+        cursor = registry.open('mindsdb.t', [{'a': 1}, {'a': 2}], company_id=1, batch_size=1)
+        assert registry.kill([cursor['id'], 123], company_id=1) == ([cursor['id']], [123])
+        assert len(registry) == 0
@@ -0,0 +1,219 @@
+import datetime as dt
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from mindsdb.api.mysql.mysql_proxy.data_types.mysql_packets.resultset_row_package import (
+    ResultsetRowPacket,
+    encode_text_rows
+)
+from mindsdb.api.mysql.mysql_proxy.data_types.mysql_packets.binary_resultset_row_package import (
+    BinaryResultsetRowPacket,
+    encode_binary_rows
+)
+from mindsdb.api.mysql.mysql_proxy.data_types.mysql_compressed_socket import CompressedSocket
+from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import TYPES
+from mindsdb.api.mysql.mysql_proxy.mysql_proxy import get_columns_data
+
+
+class Session:
+    packet_sequence_number = 0
+
+
+class TestResultsetRowEncoder(unittest.TestCase):
+
+    def get_rows(self):
+        return [
+            [1, 'a', 1.5, None, dt.datetime(2020, 1, 1), True],
+            [None, 'x' * 300, 1 / 3, 'z' * 70000, dt.date(2021, 2, 3), False],
+            [-5, '', 0.0, 'текст', None, None],
+        ]
+
+    def encode_by_rows(self, rows, seq=0):
+        result = b''
+        for row in rows:
+            session = Session()
+            session.packet_sequence_number = seq
+            result += ResultsetRowPacket(data=row, session=session).get_packet_string()
+            seq = (seq + 1) % 256
+        return result
+
+    def test_equal_to_row_packets(self):
+        rows = self.get_rows()
+        columns = list(zip(*rows))
+
+        buffer, seq = encode_text_rows(columns, seq=3)
+
+        assert bytes(buffer) == self.encode_by_rows(rows, seq=3)
+        assert seq == 6
+
+    def test_dataframe(self):
+        rows = self.get_rows()
+        df = pd.DataFrame(rows, dtype=object)
+
+        buffer, _ = encode_text_rows(df)
+
+        assert bytes(buffer) == self.encode_by_rows(rows)
+
+    def test_bytes(self):
+        buffer, _ = encode_text_rows([[b'bytes', b'', None]])
+
+        assert bytes(buffer) == (
+            b'\x06\x00\x00\x00\x05bytes'
+            b'\x01\x00\x00\x01\x00'
+            b'\x01\x00\x00\x02\xfb'
+        )
+
+    def test_sequence_overflow(self):
+        rows = [[i] for i in range(300)]
+
+        buffer, seq = encode_text_rows(list(zip(*rows)), seq=250)
+
+        assert bytes(buffer) == self.encode_by_rows(rows, seq=250)
+        assert seq == (250 + 300) % 256
+
+    def test_columns_data(self):
+        rows = self.get_rows()
+        df = pd.DataFrame(rows, dtype=object)
+
+        for start, stop in ((0, 3), (1, 2), (2, 10)):
+            columns = get_columns_data(df, start, stop)
+            assert columns == [list(column) for column in get_columns_data(rows, start, stop)]
+
+        buffer, _ = encode_text_rows(get_columns_data(df, 0, 3))
+        assert bytes(buffer) == self.encode_by_rows(rows)
+
+
+class TestBinaryResultsetRowEncoder(unittest.TestCase):
+
+    def test_equal_to_row_packets(self):
+        columns = [
+            {'type': TYPES.MYSQL_TYPE_LONG},
+            {'type': TYPES.MYSQL_TYPE_DOUBLE},
+            {'type': TYPES.MYSQL_TYPE_VAR_STRING},
+            {'type': TYPES.MYSQL_TYPE_DATETIME},
+            {'type': TYPES.MYSQL_TYPE_DATE},
+            {'type': TYPES.MYSQL_TYPE_LONGLONG},
+            {'type': TYPES.MYSQL_TYPE_FLOAT},
+            {'type': TYPES.MYSQL_TYPE_VAR_STRING},
+            {'type': TYPES.MYSQL_TYPE_YEAR},
+        ]
+        rows = [
+            [1, 1.5, 'a', pd.Timestamp('2020-01-02 03:04:05.123'), '2020-01-02', 2 ** 40, 0.5, None, 2020],
+            [None, None, None, None, None, None, None, None, None],
+            ['7', '2.5', 'x' * 300, pd.Timestamp('1999-12-31'), '1999-12-31', 5.7, None, 'b', '1999'],
+        ]
+
+        buffer, seq = encode_binary_rows(list(zip(*rows)), columns, seq=1)
+
+        expected = b''
+        for i, row in enumerate(rows):
+            session = Session()
+            session.packet_sequence_number = i + 1
+            expected += BinaryResultsetRowPacket(data=row, columns=columns, session=session).get_packet_string()
+
+        assert bytes(buffer) == expected
+        assert seq == 4
+
+    def test_dates_range(self):
+        # out of range of pandas.Timestamp
+        columns = [
+            {'type': TYPES.MYSQL_TYPE_DATE},
+            {'type': TYPES.MYSQL_TYPE_DATETIME},
+        ]
+        data = [
+            [dt.date(1, 1, 1), '9999-12-31'],
+            ['0001-01-01', dt.datetime(9999, 12, 31, 23, 59, 59, 999999)],
+        ]
+
+        buffer, _ = encode_binary_rows(data, columns)
+
+        assert bytes(buffer) == (
+            b'\x13\x00\x00\x00'
+            b'\x00\x00'
+            b'\x04\x01\x00\x01\x01'
+            b'\x0b\x01\x00\x01\x01\x00\x00\x00\x00\x00\x00\x00'
+            b'\x13\x00\x00\x01'
+            b'\x00\x00'
+            b'\x04\x0f\x27\x0c\x1f'
+            b'\x0b\x0f\x27\x0c\x1f\x17\x3b\x3b\x3f\x42\x0f\x00'
+        )
+
+    def test_numeric_nulls(self):
+        columns = [
+            {'type': TYPES.MYSQL_TYPE_LONGLONG},
+            {'type': TYPES.MYSQL_TYPE_LONG},
+            {'type': TYPES.MYSQL_TYPE_DOUBLE},
+        ]
+        data = [
+            [float('nan'), 1],
+            [2, pd.NA],
+            [np.nan, 1.5],
+        ]
+
+        buffer, _ = encode_binary_rows(data, columns)
+
+        rows = [[None, 2, None], [1, None, 1.5]]
+        expected = b''
+        for i, row in enumerate(rows):
+            session = Session()
+            session.packet_sequence_number = i
+            expected += BinaryResultsetRowPacket(data=row, columns=columns, session=session).get_packet_string()
+        assert bytes(buffer) == expected
+
+    def test_numeric_overflow(self):
+        for col_type, value in (
+            (TYPES.MYSQL_TYPE_LONG, 2 ** 31),
+            (TYPES.MYSQL_TYPE_LONG, -2 ** 31 - 1.0),
+            (TYPES.MYSQL_TYPE_LONGLONG, 2 ** 63),
+            (TYPES.MYSQL_TYPE_LONGLONG, float(2 ** 63)),
+            (TYPES.MYSQL_TYPE_LONGLONG, float('inf')),
+            (TYPES.MYSQL_TYPE_YEAR, 40000),
+            (TYPES.MYSQL_TYPE_FLOAT, 1e39),
+        ):
+            with self.assertRaises(Exception):
+                encode_binary_rows([[value]], [{'type': col_type}])
+
+        # bounds
+        encode_binary_rows([[2 ** 31 - 1, -2 ** 31]], [{'type': TYPES.MYSQL_TYPE_LONG}])
+
+    def test_wrong_date(self):
+        with self.assertRaises(Exception):
+            encode_binary_rows([['2020-13-45']], [{'type': TYPES.MYSQL_TYPE_DATE}])
+
+
+class TestCompressedSocket(unittest.TestCase):
+
+    class Socket:
+        def __init__(self):
+            self.data = b''
+
+        def sendall(self, data):
+            self.data += data
+
+        def recv(self, size):
+            data, self.data = self.data[:size], self.data[size:]
+            return data
+
+    def test_send_recv(self):
+        raw_socket = self.Socket()
+        sender = CompressedSocket(raw_socket, min_length=50)
+
+        short_payload = b'\x01\x00\x00\x00\x01'
+        long_payload = b'\xff\xff\x00\x01' + b'a' * 0xffff
+        sender.sendall(short_payload)
+        sender.sendall(long_payload)
+
+        # short payload is not compressed: uncompressed length is 0
+        assert raw_socket.data[:7] == b'\x05\x00\x00\x00\x00\x00\x00'
+        assert raw_socket.data[7:12] == short_payload
+        # long is compressed
+        assert len(raw_socket.data) < len(long_payload)
+        assert raw_socket.data[16:19] == len(long_payload).to_bytes(3, 'little')
+
+        receiver = CompressedSocket(raw_socket)
+        assert receiver.recv(3) == short_payload[:3]
+        assert receiver.recv(2) == short_payload[3:]
+        assert receiver.recv(len(long_payload)) == long_payload
+        assert receiver.seq == 2
@@ -0,0 +1,140 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+import pandas as pd
+from mindsdb_sql import parse_sql
+from mindsdb_sql.planner import query_planner
+
+from mindsdb.api.mysql.mysql_proxy.classes.sql_query import get_fetch_limits
+from mindsdb.api.mysql.mysql_proxy.datahub.datanodes.integration_datanode import IntegrationDataNode
+from mindsdb.integrations.libs.base import DatabaseHandler
+from mindsdb.integrations.libs.response import HandlerResponse as Response, RESPONSE_TYPE
+
+
+class TestQueryStream(unittest.TestCase):
+
+    def test_default_adapter(self):
+        class Handler(DatabaseHandler):
+            def native_query(self, query):
+                if query == 'select':
+                    return Response(RESPONSE_TYPE.TABLE, pd.DataFrame({'a': range(5)}))
+                if query == 'empty':
+                    return Response(RESPONSE_TYPE.TABLE, pd.DataFrame([], columns=['a']))
+                if query == 'update':
+                    return Response(RESPONSE_TYPE.OK)
+                return Response(RESPONSE_TYPE.ERROR, error_message='wrong query')
+
+        handler = Handler('test')
+
+        chunks = list(handler.native_query_stream('select', chunk_size=2))
+        assert [list(df['a']) for df in chunks] == [[0, 1], [2, 3], [4]]
+
+        # columns are passed
+        chunks = list(handler.native_query_stream('empty'))
+        assert len(chunks) == 1
+        assert list(chunks[0].columns) == ['a']
+
+        assert list(handler.native_query_stream('update')) == []
+
+        with self.assertRaises(Exception):
+            list(handler.native_query_stream('wrong'))
+
+    def test_sqlite(self):
+        from mindsdb.integrations.handlers.sqlite_handler.sqlite_handler import SQLiteHandler
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            handler = SQLiteHandler('test', {'db_file': os.path.join(tmp_dir, 'test.db')})
+            assert handler.supports_stream is True
+            handler.native_query('create table t1 (a integer)')
+            handler.native_query('insert into t1 values (1), (2), (3), (4)')
+
+            query = parse_sql('select a from t1 order by a', dialect='mindsdb')
+            chunks = list(handler.query_stream(query, chunk_size=2))
+            assert [list(df['a']) for df in chunks] == [[1, 2], [3, 4]]
+
+            # reading is stopped after first chunk
+            stream = handler.native_query_stream('select a from t1', chunk_size=3)
+            assert len(next(stream)) == 3
+            stream.close()
+            assert handler.is_connected is False
+
+            chunks = list(handler.native_query_stream('select a from t1 where a > 10'))
+            assert len(chunks) == 1
+            assert list(chunks[0].columns) == ['a']
+
+            with self.assertRaises(Exception):
+                list(handler.native_query_stream('select b from t1'))
+
+    def test_datanode_limit(self):
+        from mindsdb.integrations.handlers.sqlite_handler.sqlite_handler import SQLiteHandler
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            handler = SQLiteHandler('test', {'db_file': os.path.join(tmp_dir, 'test.db')})
+            handler.native_query('create table t1 (a integer)')
+            handler.native_query('insert into t1 values (1), (2), (3), (4)')
+
+            chunks_sizes = []
+            native_query_stream = handler.native_query_stream
+
+            def query_stream(query, chunk_size=None):
+                for df in native_query_stream(query, chunk_size):
+                    chunks_sizes.append(len(df))
+                    yield df
+
+            handler.native_query_stream = query_stream
+
+            integration_controller = MagicMock()
+            integration_controller.get_handler.return_value = handler
+            dn = IntegrationDataNode('test', 'sqlite', integration_controller)
+
+            # only first chunk is read
+            df, columns_info = dn.query(native_query='select a from t1 order by a', limit=2)
+            assert list(df['a']) == [1, 2]
+            assert chunks_sizes == [2]
+            assert columns_info[0]['name'] == 'a'
+
+            df, _ = dn.query(native_query='select a from t1 order by a limit 1', limit=2)
+            assert list(df['a']) == [1]
+
+            # without limit native query is not streamed
+            chunks_sizes.clear()
+            df, _ = dn.query(native_query='select a from t1')
+            assert len(df) == 4
+            assert chunks_sizes == []
+
+    def test_datanode_chunks_columns(self):
+        # documents with optional fields: chunks have different columns
+        handler = MagicMock()
+        handler.supports_stream = True
+        handler.native_query_stream.return_value = (
+            df for df in [
+                pd.DataFrame([{'a': 1}]),
+                pd.DataFrame([{'a': 2, 'b': 'x'}]),
+            ]
+        )
+
+        integration_controller = MagicMock()
+        integration_controller.get_handler.return_value = handler
+        dn = IntegrationDataNode('test', 'mongodb', integration_controller)
+
+        df, _ = dn.query(native_query='db.t1.find()', limit=10)
+        assert df.to_dict('records') == [{'a': 1, 'b': None}, {'a': 2, 'b': 'x'}]
+
+    def test_fetch_limits(self):
+        def get_limits(sql):
+            planner = query_planner.QueryPlanner(
+                parse_sql(sql, dialect='mindsdb'),
+                integrations=['pg', 'pg2'],
+                predictor_namespace='mindsdb',
+                predictor_metadata={'m': {}}
+            )
+            return get_fetch_limits(planner.from_query().steps)
+
+        # native query
+        assert get_limits('select * from pg (select * from tasks) limit 5 offset 2') == {0: 7}
+        assert get_limits('select * from pg (select * from tasks) where a = 1 limit 5') == {}
+
+        # limit after join
+        assert get_limits('select * from pg.tasks t join pg2.x y on t.a = y.a limit 5') == {}
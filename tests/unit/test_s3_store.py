@@ -0,0 +1,82 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from mindsdb.interfaces.storage.fs import S3FSStore
+
+
+class S3Client:
+    """ stores objects in memory """
+    def __init__(self):
+        self.objects = {}
+        self.downloads = 0
+        self.uploads = 0
+
+    def head_object(self, Bucket, Key):
+        return {'ETag': str(hash(self.objects[Key]))}
+
+    def download_file(self, bucket, key, path, Config=None):
+        self.downloads += 1
+        with open(path, 'wb') as fd:
+            fd.write(self.objects[key])
+
+    def upload_file(self, path, bucket, key, Config=None):
+        self.uploads += 1
+        with open(path, 'rb') as fd:
+            self.objects[key] = fd.read()
+
+
+class Store(S3FSStore):
+    def __init__(self, s3):
+        self.s3 = s3
+        self.bucket = 'test'
+        self.transfer_config = None
+
+
+class TestS3FSStore(unittest.TestCase):
+
+    def test_sync(self):
+        s3 = S3Client()
+        dir_a = tempfile.mkdtemp()
+        dir_b = tempfile.mkdtemp()
+        try:
+            store_a = Store(s3)
+            store_b = Store(s3)
+            os.makedirs(os.path.join(dir_a, 'model'))
+            with open(os.path.join(dir_a, 'model', 'weights'), 'wb') as fd:
+                fd.write(b'1' * 1000)
+
+            store_a.put('model', dir_a)
+            assert s3.uploads == 1
+            # not changed files are not uploaded again
+            store_a.put('model', dir_a)
+            assert s3.uploads == 1
+            # archive made by this store isn't downloaded
+            store_a.get('model', dir_a)
+            assert s3.downloads == 0
+
+            store_b.get('model', dir_b)
+            store_b.get('model', dir_b)
+            assert s3.downloads == 1
+            with open(os.path.join(dir_b, 'model', 'weights'), 'rb') as fd:
+                assert fd.read() == b'1' * 1000
+
+            # change in other place
+            with open(os.path.join(dir_a, 'model', 'weights'), 'wb') as fd:
+                fd.write(b'2' * 1000)
+            store_a.put('model', dir_a)
+            assert s3.uploads == 2
+            store_b.get('model', dir_b)
+            assert s3.downloads == 2
+            with open(os.path.join(dir_b, 'model', 'weights'), 'rb') as fd:
+                assert fd.read() == b'2' * 1000
+
+            # local copy is modified
+            with open(os.path.join(dir_b, 'model', 'weights'), 'wb') as fd:
+                fd.write(b'3' * 1000)
+            store_b.get('model', dir_b)
+            assert s3.downloads == 3
+        finally:
+            shutil.rmtree(dir_a)
+            shutil.rmtree(dir_b)
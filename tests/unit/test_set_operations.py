@@ -0,0 +1,71 @@
+import unittest
+
+import pandas as pd
+
+from mindsdb.api.mysql.mysql_proxy.utilities.sql import DuckDBContext
+from mindsdb.api.mysql.mysql_proxy.utilities.set_operations import set_operation
+
+
+class TestSetOperations(unittest.TestCase):
+
+    left = pd.DataFrame([
+        [1, 'a'],
+        [2, 'b'],
+        [1, 'a'],
+        [None, 'c'],
+        [3, 'd'],
+        [1, 'a'],
+    ], columns=['x', 'y'])
+
+    right = pd.DataFrame([
+        [None, 'c'],
+        [1, 'a'],
+        [1, 'a'],
+        [4, 'e'],
+    ], columns=['x2', 'y2'])
+
+    @staticmethod
+    def to_list(df):
+        return [
+            [None if pd.isna(value) else value for value in row]
+            for row in df.astype(object).values.tolist()
+        ]
+
+    def test_operations(self):
+        def check(operation, distinct, expected):
+            df = set_operation(self.left, self.right, operation, distinct)
+            assert list(df.columns) == ['x', 'y']
+            assert self.to_list(df) == expected
+
+        check('union', False, self.to_list(self.left) + self.to_list(self.right))
+        check('union', True, [[1, 'a'], [2, 'b'], [None, 'c'], [3, 'd'], [4, 'e']])
+        check('intersect', True, [[1, 'a'], [None, 'c']])
+        check('intersect', False, [[1, 'a'], [1, 'a'], [None, 'c']])
+        check('except', True, [[2, 'b'], [3, 'd']])
+        check('except', False, [[2, 'b'], [3, 'd'], [1, 'a']])
+
+    def test_unhashable(self):
+        left = pd.DataFrame({'a': [[1], [1], [2]]})
+        right = pd.DataFrame({'a': [[2]]})
+
+        df = set_operation(left, right, 'union')
+        assert list(df['a']) == [[1], [2]]
+
+        df = set_operation(left, right, 'except')
+        assert list(df['a']) == [[1]]
+
+    def test_duckdb(self):
+        with DuckDBContext() as duck_context:
+            for operation in ('union', 'intersect', 'except'):
+                for distinct in (True, False):
+                    expected = set_operation(self.left, self.right, operation, distinct)
+                    df = set_operation(
+                        self.left, self.right, operation, distinct,
+                        duck_context=duck_context, duckdb_min_rows=0
+                    )
+                    assert list(df.columns) == ['x', 'y']
+                    assert sorted(map(str, self.to_list(df))) == sorted(map(str, self.to_list(expected)))
+
+    def test_columns_mismatch(self):
+        with self.assertRaises(ValueError):
+            set_operation(self.left, self.right[['x2']], 'union')